@@ -0,0 +1,4 @@
+"""Offline benchmark suite for the dataflows layer, memory and run logging.
+
+Run it with ``python -m benchmarks.run``; see benchmarks/README.md.
+"""
@@ -0,0 +1,330 @@
+"""Benchmark cases. Each case is set up once per run and returns the operation to time.
+
+A setup function receives (universe, workdir) and returns a callable taking the
+iteration index, which it uses to rotate tickers/dates so no single file stays hot.
+"""
+
+import os
+from typing import Callable, Dict
+
+CASES: Dict[str, Callable] = {}
+
+INDICATORS = ["close_50_sma", "close_10_ema", "macd", "rsi", "boll", "atr", "vwma"]
+
+# get_news is left out: its "local" vendor also scrapes Google News
+ROUTED_METHODS = [
+    ("get_stock_data", lambda u, t, d: (t, u.trading_days[-30], d)),
+    ("get_indicators", lambda u, t, d: (t, "rsi", d, 30)),
+    ("get_balance_sheet", lambda u, t, d: (t, "quarterly", d)),
+    ("get_cashflow", lambda u, t, d: (t, "quarterly", d)),
+    ("get_income_statement", lambda u, t, d: (t, "quarterly", d)),
+    ("get_insider_sentiment", lambda u, t, d: (t, d)),
+    ("get_insider_transactions", lambda u, t, d: (t, d)),
+    ("get_global_news", lambda u, t, d: (d, 7, 5)),
+]
+
+
+def bench_case(name):
+    def register(setup):
+        CASES[name] = setup
+        return setup
+
+    return register
+
+
+def _pick(universe, i, tickers=None):
+    tickers = tickers or universe.tickers
+    return tickers[i % len(tickers)], universe.news_days[-1 - (i % 20)]
+
+
+@bench_case("route_to_vendor")
+def _route_to_vendor(universe, workdir):
+    from tradingagents.dataflows.interface import route_to_vendor
+
+    def operation(i):
+        method, arguments = ROUTED_METHODS[i % len(ROUTED_METHODS)]
+        ticker, date = _pick(universe, i // len(ROUTED_METHODS))
+        return route_to_vendor(method, *arguments(universe, ticker, date))
+
+    return operation
+
+
+@bench_case("indicator_window")
+def _indicator_window(universe, workdir):
+    from tradingagents.dataflows.y_finance import get_stock_stats_indicators_window
+
+    def operation(i):
+        ticker, date = _pick(universe, i)
+        return get_stock_stats_indicators_window(ticker, INDICATORS[i % len(INDICATORS)], date, 30)
+
+    return operation
+
+
+@bench_case("stock_data_window")
+def _stock_data_window(universe, workdir):
+    from tradingagents.dataflows.local import get_YFin_data_window
+
+    def operation(i):
+        ticker, date = _pick(universe, i)
+        return get_YFin_data_window(ticker, date, 30)
+
+    return operation
+
+
+def _simfin_case(name, function_name):
+    @bench_case(name)
+    def setup(universe, workdir):
+        from tradingagents.dataflows import local
+
+        function = getattr(local, function_name)
+
+        def operation(i):
+            ticker, date = _pick(universe, i)
+            return function(ticker, "quarterly" if i % 2 else "annual", date)
+
+        return operation
+
+
+_simfin_case("simfin_balance_sheet", "get_simfin_balance_sheet")
+_simfin_case("simfin_cashflow", "get_simfin_cashflow")
+_simfin_case("simfin_income_statement", "get_simfin_income_statements")
+
+
+@bench_case("finnhub_news")
+def _finnhub_news(universe, workdir):
+    from tradingagents.dataflows.local import get_finnhub_news
+
+    def operation(i):
+        ticker, date = _pick(universe, i)
+        return get_finnhub_news(ticker, universe.news_days[-15], date)
+
+    return operation
+
+
+@bench_case("finnhub_insider")
+def _finnhub_insider(universe, workdir):
+    from tradingagents.dataflows.local import (
+        get_finnhub_company_insider_sentiment,
+        get_finnhub_company_insider_transactions,
+    )
+
+    def operation(i):
+        ticker, date = _pick(universe, i)
+        return (
+            get_finnhub_company_insider_sentiment(ticker, date),
+            get_finnhub_company_insider_transactions(ticker, date),
+        )
+
+    return operation
+
+
+@bench_case("reddit_global_news")
+def _reddit_global_news(universe, workdir):
+    from tradingagents.dataflows.local import get_reddit_global_news
+
+    def operation(i):
+        _, date = _pick(universe, i)
+        return get_reddit_global_news(date, 7, 5)
+
+    return operation
+
+
+@bench_case("reddit_company_news")
+def _reddit_company_news(universe, workdir):
+    from tradingagents.dataflows.local import get_reddit_company_news
+
+    tickers = universe.reddit_tickers
+
+    def operation(i):
+        ticker, date = _pick(universe, i, tickers)
+        return get_reddit_company_news(ticker, universe.news_days[-7], date)
+
+    return operation
+
+
+def _offline_memory(name, situations=0):
+    """FinancialSituationMemory (numpy backend) with the fake provider's hashed embeddings."""
+    from tradingagents.agents.utils.memory import FinancialSituationMemory
+    from tradingagents.default_config import DEFAULT_CONFIG
+
+    config = DEFAULT_CONFIG.copy()
+    config.update({"llm_provider": "fake", "memory_backend": "numpy", "memory_dir": None})
+    memory = FinancialSituationMemory(name, config)
+    if situations:
+        memory.add_situations(
+            [(_situation(i), f"Lesson {i}: {'hold' if i % 3 else 'reduce exposure'}") for i in range(situations)]
+        )
+    return memory
+
+
+def _situation(i):
+    words = ["rates", "earnings", "guidance", "inflation", "tariffs", "momentum", "drawdown", "rally"]
+    paragraphs = [
+        f"Market report {i}: {words[i % 8]} dominated as the index moved {i % 7 - 3}%. " * 6,
+        f"News report {i}: coverage focused on {words[(i * 3) % 8]} and {words[(i * 5) % 8]}. " * 6,
+        f"Fundamentals report {i}: margins {'expanded' if i % 2 else 'compressed'} this quarter. " * 6,
+    ]
+    return "\n\n".join(paragraphs)
+
+
+@bench_case("memory_add")
+def _memory_add(universe, workdir):
+    memory = _offline_memory("bench_memory_add")
+
+    def operation(i):
+        memory.add_situations([(_situation(i), f"Lesson {i}")])
+
+    return operation
+
+
+@bench_case("memory_query")
+def _memory_query(universe, workdir):
+    memory = _offline_memory("bench_memory_query", situations=max(50, len(universe.tickers) * 5))
+
+    def operation(i):
+        return memory.get_memories(_situation(i + 7), n_matches=2)
+
+    return operation
+
+
+def _final_state(ticker, date, i):
+    report = f"{ticker} on {date}: " + "Analysis paragraph with indicators and news. " * 80
+    return {
+        "company_of_interest": ticker,
+        "trade_date": date,
+        "market_report": report,
+        "sentiment_report": report,
+        "news_report": report,
+        "fundamentals_report": report,
+        "investment_debate_state": {
+            "bull_history": report,
+            "bear_history": report,
+            "history": report * 2,
+            "current_response": report[:500],
+            "judge_decision": "Recommendation: BUY",
+        },
+        "trader_investment_decision": "FINAL TRANSACTION PROPOSAL: **BUY**",
+        "risk_debate_state": {
+            "risky_history": report,
+            "safe_history": report,
+            "neutral_history": report,
+            "history": report * 3,
+            "judge_decision": f"Decision {i}: **{'BUY' if i % 2 else 'HOLD'}**",
+        },
+        "investment_plan": report,
+        "final_trade_decision": f"FINAL TRANSACTION PROPOSAL: **{'BUY' if i % 2 else 'HOLD'}**",
+    }
+
+
+@bench_case("run_log_append")
+def _run_log_append(universe, workdir):
+    from tradingagents.graph.run_log import RunLog
+
+    run_log = RunLog(os.path.join(workdir, "run_log_append"))
+
+    def operation(i):
+        ticker, date = _pick(universe, i)
+        run_log.append(ticker, date, _final_state(ticker, date, i))
+
+    return operation
+
+
+@bench_case("run_log_read")
+def _run_log_read(universe, workdir):
+    from tradingagents.graph.run_log import RunLog
+
+    run_log = RunLog(os.path.join(workdir, "run_log_read"))
+    for i in range(len(universe.tickers) * 10):
+        ticker, date = _pick(universe, i)
+        run_log.append(ticker, date, _final_state(ticker, date, i))
+
+    def operation(i):
+        ticker, date = _pick(universe, i)
+        return run_log.get(ticker, date)
+
+    return operation
+
+
+@bench_case("signal_extract")
+def _signal_extract(universe, workdir):
+    from tradingagents.graph.signal_processing import extract_signal
+
+    decisions = [_final_state("BENCH", "2025-01-02", i)["risk_debate_state"]["history"] + f"\n\nFINAL TRANSACTION PROPOSAL: **{signal}**" for i, signal in enumerate(("BUY", "SELL", "HOLD"))]
+
+    def operation(i):
+        return extract_signal(decisions[i % len(decisions)])
+
+    return operation
+
+
+def _graph_config(workdir):
+    from tradingagents.default_config import DEFAULT_CONFIG
+
+    config = DEFAULT_CONFIG.copy()
+    config.update(
+        {
+            "llm_provider": "fake",
+            "memory_backend": "numpy",
+            "results_dir": os.path.join(workdir, "results"),
+            "run_log_dir": os.path.join(workdir, "graph_run_log"),
+            "tracing_enabled": False,
+            "llm_cache_enabled": False,
+        }
+    )
+    return config
+
+
+@bench_case("graph_propagate")
+def _graph_propagate(universe, workdir):
+    """Whole graph with the fake LLM: the orchestration overhead of LangGraph, tools, memory and logging."""
+    from tradingagents.graph.trading_graph import TradingAgentsGraph
+
+    from benchmarks.fixtures import activate
+
+    # Only the market analyst: the local news vendor also scrapes Google News
+    graph = TradingAgentsGraph(["market"], config=_graph_config(workdir))
+    activate(universe)
+
+    def operation(i):
+        ticker, date = _pick(universe, i)
+        return graph.run_propagation(ticker, date)
+
+    return operation
+
+
+@bench_case("graph_job_fresh")
+def _graph_job_fresh(universe, workdir):
+    """One job the way a one-shot script runs it: build a graph, then propagate."""
+    from tradingagents.graph.trading_graph import TradingAgentsGraph
+
+    from benchmarks.fixtures import activate
+
+    config = _graph_config(workdir)
+
+    def operation(i):
+        graph = TradingAgentsGraph(["market"], config=config)
+        # Building a graph resets the dataflows config; point it back at the fixtures
+        activate(universe)
+        ticker, date = _pick(universe, i)
+        return graph.run_propagation(ticker, date)
+
+    return operation
+
+
+@bench_case("graph_job_pooled")
+def _graph_job_pooled(universe, workdir):
+    """The same job served by a GraphPool: the graph is built once and reused."""
+    from tradingagents.graph.pool import GraphPool
+
+    from benchmarks.fixtures import activate
+
+    config = _graph_config(workdir)
+    pool = GraphPool()
+    pool.get(["market"], config)
+    activate(universe)
+
+    def operation(i):
+        ticker, date = _pick(universe, i)
+        return pool.propagate(ticker, date, ["market"], config)
+
+    return operation
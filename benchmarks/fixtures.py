@@ -0,0 +1,251 @@
+"""Synthetic, deterministic data universes laid out the way the local vendors read them.
+
+    <root>/data/market_data/price_data/{SYM}-YFin-data-2015-01-01-2025-03-25.csv
+    <root>/data/finnhub_data/{news_data,insider_senti,insider_trans}/{SYM}_data_formatted.json
+    <root>/data/fundamental_data/simfin_data_all/{statement}/companies/us/us-{kind}-{freq}.csv
+    <root>/data/reddit_data/{global_news,company_news}/*.jsonl
+    <root>/cache/{SYM}-YFin-data-2015-01-01-2025-03-25.csv   (indicator "local" vendor)
+
+The same seed and sizes always produce byte-identical files, so results of two runs
+are comparable.
+"""
+
+import csv
+import json
+import os
+import random
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+from tradingagents.dataflows.reddit_utils import ticker_to_company
+
+PRICE_FILE = "{symbol}-YFin-data-2015-01-01-2025-03-25.csv"
+
+# Last date the local price files claim to cover (get_YFin_data rejects later end dates)
+LAST_DATE = datetime(2025, 3, 24)
+
+SIMFIN_STATEMENTS = {
+    "balance_sheet": ("balance", ["Total Assets", "Total Liabilities", "Total Equity", "Cash, Cash Equivalents & Short Term Investments"]),
+    "cash_flow": ("cashflow", ["Net Cash from Operating Activities", "Net Cash from Investing Activities", "Net Cash from Financing Activities"]),
+    "income_statements": ("income", ["Revenue", "Gross Profit", "Operating Income (Loss)", "Net Income"]),
+}
+
+# The reddit loaders require max_limit >= files per category (5 global, 10 company)
+REDDIT_SUBREDDITS = {
+    "global_news": ["worldnews", "economics", "finance"],
+    "company_news": ["stocks", "investing", "wallstreetbets", "stockmarket"],
+}
+
+_WORDS = (
+    "guidance earnings margin demand supply chain outlook upgrade downgrade revenue growth "
+    "buyback dividend regulator lawsuit product launch inflation rates tariff consumer cloud "
+    "chip AI data center shipment forecast analyst volatility momentum valuation"
+).split()
+
+
+class Universe:
+    """Paths, symbols and dates of one generated fixture universe."""
+
+    def __init__(self, root, tickers, trading_days, news_days):
+        self.root = root
+        self.data_dir = os.path.join(root, "data")
+        self.cache_dir = os.path.join(root, "cache")
+        self.tickers = tickers
+        self.trading_days = trading_days
+        self.news_days = news_days
+
+    @property
+    def reddit_tickers(self) -> List[str]:
+        """Symbols the reddit company loader can search for (it needs a company name)."""
+        return [ticker for ticker in self.tickers if ticker in ticker_to_company]
+
+    def to_dict(self):
+        return {
+            "tickers": len(self.tickers),
+            "trading_days": len(self.trading_days),
+            "news_days": len(self.news_days),
+        }
+
+
+def universe_tickers(size: int) -> List[str]:
+    """Known reddit tickers first, then synthetic SYN0000... symbols."""
+    known = list(ticker_to_company)[:size]
+    return known + [f"SYN{i:04d}" for i in range(size - len(known))]
+
+
+def build_universe(root, size=20, days=500, news_days=60, seed=0) -> Universe:
+    """Write a universe of `size` tickers with `days` trading days of prices under root.
+
+    Args:
+        root: Directory receiving the data/ and cache/ trees
+        size: Number of tickers
+        days: Trading days of price history per ticker (ending at LAST_DATE)
+        news_days: Calendar days of news, insider and reddit data (ending at LAST_DATE)
+        seed: Seed of the generator
+
+    Returns:
+        The Universe describing the generated files
+    """
+    rng = random.Random(seed)
+    universe = Universe(
+        root,
+        universe_tickers(size),
+        _trading_days(days),
+        [(LAST_DATE - timedelta(days=offset)).strftime("%Y-%m-%d") for offset in range(news_days)][::-1],
+    )
+
+    for ticker in universe.tickers:
+        _write_prices(universe, ticker, rng)
+        _write_finnhub(universe, ticker, rng)
+    _write_simfin(universe, rng)
+    _write_reddit(universe, rng)
+    return universe
+
+
+def activate(universe: Universe):
+    """Point the dataflows config (and the modules that copied DATA_DIR at import) at a universe.
+
+    All vendors are set to "local" so no benchmark touches the network.
+    """
+    from tradingagents.dataflows import config as dataflow_config
+    from tradingagents.dataflows import local, stockstats_utils
+
+    dataflow_config.set_config(
+        {
+            "data_dir": universe.data_dir,
+            "data_cache_dir": universe.cache_dir,
+            "data_vendors": {
+                "core_stock_apis": "local",
+                "technical_indicators": "local",
+                "fundamental_data": "local",
+                "news_data": "local",
+            },
+            "tool_vendors": {},
+        }
+    )
+    local.DATA_DIR = universe.data_dir
+    stockstats_utils.DATA_DIR = universe.data_dir
+
+
+def _trading_days(count):
+    days = []
+    day = LAST_DATE
+    while len(days) < count:
+        if day.weekday() < 5:
+            days.append(day.strftime("%Y-%m-%d"))
+        day -= timedelta(days=1)
+    return days[::-1]
+
+
+def _sentence(rng, words=12):
+    return " ".join(rng.choice(_WORDS) for _ in range(words)).capitalize() + "."
+
+
+def _write_prices(universe, ticker, rng):
+    rows = []
+    close = rng.uniform(20, 400)
+    for day in universe.trading_days:
+        open_ = close * (1 + rng.gauss(0, 0.01))
+        close = max(1.0, open_ * (1 + rng.gauss(0.0003, 0.02)))
+        high = max(open_, close) * (1 + abs(rng.gauss(0, 0.005)))
+        low = min(open_, close) * (1 - abs(rng.gauss(0, 0.005)))
+        rows.append(
+            [day, round(open_, 4), round(high, 4), round(low, 4), round(close, 4), round(close, 4), rng.randint(10**5, 10**8)]
+        )
+
+    header = ["Date", "Open", "High", "Low", "Close", "Adj Close", "Volume"]
+    for directory in (
+        os.path.join(universe.data_dir, "market_data", "price_data"),
+        universe.cache_dir,
+    ):
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, PRICE_FILE.format(symbol=ticker)), "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            writer.writerows(rows)
+
+
+def _write_finnhub(universe, ticker, rng):
+    news, senti, trans = {}, {}, {}
+    for day in universe.news_days:
+        news[day] = [
+            {"headline": f"{ticker}: {_sentence(rng, 8)}", "summary": _sentence(rng, 40)}
+            for _ in range(rng.randint(0, 4))
+        ]
+        year, month = day[:4], day[5:7]
+        senti[day] = [
+            {"symbol": ticker, "year": int(year), "month": int(month), "change": rng.randint(-50000, 50000), "mspr": round(rng.uniform(-100, 100), 4)}
+        ] if rng.random() < 0.2 else []
+        trans[day] = [
+            {
+                "symbol": ticker,
+                "name": f"Insider {rng.randint(1, 40)}",
+                "share": rng.randint(1000, 10**6),
+                "change": rng.randint(-20000, 20000),
+                "filingDate": day,
+                "transactionDate": day,
+                "transactionCode": rng.choice("SPMAG"),
+                "transactionPrice": round(rng.uniform(10, 500), 2),
+                "isDerivative": False,
+                "currency": "USD",
+            }
+            for _ in range(rng.randint(0, 2))
+        ]
+
+    for data_type, payload in (("news_data", news), ("insider_senti", senti), ("insider_trans", trans)):
+        directory = os.path.join(universe.data_dir, "finnhub_data", data_type)
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, f"{ticker}_data_formatted.json"), "w") as f:
+            json.dump(payload, f)
+
+
+def _write_simfin(universe, rng):
+    quarters = [(year, quarter) for year in range(2018, 2025) for quarter in range(1, 5)]
+    for statement, (kind, columns) in SIMFIN_STATEMENTS.items():
+        directory = os.path.join(
+            universe.data_dir, "fundamental_data", "simfin_data_all", statement, "companies", "us"
+        )
+        os.makedirs(directory, exist_ok=True)
+        header = ["Ticker", "SimFinId", "Currency", "Fiscal Year", "Fiscal Period", "Report Date", "Publish Date", *columns]
+        for freq in ("quarterly", "annual"):
+            periods = quarters if freq == "quarterly" else [(year, 4) for year in range(2018, 2025)]
+            with open(os.path.join(directory, f"us-{kind}-{freq}.csv"), "w", newline="") as f:
+                writer = csv.writer(f, delimiter=";")
+                writer.writerow(header)
+                for simfin_id, ticker in enumerate(universe.tickers):
+                    for year, quarter in periods:
+                        report = datetime(year, quarter * 3, 28)
+                        publish = report + timedelta(days=rng.randint(20, 45))
+                        writer.writerow(
+                            [
+                                ticker,
+                                simfin_id,
+                                "USD",
+                                year,
+                                f"Q{quarter}" if freq == "quarterly" else "FY",
+                                report.strftime("%Y-%m-%d"),
+                                publish.strftime("%Y-%m-%d"),
+                                *(rng.randint(-10**9, 10**10) for _ in columns),
+                            ]
+                        )
+
+
+def _write_reddit(universe, rng):
+    names = [ticker_to_company[ticker].split(" OR ")[0] for ticker in universe.reddit_tickers] or ["market"]
+    for category, subreddits in REDDIT_SUBREDDITS.items():
+        directory = os.path.join(universe.data_dir, "reddit_data", category)
+        os.makedirs(directory, exist_ok=True)
+        for subreddit in subreddits:
+            with open(os.path.join(directory, f"{subreddit}.jsonl"), "w") as f:
+                for day in universe.news_days:
+                    noon = datetime.strptime(day, "%Y-%m-%d").replace(hour=12, tzinfo=timezone.utc)
+                    for index in range(rng.randint(3, 8)):
+                        subject = rng.choice(names) if category == "company_news" else "Markets"
+                        post = {
+                            "created_utc": int(noon.timestamp()) + index,
+                            "title": f"{subject}: {_sentence(rng, 8)}",
+                            "selftext": _sentence(rng, 30) if rng.random() < 0.7 else "",
+                            "url": f"https://reddit.com/r/{subreddit}/{day}/{index}",
+                            "ups": rng.randint(0, 5000),
+                        }
+                        f.write(json.dumps(post) + "\n")
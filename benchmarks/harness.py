@@ -0,0 +1,181 @@
+"""Timing/memory harness and the JSON result format shared by all benchmark cases.
+
+A result file looks like:
+
+    {
+      "schema": 1,
+      "meta": {"created_at": ..., "python": ..., "platform": ..., "git_commit": ..., "universe": {...}},
+      "results": {
+        "<case>": {"iterations": 50, "p50_ms": ..., "p90_ms": ..., "p99_ms": ..., "mean_ms": ...,
+                   "min_ms": ..., "max_ms": ..., "throughput_per_s": ..., "peak_memory_kb": ...}
+      }
+    }
+
+Two files produced with the same universe parameters can be diffed with compare().
+"""
+
+import gc
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List
+
+SCHEMA_VERSION = 1
+
+# Metrics where a larger value is worse
+LOWER_IS_BETTER = ("p50_ms", "p90_ms", "p99_ms", "peak_memory_kb")
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Linear-interpolated percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = (len(sorted_values) - 1) * pct / 100.0
+    low = int(rank)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+
+def measure(operation: Callable[[int], Any], iterations: int, warmup: int = 1, memory_iterations: int = 3) -> Dict[str, float]:
+    """Time `operation(i)` for i in range(iterations) and measure its peak allocations.
+
+    Latencies are taken without tracemalloc (it slows allocation-heavy code several
+    times over); peak memory comes from a separate, shorter pass with tracemalloc on.
+
+    Args:
+        operation: Callable receiving the iteration index, so cases can rotate inputs
+        iterations: Timed calls
+        warmup: Untimed calls made first (imports, file system caches)
+        memory_iterations: Calls made under tracemalloc for the peak memory figure
+
+    Returns:
+        Latency percentiles (ms), throughput (calls/s) and peak traced memory (KiB)
+    """
+    for i in range(warmup):
+        operation(i)
+
+    gc.collect()
+    latencies = []
+    started = time.perf_counter()
+    for i in range(iterations):
+        call_started = time.perf_counter()
+        operation(i)
+        latencies.append((time.perf_counter() - call_started) * 1000.0)
+    elapsed = time.perf_counter() - started
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        for i in range(memory_iterations):
+            operation(i)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        "iterations": iterations,
+        "p50_ms": round(percentile(latencies, 50), 4),
+        "p90_ms": round(percentile(latencies, 90), 4),
+        "p99_ms": round(percentile(latencies, 99), 4),
+        "mean_ms": round(sum(latencies) / len(latencies), 4) if latencies else 0.0,
+        "min_ms": round(latencies[0], 4) if latencies else 0.0,
+        "max_ms": round(latencies[-1], 4) if latencies else 0.0,
+        "throughput_per_s": round(iterations / elapsed, 2) if elapsed > 0 else 0.0,
+        "peak_memory_kb": round(peak / 1024.0, 1),
+    }
+
+
+def run_metadata(**extra) -> Dict[str, Any]:
+    """Environment description stored next to the results."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    meta = {
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "git_commit": commit,
+    }
+    meta.update(extra)
+    return meta
+
+
+def write_results(path, meta, results):
+    document = {"schema": SCHEMA_VERSION, "meta": meta, "results": results}
+    with open(path, "w") as f:
+        json.dump(document, f, indent=2, sort_keys=True)
+    return document
+
+
+def load_results(path) -> Dict[str, Any]:
+    with open(path) as f:
+        document = json.load(f)
+    if document.get("schema") != SCHEMA_VERSION:
+        raise ValueError(f"{path}: unsupported benchmark schema {document.get('schema')!r}")
+    return document
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = 0.10) -> List[Dict[str, Any]]:
+    """Per-case, per-metric ratios current/baseline for the cases present in both runs.
+
+    Args:
+        baseline: Result document of the reference run
+        current: Result document of the new run
+        threshold: Relative slowdown (0.10 = 10%) above which a metric counts as a regression
+
+    Returns:
+        Rows of {case, metric, baseline, current, ratio, regression}
+    """
+    if baseline["meta"].get("universe") != current["meta"].get("universe"):
+        print("Warning: the two runs used different universes; ratios are not comparable.")
+
+    rows = []
+    for case, base_metrics in sorted(baseline["results"].items()):
+        metrics = current["results"].get(case)
+        if metrics is None:
+            continue
+        for metric in LOWER_IS_BETTER + ("throughput_per_s",):
+            before, after = base_metrics.get(metric), metrics.get(metric)
+            if not before or after is None:
+                continue
+            ratio = after / before
+            worse = ratio - 1 if metric in LOWER_IS_BETTER else (1 / ratio - 1 if ratio else float("inf"))
+            rows.append(
+                {
+                    "case": case,
+                    "metric": metric,
+                    "baseline": before,
+                    "current": after,
+                    "ratio": round(ratio, 3),
+                    "regression": worse > threshold,
+                }
+            )
+    return rows
+
+
+def format_results(results: Dict[str, Dict[str, float]]) -> str:
+    lines = [f"{'case':<34}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'ops/s':>10}{'peak KiB':>11}"]
+    for case, metrics in sorted(results.items()):
+        lines.append(
+            f"{case:<34}{metrics['p50_ms']:>10.3f}{metrics['p90_ms']:>10.3f}{metrics['p99_ms']:>10.3f}"
+            f"{metrics['throughput_per_s']:>10.1f}{metrics['peak_memory_kb']:>11.1f}"
+        )
+    return "\n".join(lines)
+
+
+def format_comparison(rows: List[Dict[str, Any]]) -> str:
+    lines = [f"{'case':<34}{'metric':<18}{'baseline':>12}{'current':>12}{'ratio':>8}"]
+    for row in rows:
+        flag = "  REGRESSION" if row["regression"] else ""
+        lines.append(
+            f"{row['case']:<34}{row['metric']:<18}{row['baseline']:>12}{row['current']:>12}{row['ratio']:>8.3f}{flag}"
+        )
+    return "\n".join(lines)
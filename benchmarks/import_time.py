@@ -0,0 +1,144 @@
+"""Measure cold import time of the package entry points with `python -X importtime`.
+
+Every sample is a fresh interpreter, so nothing is served from sys.modules; the
+reported time is the cumulative import time of the module itself (interpreter start-up
+excluded).
+
+    python -m benchmarks.import_time --iterations 10 --output imports.json
+    python -m benchmarks.import_time --compare imports-baseline.json
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+from benchmarks.harness import compare, format_comparison, load_results, percentile, run_metadata, write_results
+
+# Entry points whose start-up cost users pay directly
+DEFAULT_MODULES = (
+    "tradingagents.graph.trading_graph",
+    "tradingagents.dataflows.interface",
+    "cli.main",
+)
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_profile(module: str) -> List[Tuple[str, int, int]]:
+    """(module, self_us, cumulative_us) of every import made by `import module` in a fresh interpreter."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        cwd=REPO_ROOT,
+        env=dict(os.environ, TQDM_DISABLE="1"),
+    )
+    if completed.returncode != 0:
+        error = completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else "unknown error"
+        raise RuntimeError(f"import {module} failed: {error}")
+
+    rows = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        rows.append((name[1:], int(self_us), int(cumulative_us)))
+
+    # Keep the module's own import tree: a nested import is printed, indented, before
+    # its parent, so walk back from the module's top-level line
+    end = max((i for i, row in enumerate(rows) if row[0] == module), default=len(rows) - 1)
+    start = end
+    while start > 0 and rows[start - 1][0].startswith(" "):
+        start -= 1
+    return [(name.strip(), self_us, cumulative_us) for name, self_us, cumulative_us in rows[start:end + 1]]
+
+
+def measure_import(module: str, iterations: int, top_n: int = 10) -> Dict[str, object]:
+    """Cold import time percentiles of a module plus its slowest dependencies.
+
+    Args:
+        module: Dotted module name
+        iterations: Fresh interpreters to sample
+        top_n: Number of dependencies (by cumulative time, from the median run) to report
+
+    Returns:
+        Harness-style metrics (p50_ms, ...) with "modules_imported" and "slowest_imports"
+    """
+    runs = []
+    for _ in range(iterations):
+        rows = import_profile(module)
+        total_us = next((cumulative for name, _, cumulative in reversed(rows) if name == module), 0)
+        runs.append((total_us / 1000.0, rows))
+    runs.sort(key=lambda run: run[0])
+    latencies = [latency for latency, _ in runs]
+    median_rows = runs[len(runs) // 2][1]
+    slowest = sorted(
+        (row for row in median_rows if row[0] != module), key=lambda row: row[2], reverse=True
+    )[:top_n]
+    return {
+        "iterations": iterations,
+        "p50_ms": round(percentile(latencies, 50), 4),
+        "p90_ms": round(percentile(latencies, 90), 4),
+        "p99_ms": round(percentile(latencies, 99), 4),
+        "mean_ms": round(sum(latencies) / len(latencies), 4),
+        "min_ms": round(latencies[0], 4),
+        "max_ms": round(latencies[-1], 4),
+        "modules_imported": len(median_rows),
+        "slowest_imports": [
+            {"module": name, "self_ms": round(self_us / 1000.0, 3), "cumulative_ms": round(cumulative_us / 1000.0, 3)}
+            for name, self_us, cumulative_us in slowest
+        ],
+    }
+
+
+def format_import_results(results: Dict[str, Dict[str, object]]) -> str:
+    lines = [f"{'module':<40}{'p50 ms':>10}{'p90 ms':>10}{'min ms':>10}{'modules':>9}"]
+    for module, metrics in sorted(results.items()):
+        lines.append(
+            f"{module:<40}{metrics['p50_ms']:>10.1f}{metrics['p90_ms']:>10.1f}"
+            f"{metrics['min_ms']:>10.1f}{metrics['modules_imported']:>9}"
+        )
+        for row in metrics["slowest_imports"]:
+            lines.append(f"    {row['module']:<48}{row['cumulative_ms']:>10.1f} ms")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="TradingAgents cold import time")
+    parser.add_argument("--modules", default=None, help=f"Comma-separated modules (default: {', '.join(DEFAULT_MODULES)})")
+    parser.add_argument("--iterations", type=int, default=5, help="Fresh interpreters per module")
+    parser.add_argument("--top", type=int, default=10, help="Slowest dependencies listed per module")
+    parser.add_argument("--output", default=None, help="Write the JSON results to this file")
+    parser.add_argument("--compare", default=None, help="Baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Regression threshold (default: 0.10)")
+    args = parser.parse_args(argv)
+
+    modules = [name.strip() for name in args.modules.split(",")] if args.modules else list(DEFAULT_MODULES)
+    results = {}
+    for module in modules:
+        print(f"Importing {module}...", file=sys.stderr)
+        try:
+            results[module] = measure_import(module, args.iterations, args.top)
+        except RuntimeError as e:
+            print(f"Skipping {module}: {e}", file=sys.stderr)
+
+    meta = run_metadata(benchmark="import_time", iterations=args.iterations)
+    print(format_import_results(results))
+    if args.output:
+        document = write_results(args.output, meta, results)
+        print(f"Results written to {args.output}")
+    else:
+        document = {"meta": meta, "results": results}
+
+    if args.compare:
+        rows = compare(load_results(args.compare), document, args.threshold)
+        print(format_comparison(rows))
+        if any(row["regression"] for row in rows):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""Run the offline benchmark suite and write (and optionally compare) a JSON result file.
+
+    python -m benchmarks.run --universe 50 --iterations 100 --output bench.json
+    python -m benchmarks.run --compare baseline.json --output bench.json
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+
+# The reddit loaders draw tqdm progress bars; keep benchmark output readable
+os.environ.setdefault("TQDM_DISABLE", "1")
+
+from benchmarks.cases import CASES
+from benchmarks.fixtures import activate, build_universe
+from benchmarks.harness import (
+    compare,
+    format_comparison,
+    format_results,
+    load_results,
+    measure,
+    run_metadata,
+    write_results,
+)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="TradingAgents offline benchmarks")
+    parser.add_argument("--universe", type=int, default=20, help="Number of synthetic tickers (default: 20)")
+    parser.add_argument("--days", type=int, default=500, help="Trading days of price history per ticker")
+    parser.add_argument("--news-days", type=int, default=60, help="Days of news/insider/reddit data")
+    parser.add_argument("--seed", type=int, default=0, help="Fixture generator seed")
+    parser.add_argument("--iterations", type=int, default=50, help="Timed calls per case")
+    parser.add_argument("--warmup", type=int, default=2, help="Untimed calls per case")
+    parser.add_argument("--cases", default=None, help=f"Comma-separated subset of: {', '.join(CASES)}")
+    parser.add_argument("--fixtures", default=None, help="Directory for the fixtures (default: a temp dir)")
+    parser.add_argument("--output", default=None, help="Write the JSON results to this file")
+    parser.add_argument("--compare", default=None, help="Baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Regression threshold (default: 0.10)")
+    args = parser.parse_args(argv)
+
+    selected = [name.strip() for name in args.cases.split(",")] if args.cases else list(CASES)
+    unknown = [name for name in selected if name not in CASES]
+    if unknown:
+        parser.error(f"unknown case(s): {', '.join(unknown)}")
+
+    with tempfile.TemporaryDirectory(prefix="tradingagents-bench-") as tmp:
+        root = args.fixtures or os.path.join(tmp, "universe")
+        universe = build_universe(root, args.universe, args.days, args.news_days, args.seed)
+        activate(universe)
+
+        results = {}
+        for name in selected:
+            print(f"Running {name}...", file=sys.stderr)
+            operation = CASES[name](universe, os.path.join(tmp, "work"))
+            results[name] = measure(operation, args.iterations, args.warmup)
+
+    universe_params = dict(universe.to_dict(), seed=args.seed)
+    meta = run_metadata(universe=universe_params, iterations=args.iterations)
+    print(format_results(results))
+    if args.output:
+        document = write_results(args.output, meta, results)
+        print(f"Results written to {args.output}")
+    else:
+        document = {"meta": meta, "results": results}
+
+    if args.compare:
+        rows = compare(load_results(args.compare), document, args.threshold)
+        print(format_comparison(rows))
+        if any(row["regression"] for row in rows):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -146,6 +146,18 @@ TRANSLATIONS = {
         "showing_last_messages": "顯示最後",
         "of": "條，共",
         "messages": "條訊息",
+
+        # 批次分析
+        "batch_no_tickers": "錯誤：請使用 --tickers 或 --watchlist 指定股票代碼",
+        "batch_running": "批次分析中",
+        "batch_jobs": "個任務",
+        "batch_workers": "並行數",
+        "batch_results": "批次分析結果",
+        "batch_results_saved": "批次結果已保存至",
+        "ticker": "股票代碼",
+        "decision": "決策",
+        "elapsed": "耗時 (秒)",
+        "error": "錯誤",
     },
 
     "zh_CN": {
@@ -287,6 +299,18 @@ TRANSLATIONS = {
         "showing_last_messages": "显示最后",
         "of": "条，共",
         "messages": "条消息",
+
+        # 批次分析
+        "batch_no_tickers": "错误：请使用 --tickers 或 --watchlist 指定股票代码",
+        "batch_running": "批次分析中",
+        "batch_jobs": "个任务",
+        "batch_workers": "并行数",
+        "batch_results": "批次分析结果",
+        "batch_results_saved": "批次结果已保存至",
+        "ticker": "股票代码",
+        "decision": "决策",
+        "elapsed": "耗时 (秒)",
+        "error": "错误",
     },
 
     "en_US": {
@@ -428,6 +452,18 @@ TRANSLATIONS = {
         "showing_last_messages": "Showing last",
         "of": "of",
         "messages": "messages",
+
+        # Batch analysis
+        "batch_no_tickers": "Error: specify tickers with --tickers or --watchlist",
+        "batch_running": "Running batch analysis",
+        "batch_jobs": "jobs",
+        "batch_workers": "workers",
+        "batch_results": "Batch Analysis Results",
+        "batch_results_saved": "Batch results saved to",
+        "ticker": "Ticker",
+        "decision": "Decision",
+        "elapsed": "Elapsed (s)",
+        "error": "Error",
     }
 }
 
@@ -3,6 +3,7 @@ import datetime
 import typer
 from pathlib import Path
 from functools import wraps
+from contextlib import ExitStack
 from rich.console import Console
 from dotenv import load_dotenv
 
@@ -24,7 +25,6 @@ from rich import box
 from rich.align import Align
 from rich.rule import Rule
 
-from tradingagents.graph.trading_graph import TradingAgentsGraph
 from tradingagents.default_config import DEFAULT_CONFIG
 from cli.models import AnalystType
 from cli.utils import *
@@ -739,7 +739,7 @@ def extract_content_string(content):
     else:
         return str(content)
 
-def run_analysis():
+def run_analysis(profile=False):
     # First get all user selections
     selections = get_user_selections()
 
@@ -752,7 +752,9 @@ def run_analysis():
     config["backend_url"] = selections["backend_url"]
     config["llm_provider"] = selections["llm_provider"].lower()
 
-    # Initialize the graph
+    # Initialize the graph (imported here so `--help` and the prompts start fast)
+    from tradingagents.graph.trading_graph import TradingAgentsGraph
+
     graph = TradingAgentsGraph(
         [analyst.value for analyst in selections["analysts"]], config=config, debug=True
     )
@@ -849,6 +851,13 @@ def run_analysis():
         )
         args = graph.propagator.get_graph_args()
 
+        # Optionally profile the streamed run (per-node CPU samples, wall/CPU/wait times)
+        profiling = ExitStack()
+        if profile:
+            profiling.enter_context(
+                graph.profiling(selections["ticker"], selections["analysis_date"], args)
+            )
+
         # Stream the analysis
         trace = []
         for chunk in graph.graph.stream(init_agent_state, **args):
@@ -1081,6 +1090,8 @@ def run_analysis():
 
             trace.append(chunk)
 
+        profiling.close()
+
         # Get final state and decision
         final_state = trace[-1]
         decision = graph.process_signal(final_state["final_trade_decision"])
@@ -1136,8 +1147,96 @@ def run_analysis():
 
 
 @app.command()
-def analyze():
-    run_analysis()
+def analyze(
+    profile: bool = typer.Option(
+        False, "--profile", help="Write per-node CPU profiles and a hotspot summary to results_dir/profiles"
+    ),
+):
+    run_analysis(profile=profile)
+
+
+@app.command()
+def batch(
+    tickers: Optional[str] = typer.Option(
+        None, "--tickers", help="Comma-separated ticker symbols, e.g. AAPL,MSFT,NVDA"
+    ),
+    watchlist: Optional[Path] = typer.Option(
+        None, "--watchlist", help="File with one ticker symbol per line"
+    ),
+    analysis_date: Optional[str] = typer.Option(
+        None, "--date", help="Analysis date YYYY-MM-DD (default: today)"
+    ),
+    analysts: str = typer.Option(
+        "market,news,fundamentals", "--analysts", help="Comma-separated analyst types"
+    ),
+    workers: int = typer.Option(
+        DEFAULT_CONFIG["batch_max_workers"], "--workers", help="Max concurrent analyses"
+    ),
+    output: Optional[Path] = typer.Option(
+        None, "--output", help="Output JSON file (default: results_dir/batch/<date>.json)"
+    ),
+    profile: bool = typer.Option(
+        False, "--profile", help="Profile every analysis (see analyze --profile)"
+    ),
+):
+    """Analyze a list of tickers concurrently and write all results in one pass."""
+    symbols = []
+    if tickers:
+        symbols.extend(t.strip().upper() for t in tickers.split(","))
+    if watchlist:
+        symbols.extend(
+            line.strip().upper()
+            for line in watchlist.read_text(encoding="utf-8").splitlines()
+            if line.strip() and not line.strip().startswith("#")
+        )
+    symbols = list(dict.fromkeys(s for s in symbols if s))
+    if not symbols:
+        console.print(f"[red]{i18n('batch_no_tickers')}[/red]")
+        raise typer.Exit(code=1)
+
+    analysis_date = analysis_date or datetime.datetime.now().strftime("%Y-%m-%d")
+    config = DEFAULT_CONFIG.copy()
+    config["profiling_enabled"] = profile
+
+    from tradingagents.graph.batch import write_batch_results
+    from tradingagents.graph.trading_graph import TradingAgentsGraph
+
+    graph = TradingAgentsGraph(
+        [a.strip() for a in analysts.split(",")], config=config, debug=False
+    )
+
+    console.print(
+        f"[bold cyan]{i18n('batch_running')}: {len(symbols)} {i18n('batch_jobs')}, "
+        f"{workers} {i18n('batch_workers')}[/bold cyan]"
+    )
+
+    def report_progress(result):
+        status = "[green]✓[/green]" if result.ok else "[red]✗[/red]"
+        console.print(f"{status} {result.ticker} {result.trade_date} ({result.elapsed:.1f}s)")
+
+    results = graph.propagate_batch(
+        [(symbol, analysis_date) for symbol in symbols],
+        max_workers=workers,
+        on_result=report_progress,
+    )
+
+    table = Table(title=i18n("batch_results"), box=box.SIMPLE_HEAD)
+    table.add_column(i18n("ticker"), style="cyan")
+    table.add_column(i18n("decision"))
+    table.add_column(i18n("elapsed"), justify="right")
+    table.add_column(i18n("error"), style="red")
+    for result in results:
+        table.add_row(
+            result.ticker,
+            (result.decision or "").strip(),
+            f"{result.elapsed:.1f}",
+            result.error or "",
+        )
+    console.print(table)
+
+    output = output or Path(config["results_dir"]) / "batch" / f"{analysis_date}.json"
+    output_path = write_batch_results(results, output)
+    console.print(f"[bold green]{i18n('batch_results_saved')}: {output_path}[/bold green]")
 
 
 if __name__ == "__main__":
@@ -11,7 +11,7 @@ setup(
     author="TradingAgents Team",
     author_email="yijia.xiao@cs.ucla.edu",
     url="https://github.com/TauricResearch",
-    packages=find_packages(),
+    packages=find_packages(exclude=["benchmarks", "benchmarks.*"]),
     install_requires=[
         "langchain>=0.1.0",
         "langchain-openai>=0.0.2",
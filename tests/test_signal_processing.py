@@ -0,0 +1,79 @@
+import pytest
+
+from tradingagents.graph.signal_processing import SignalProcessor, extract_signal
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Momentum and earnings are strong.\n\nFINAL TRANSACTION PROPOSAL: **BUY**", "BUY"),
+        ("Margins are shrinking.\n\nFINAL TRANSACTION PROPOSAL: SELL", "SELL"),
+        (
+            "The Safe Analyst argued for caution, the Risky Analyst for buying.\n\n"
+            "Recommendation: **Hold**",
+            "HOLD",
+        ),
+        # The closing marker wins over an earlier one
+        ("Recommendation: Buy\n\nAfter the guidance cut: FINAL TRANSACTION PROPOSAL: **SELL**", "SELL"),
+        ("The trend is intact.\n\n**Buy**", "BUY"),
+    ],
+)
+def test_extracts_unambiguous_closing_cue(text, expected):
+    assert extract_signal(text) == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        # Attributed to another participant, and the judge decides otherwise
+        "The Risky Analyst pushes for **Buy**, but the downside is large.\n\n"
+        "After weighing everything, I recommend we sell.",
+        # Negated
+        "We should not **Buy** here; holding is the prudent course.",
+        # The trader's proposal quoted by the judge, followed by a different decision
+        "Starting from the trader's plan (FINAL TRANSACTION PROPOSAL: **BUY**), the risks dominate.\n\n"
+        "My recommendation is to Sell.",
+        # A different decision word after the last marker
+        "Recommendation: Hold, then sell into strength.",
+        # Bold cue outside the closing paragraph
+        "**Buy**\n\nMomentum is strong.",
+        # Bold cue with another decision mentioned elsewhere
+        "Selling pressure has eased.\n\n**Buy**",
+        "FINAL TRANSACTION PROPOSAL: **BUY/SELL**",
+        "No decision markers at all.",
+        "",
+    ],
+)
+def test_ambiguous_text_is_left_to_the_llm(text):
+    assert extract_signal(text) is None
+
+
+class _RecordingLLM:
+    def __init__(self, reply):
+        self.reply = reply
+        self.calls = 0
+
+    def invoke(self, messages):
+        self.calls += 1
+        return type("Message", (), {"content": self.reply})()
+
+
+def test_processor_falls_back_to_llm_for_ambiguous_signal():
+    llm = _RecordingLLM("SELL")
+    processor = SignalProcessor(llm)
+
+    decision, path = processor.process_signal_with_path(
+        "We should not **Buy** here; holding is the prudent course."
+    )
+
+    assert (decision, path) == ("SELL", "llm")
+    assert llm.calls == 1
+
+
+def test_processor_skips_llm_for_clear_signal():
+    llm = _RecordingLLM("SELL")
+    processor = SignalProcessor(llm)
+
+    assert processor.process_signal("Outlook improved.\n\nFINAL TRANSACTION PROPOSAL: **BUY**") == "BUY"
+    assert llm.calls == 0
+    assert processor.path_counts() == {"rule": 1, "llm": 0}
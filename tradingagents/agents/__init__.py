@@ -1,6 +1,8 @@
-from .utils.agent_utils import create_msg_delete
+from .utils.agent_utils import create_msg_delete, scope_messages
+from .utils.context_budget import create_report_compressor
 from .utils.agent_states import AgentState, InvestDebateState, RiskDebateState
 from .utils.memory import FinancialSituationMemory
+from .utils.memory_compaction import MemoryCompactor
 
 from .analysts.fundamentals_analyst import create_fundamentals_analyst
 from .analysts.market_analyst import create_market_analyst
@@ -21,13 +23,16 @@ from .trader.trader import create_trader
 
 __all__ = [
     "FinancialSituationMemory",
+    "MemoryCompactor",
     "AgentState",
     "create_msg_delete",
+    "scope_messages",
     "InvestDebateState",
     "RiskDebateState",
     "create_bear_researcher",
     "create_bull_researcher",
     "create_research_manager",
+    "create_report_compressor",
     "create_fundamentals_analyst",
     "create_market_analyst",
     "create_neutral_debator",
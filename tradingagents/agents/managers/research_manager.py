@@ -1,5 +1,6 @@
 import time
 import json
+from tradingagents.agents.utils.context_budget import debate_context
 
 
 def create_research_manager(llm, memory):
@@ -13,12 +14,19 @@ def create_research_manager(llm, memory):
         investment_debate_state = state["investment_debate_state"]
 
         curr_situation = f"{market_research_report}\n\n{sentiment_report}\n\n{news_report}\n\n{fundamentals_report}"
-        past_memories = memory.get_memories(curr_situation, n_matches=2)
+        past_memories = memory.get_memories(
+            curr_situation, n_matches=2, filters=memory.state_filters(state)
+        )
 
         past_memory_str = ""
         for i, rec in enumerate(past_memories, 1):
             past_memory_str += rec["recommendation"] + "\n\n"
 
+        # The reports above feed memory retrieval; only the history is in the prompt
+        debate_history = debate_context(
+            state, history, past_memory_str, include_reports=False
+        )["history"]
+
         prompt = f"""As the portfolio manager and debate facilitator, your role is to critically evaluate this round of debate and make a definitive decision: align with the bear analyst, the bull analyst, or choose Hold only if it is strongly justified based on the arguments presented.
 
 Summarize the key points from both sides concisely, focusing on the most compelling evidence or reasoning. Your recommendation—Buy, Sell, or Hold—must be clear and actionable. Avoid defaulting to Hold simply because both sides have valid points; commit to a stance grounded in the debate's strongest arguments.
@@ -35,7 +43,7 @@ Here are your past reflections on mistakes:
 
 Here is the debate:
 Debate History:
-{history}"""
+{debate_history}"""
         response = llm.invoke(prompt)
 
         new_investment_debate_state = {
@@ -1,5 +1,6 @@
 import time
 import json
+from tradingagents.agents.utils.context_budget import debate_context
 
 
 def create_risk_manager(llm, memory):
@@ -16,12 +17,19 @@ def create_risk_manager(llm, memory):
         trader_plan = state["investment_plan"]
 
         curr_situation = f"{market_research_report}\n\n{sentiment_report}\n\n{news_report}\n\n{fundamentals_report}"
-        past_memories = memory.get_memories(curr_situation, n_matches=2)
+        past_memories = memory.get_memories(
+            curr_situation, n_matches=2, filters=memory.state_filters(state)
+        )
 
         past_memory_str = ""
         for i, rec in enumerate(past_memories, 1):
             past_memory_str += rec["recommendation"] + "\n\n"
 
+        # The reports above feed memory retrieval; only the history is in the prompt
+        debate_history = debate_context(
+            state, history, trader_plan, past_memory_str, include_reports=False
+        )["history"]
+
         prompt = f"""As the Risk Management Judge and Debate Facilitator, your goal is to evaluate the debate between three risk analysts—Risky, Neutral, and Safe/Conservative—and determine the best course of action for the trader. Your decision must result in a clear recommendation: Buy, Sell, or Hold. Choose Hold only if strongly justified by specific arguments, not as a fallback when all sides seem valid. Strive for clarity and decisiveness.
 
 Guidelines for Decision-Making:
@@ -37,7 +45,7 @@ Deliverables:
 ---
 
 **Analysts Debate History:**  
-{history}
+{debate_history}
 
 ---
 
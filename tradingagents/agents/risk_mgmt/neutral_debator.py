@@ -1,5 +1,6 @@
 import time
 import json
+from tradingagents.agents.utils.context_budget import debate_context
 
 
 def create_neutral_debator(llm):
@@ -18,6 +19,15 @@ def create_neutral_debator(llm):
 
         trader_decision = state["trader_investment_plan"]
 
+        context = debate_context(
+            state, history, trader_decision, current_risky_response, current_safe_response
+        )
+        market_research_report = context["market_report"]
+        sentiment_report = context["sentiment_report"]
+        news_report = context["news_report"]
+        fundamentals_report = context["fundamentals_report"]
+        debate_history = context["history"]
+
         prompt = f"""As the Neutral Risk Analyst, your role is to provide a balanced perspective, weighing both the potential benefits and risks of the trader's decision or plan. You prioritize a well-rounded approach, evaluating the upsides and downsides while factoring in broader market trends, potential economic shifts, and diversification strategies.Here is the trader's decision:
 
 {trader_decision}
@@ -28,7 +38,7 @@ Market Research Report: {market_research_report}
 Social Media Sentiment Report: {sentiment_report}
 Latest World Affairs Report: {news_report}
 Company Fundamentals Report: {fundamentals_report}
-Here is the current conversation history: {history} Here is the last response from the risky analyst: {current_risky_response} Here is the last response from the safe analyst: {current_safe_response}. If there are no responses from the other viewpoints, do not halluncinate and just present your point.
+Here is the current conversation history: {debate_history} Here is the last response from the risky analyst: {current_risky_response} Here is the last response from the safe analyst: {current_safe_response}. If there are no responses from the other viewpoints, do not halluncinate and just present your point.
 
 Engage actively by analyzing both sides critically, addressing weaknesses in the risky and conservative arguments to advocate for a more balanced approach. Challenge each of their points to illustrate why a moderate risk strategy might offer the best of both worlds, providing growth potential while safeguarding against extreme volatility. Focus on debating rather than simply presenting data, aiming to show that a balanced view can lead to the most reliable outcomes. Output conversationally as if you are speaking without any special formatting."""
 
@@ -1,10 +1,11 @@
 from typing import Annotated, Sequence
 from datetime import date, timedelta, datetime
 from typing_extensions import TypedDict, Optional
-from langchain_openai import ChatOpenAI
 from tradingagents.agents import *
 from langgraph.prebuilt import ToolNode
 from langgraph.graph import END, StateGraph, START, MessagesState
+from langgraph.graph.message import add_messages
+from langchain_core.messages import AnyMessage
 
 
 # Researcher team state
@@ -53,6 +54,12 @@ class AgentState(MessagesState):
 
     sender: Annotated[str, "Agent that sent this message"]
 
+    # per-analyst message channels, used when the analysts run in parallel
+    market_messages: Annotated[list[AnyMessage], add_messages]
+    social_messages: Annotated[list[AnyMessage], add_messages]
+    news_messages: Annotated[list[AnyMessage], add_messages]
+    fundamentals_messages: Annotated[list[AnyMessage], add_messages]
+
     # research step
     market_report: Annotated[str, "Report from the Market Analyst"]
     sentiment_report: Annotated[str, "Report from the Social Media Analyst"]
@@ -60,6 +67,9 @@ class AgentState(MessagesState):
         str, "Report from the News Researcher of current world affairs"
     ]
     fundamentals_report: Annotated[str, "Report from the Fundamentals Researcher"]
+    report_digests: Annotated[
+        dict, "Condensed analyst reports used by the debate prompts"
+    ]
 
     # researcher team discussion step
     investment_debate_state: Annotated[
@@ -36,4 +36,27 @@ def create_msg_delete():
     return delete_messages
 
 
-        
\ No newline at end of file
+def scope_messages(node, messages_key):
+    """Run a node against its own message channel instead of the shared "messages".
+
+    The node sees state[messages_key] as its "messages" and its "messages" update is
+    written back to messages_key, so analysts running in parallel never share history.
+    An empty channel is seeded with the ticker, like the shared channel's initial state.
+    """
+
+    def scoped_node(state):
+        channel = state.get(messages_key) or []
+        seed = []
+        if not channel:
+            seed = [HumanMessage(content=state["company_of_interest"])]
+            channel = seed
+
+        result = dict(node({**state, "messages": channel}))
+        if "messages" in result:
+            result[messages_key] = seed + list(result.pop("messages"))
+        elif seed:
+            result[messages_key] = seed
+        return result
+
+    return scoped_node
+
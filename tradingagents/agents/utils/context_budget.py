@@ -0,0 +1,148 @@
+import math
+import re
+
+from tradingagents.dataflows.config import get_config
+
+# Analyst report fields embedded in the debate prompts, with their labels
+REPORT_FIELDS = {
+    "market_report": "market research report",
+    "sentiment_report": "social media sentiment report",
+    "news_report": "world affairs news report",
+    "fundamentals_report": "company fundamentals report",
+}
+
+# Debate turns are appended to the history as "\n<Speaker> Analyst: ..."
+_TURN_PATTERN = re.compile(r"\n(?=(?:Bull|Bear|Risky|Safe|Neutral) Analyst: )")
+
+_TRIM_MARKER = " [...]"
+
+
+def estimate_tokens(text):
+    """Rough token count of a text (about four characters per token)."""
+    return math.ceil(len(text or "") / 4)
+
+
+def trim_to_budget(text, max_tokens):
+    """Cut text to roughly max_tokens, keeping its beginning."""
+    text = text or ""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    return text[: max(0, max_tokens * 4 - len(_TRIM_MARKER))].rstrip() + _TRIM_MARKER
+
+
+def rolling_history(history, max_tokens, older_turn_tokens=120):
+    """Compress a debate history to roughly max_tokens.
+
+    The newest turns are kept verbatim, earlier turns are cut to their opening
+    older_turn_tokens, and whatever still does not fit is replaced by a note saying how
+    many turns were omitted.
+    """
+    history = history or ""
+    if estimate_tokens(history) <= max_tokens:
+        return history
+
+    turns = [turn for turn in _TURN_PATTERN.split(history) if turn.strip()]
+    recent, used = [], 0
+    for turn in reversed(turns):
+        cost = estimate_tokens(turn)
+        if used + cost > max_tokens:
+            break
+        recent.insert(0, turn)
+        used += cost
+    if not recent and turns:
+        recent = [trim_to_budget(turns[-1], max_tokens)]
+        used = estimate_tokens(recent[0])
+
+    older = turns[: len(turns) - len(recent)]
+    compressed = []
+    for turn in reversed(older):
+        brief = trim_to_budget(turn, older_turn_tokens)
+        cost = estimate_tokens(brief)
+        if used + cost > max_tokens:
+            break
+        compressed.insert(0, brief)
+        used += cost
+
+    omitted = len(older) - len(compressed)
+    note = [f"[{omitted} earlier turns omitted]"] if omitted else []
+    return "\n".join(note + compressed + recent)
+
+
+def debate_context(state, history, *extra, include_reports=True):
+    """Analyst reports and debate history to embed in a debate node's prompt.
+
+    Without "context_budget_enabled" these are the state's values unchanged. Otherwise the
+    compressed reports written by the report compressor are used (each capped at
+    "context_report_tokens"), the history is compressed to "context_history_tokens", and
+    both shrink further if the prompt would exceed "context_node_tokens" together with the
+    node's other variable inputs (extra). Nodes whose prompt only holds the history pass
+    include_reports=False so the reports do not count against the node budget.
+
+    Returns:
+        Dict with the four report fields and "history"
+    """
+    config = get_config()
+    reports = {field: state.get(field, "") for field in REPORT_FIELDS}
+    if not config.get("context_budget_enabled", False):
+        return {**reports, "history": history}
+
+    report_tokens = config.get("context_report_tokens", 1500)
+    history_tokens = config.get("context_history_tokens", 3000)
+    node_tokens = config.get("context_node_tokens", 12000)
+
+    digests = state.get("report_digests") or {}
+    reports = {
+        field: trim_to_budget(digests.get(field) or text, report_tokens)
+        for field, text in reports.items()
+    }
+    history = rolling_history(history, history_tokens)
+
+    # Enforce the node budget: give up history first, then report detail
+    fixed = sum(estimate_tokens(text) for text in extra)
+    report_cost = (
+        sum(estimate_tokens(text) for text in reports.values()) if include_reports else 0
+    )
+    overflow = fixed + report_cost + estimate_tokens(history) - node_tokens
+    if overflow > 0:
+        history = rolling_history(history, max(0, estimate_tokens(history) - overflow))
+        overflow = fixed + report_cost + estimate_tokens(history) - node_tokens
+    if overflow > 0 and include_reports:
+        per_report = max(0, (node_tokens - fixed - estimate_tokens(history)) // len(reports))
+        reports = {field: trim_to_budget(text, per_report) for field, text in reports.items()}
+
+    return {**reports, "history": history}
+
+
+def create_report_compressor(llm, report_tokens):
+    """Node condensing every analyst report longer than report_tokens, once per run.
+
+    The condensed versions are stored in "report_digests"; the original reports stay in
+    the state for memory retrieval, logging and reflection.
+    """
+
+    def report_compressor_node(state) -> dict:
+        fields = [
+            field
+            for field in REPORT_FIELDS
+            if estimate_tokens(state.get(field, "")) > report_tokens
+        ]
+        if not fields:
+            return {"report_digests": {}}
+
+        words = int(report_tokens * 0.75)
+        prompts = [
+            f"Condense the following {REPORT_FIELDS[field]} for {state['company_of_interest']} "
+            f"to at most {words} words. Keep every figure, date, indicator reading, risk and "
+            f"conclusion that matters for a trading decision; drop repetition and filler.\n\n"
+            f"{state[field]}"
+            for field in fields
+        ]
+        responses = llm.batch(prompts)
+
+        return {
+            "report_digests": {
+                field: response.content for field, response in zip(fields, responses)
+            }
+        }
+
+    return report_compressor_node
@@ -1,6 +1,6 @@
 from langchain_core.tools import tool
 from typing import Annotated
-from tradingagents.dataflows.interface import route_to_vendor
+from tradingagents.dataflows.interface import route_to_vendor, aroute_to_vendor
 
 
 @tool
@@ -20,3 +20,13 @@ def get_stock_data(
         str: A formatted dataframe containing the stock price data for the specified ticker symbol in the specified date range.
     """
     return route_to_vendor("get_stock_data", symbol, start_date, end_date)
+
+
+# Native coroutines used by ToolNode when the graph runs with ainvoke/astream
+
+async def aget_stock_data(symbol: str, start_date: str, end_date: str) -> str:
+    """Async variant of get_stock_data."""
+    return await aroute_to_vendor("get_stock_data", symbol, start_date, end_date)
+
+
+get_stock_data.coroutine = aget_stock_data
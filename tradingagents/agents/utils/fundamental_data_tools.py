@@ -1,6 +1,6 @@
 from langchain_core.tools import tool
 from typing import Annotated
-from tradingagents.dataflows.interface import route_to_vendor
+from tradingagents.dataflows.interface import route_to_vendor, aroute_to_vendor
 
 
 @tool
@@ -74,4 +74,32 @@ def get_income_statement(
     Returns:
         str: A formatted report containing income statement data
     """
-    return route_to_vendor("get_income_statement", ticker, freq, curr_date)
\ No newline at end of file
+    return route_to_vendor("get_income_statement", ticker, freq, curr_date)
+
+
+# Native coroutines used by ToolNode when the graph runs with ainvoke/astream
+
+async def aget_fundamentals(ticker: str, curr_date: str) -> str:
+    """Async variant of get_fundamentals."""
+    return await aroute_to_vendor("get_fundamentals", ticker, curr_date)
+
+
+async def aget_balance_sheet(ticker: str, freq: str = "quarterly", curr_date: str = None) -> str:
+    """Async variant of get_balance_sheet."""
+    return await aroute_to_vendor("get_balance_sheet", ticker, freq, curr_date)
+
+
+async def aget_cashflow(ticker: str, freq: str = "quarterly", curr_date: str = None) -> str:
+    """Async variant of get_cashflow."""
+    return await aroute_to_vendor("get_cashflow", ticker, freq, curr_date)
+
+
+async def aget_income_statement(ticker: str, freq: str = "quarterly", curr_date: str = None) -> str:
+    """Async variant of get_income_statement."""
+    return await aroute_to_vendor("get_income_statement", ticker, freq, curr_date)
+
+
+get_fundamentals.coroutine = aget_fundamentals
+get_balance_sheet.coroutine = aget_balance_sheet
+get_cashflow.coroutine = aget_cashflow
+get_income_statement.coroutine = aget_income_statement
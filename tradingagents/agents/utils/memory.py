@@ -1,64 +1,282 @@
-import chromadb
-from chromadb.config import Settings
-from openai import OpenAI
+import time
+import uuid
+
+import numpy as np
+
+from .numpy_vector_store import NumpyVectorCollection, normalize_rows
+
+
+def _openai_client(base_url):
+    # The OpenAI SDK is imported on first use, not with the module (offline runs never need it)
+    from openai import OpenAI
+
+    return OpenAI(base_url=base_url)
 
 
 class FinancialSituationMemory:
     def __init__(self, name, config):
         # 判斷使用哪個 embedding 模型和 API
-        if config["backend_url"] == "http://localhost:11434/v1":
+        self.embedder = None
+        if config.get("llm_provider", "").lower() == "fake":
+            # Offline benchmarking: deterministic hashed embeddings, no API client
+            from tradingagents.llms.fake import FakeEmbeddings
+
+            self.embedding = "fake"
+            self.client = None
+            self.embedder = FakeEmbeddings()
+        elif config["backend_url"] == "http://localhost:11434/v1":
             # Ollama 本地模型
             self.embedding = "nomic-embed-text"
-            self.client = OpenAI(base_url=config["backend_url"])
+            self.client = _openai_client(base_url=config["backend_url"])
         elif config.get("llm_provider", "").lower() == "google":
             # Google provider - embeddings 使用 OpenAI API
             self.embedding = "text-embedding-3-small"
-            self.client = OpenAI(base_url="https://api.openai.com/v1")
+            self.client = _openai_client(base_url="https://api.openai.com/v1")
         else:
             # 其他 provider (OpenAI, Anthropic, OpenRouter)
             self.embedding = "text-embedding-3-small"
-            self.client = OpenAI(base_url=config["backend_url"])
-        self.chroma_client = chromadb.Client(Settings(allow_reset=True))
-        self.situation_collection = self.chroma_client.create_collection(name=name)
+            self.client = _openai_client(base_url=config["backend_url"])
+
+        # Situations are embedded as bounded-size chunks and pooled into one vector
+        self.chunk_size = config.get("memory_chunk_size", 2000)
+        self.max_chunks = config.get("memory_max_chunks", 16)
+        self.embedding_batch_size = max(1, config.get("memory_embedding_batch_size", 256))
+        self.embedding_batch_chars = config.get("memory_embedding_batch_chars", 200_000)
+        self.rerank = config.get("memory_rerank", False)
+        self.rerank_candidates = config.get("memory_rerank_candidates", 5)
+
+        # Default pre-filters applied by the agents (see state_filters)
+        self.filter_before_trade_date = config.get("memory_filter_before_trade_date", False)
+        self.filter_same_ticker = config.get("memory_filter_same_ticker", False)
+        self.filter_outcome_before_trade_date = config.get(
+            "memory_filter_outcome_before_trade_date", False
+        )
+
+        backend = config.get("memory_backend", "chroma")
+        self.chroma_client = None
+        if backend == "numpy":
+            # Lightweight in-process index, optionally persisted/mmapped under memory_dir
+            persist_dir = config.get("memory_dir")
+            self.situation_collection = NumpyVectorCollection(name, persist_dir)
+            self.chunk_collection = NumpyVectorCollection(f"{name}_chunks", persist_dir)
+        elif backend == "chroma":
+            import chromadb
+            from chromadb.config import Settings
+
+            # The in-process client is shared, so every memory gets its own collections;
+            # otherwise a second graph in the process (e.g. from a GraphPool) would clash
+            suffix = uuid.uuid4().hex[:8]
+            self.chroma_client = chromadb.Client(Settings(allow_reset=True))
+            self.situation_collection = self.chroma_client.create_collection(
+                name=f"{name}_{suffix}"
+            )
+            self.chunk_collection = self.chroma_client.create_collection(
+                name=f"{name}_chunks_{suffix}"
+            )
+        else:
+            raise ValueError(f"Unsupported memory backend: {backend}")
+
+    def close(self):
+        """Drop this memory's collections from the shared in-process Chroma client.
+
+        The numpy backend needs no cleanup (its files under memory_dir are kept).
+        """
+        if self.chroma_client is None:
+            return
+        for collection in (self.situation_collection, self.chunk_collection):
+            try:
+                self.chroma_client.delete_collection(name=collection.name)
+            except Exception:
+                # Already deleted (e.g. the client was reset)
+                pass
+        self.chroma_client = None
 
     def get_embedding(self, text):
         """Get OpenAI embedding for a text"""
-        
-        response = self.client.embeddings.create(
-            model=self.embedding, input=text
-        )
-        return response.data[0].embedding
+        return self.get_embeddings([text])[0]
+
+    def get_embeddings(self, texts):
+        """Get OpenAI embeddings for a batch of texts, in as few bounded requests as possible"""
+        texts = list(texts)
+        if self.embedder is not None:
+            return self.embedder.embed_documents(texts)
+        embeddings = []
+        for batch in self._embedding_batches(texts):
+            response = self.client.embeddings.create(model=self.embedding, input=batch)
+            embeddings.extend(
+                item.embedding for item in sorted(response.data, key=lambda d: d.index)
+            )
+        return embeddings
+
+    def _embedding_batches(self, texts):
+        """Split texts into requests of at most embedding_batch_size inputs and embedding_batch_chars characters.
+
+        A single text longer than the character cap still gets a request of its own.
+        """
+        batch = []
+        batch_chars = 0
+        for text in texts:
+            if batch and (
+                len(batch) >= self.embedding_batch_size
+                or batch_chars + len(text) > self.embedding_batch_chars
+            ):
+                yield batch
+                batch = []
+                batch_chars = 0
+            batch.append(text)
+            batch_chars += len(text)
+        if batch:
+            yield batch
+
+    def _chunk_situation(self, situation):
+        """Split a situation into paragraph-aligned chunks of at most chunk_size characters.
+
+        The analyst reports are joined with blank lines, so packing paragraphs keeps
+        each report in its own chunks where it fits. At most max_chunks evenly spaced
+        chunks are kept so the embedding cost per situation stays bounded.
+        """
+        chunks = []
+        current = ""
+        for paragraph in situation.split("\n\n"):
+            paragraph = paragraph.strip()
+            if not paragraph:
+                continue
+            while len(paragraph) > self.chunk_size:
+                if current:
+                    chunks.append(current)
+                    current = ""
+                chunks.append(paragraph[: self.chunk_size])
+                paragraph = paragraph[self.chunk_size :]
+            if current and len(current) + 2 + len(paragraph) > self.chunk_size:
+                chunks.append(current)
+                current = paragraph
+            else:
+                current = f"{current}\n\n{paragraph}" if current else paragraph
+        if current:
+            chunks.append(current)
+
+        if not chunks:
+            return [situation.strip() or "N/A"]
+        if len(chunks) > self.max_chunks:
+            step = len(chunks) / self.max_chunks
+            chunks = [chunks[int(i * step)] for i in range(self.max_chunks)]
+        return chunks
+
+    def _embed_situations(self, situations):
+        """Embed the chunks of all situations together (see get_embeddings for the request size bounds).
+
+        Returns a list of (pooled_vector, chunks, chunk_vectors) tuples, one per situation.
+        """
+        chunked = [self._chunk_situation(situation) for situation in situations]
+        flat_chunks = [chunk for chunks in chunked for chunk in chunks]
+        vectors = normalize_rows(np.asarray(self.get_embeddings(flat_chunks), dtype=np.float32))
+
+        embedded = []
+        start = 0
+        for chunks in chunked:
+            chunk_vectors = vectors[start : start + len(chunks)]
+            start += len(chunks)
+            pooled = normalize_rows(chunk_vectors.mean(axis=0, keepdims=True))[0]
+            embedded.append((pooled, chunks, chunk_vectors))
+        return embedded
 
     def add_situations(self, situations_and_advice):
-        """Add financial situations and their corresponding advice. Parameter is a list of tuples (situation, rec)"""
+        """Add financial situations and their corresponding advice.
+
+        Parameter is a list of tuples (situation, rec) or (situation, rec, metadata), where
+        metadata may hold ticker, trade_date and outcome_date (yyyy-mm-dd), sector,
+        realized_return and market_regime for filtered retrieval.
+        """
 
         situations = []
         advice = []
+        extra_metadata = []
         ids = []
         embeddings = []
+        chunk_documents = []
+        chunk_ids = []
+        chunk_metadatas = []
+        chunk_embeddings = []
 
-        offset = self.situation_collection.count()
-
-        for i, (situation, recommendation) in enumerate(situations_and_advice):
+        for situation, recommendation, *metadata in situations_and_advice:
             situations.append(situation)
             advice.append(recommendation)
-            ids.append(str(offset + i))
-            embeddings.append(self.get_embedding(situation))
+            extra_metadata.append(_clean_metadata(metadata[0] if metadata else {}))
+
+        for pooled, chunks, chunk_vectors in self._embed_situations(situations):
+            # Random ids stay unique across concurrent writers and after deletions
+            situation_id = uuid.uuid4().hex
+            ids.append(situation_id)
+            embeddings.append(pooled.tolist())
+            for j, (chunk, vector) in enumerate(zip(chunks, chunk_vectors)):
+                chunk_documents.append(chunk)
+                chunk_ids.append(f"{situation_id}:{j}")
+                chunk_metadatas.append({"parent_id": situation_id})
+                chunk_embeddings.append(vector.tolist())
 
+        created_at = time.time()
         self.situation_collection.add(
             documents=situations,
-            metadatas=[{"recommendation": rec} for rec in advice],
+            metadatas=[
+                {**extra, "recommendation": rec, "created_at": created_at}
+                for rec, extra in zip(advice, extra_metadata)
+            ],
             embeddings=embeddings,
             ids=ids,
         )
+        self.chunk_collection.add(
+            documents=chunk_documents,
+            metadatas=chunk_metadatas,
+            embeddings=chunk_embeddings,
+            ids=chunk_ids,
+        )
+
+    def count(self):
+        """Number of stored situations."""
+        return self.situation_collection.count()
+
+    def get_all(self):
+        """Return every stored situation with its metadata and pooled embedding."""
+        stored = self.situation_collection.get(
+            include=["documents", "metadatas", "embeddings"]
+        )
+        return [
+            {
+                "id": stored["ids"][i],
+                "situation": stored["documents"][i],
+                "metadata": stored["metadatas"][i],
+                "embedding": np.asarray(stored["embeddings"][i], dtype=np.float32),
+            }
+            for i in range(len(stored["ids"]))
+        ]
+
+    def update_metadata(self, situation_id, metadata):
+        """Replace the metadata (recommendation included) of a stored situation."""
+        self.situation_collection.update(ids=[situation_id], metadatas=[metadata])
 
-    def get_memories(self, current_situation, n_matches=1):
-        """Find matching recommendations using OpenAI embeddings"""
-        query_embedding = self.get_embedding(current_situation)
+    def delete(self, situation_ids):
+        """Delete situations and their chunk vectors."""
+        situation_ids = list(situation_ids)
+        if not situation_ids:
+            return
+        self.situation_collection.delete(ids=situation_ids)
+        self.chunk_collection.delete(where={"parent_id": {"$in": situation_ids}})
 
+    def get_memories(self, current_situation, n_matches=1, rerank=None, filters=None):
+        """Find matching recommendations using OpenAI embeddings.
+
+        Candidates are retrieved with the pooled situation vectors. With rerank enabled,
+        a wider candidate set is re-scored chunk-by-chunk before the top n_matches are kept.
+        filters pre-restrict the search by metadata, see build_memory_filter.
+        """
+        rerank = self.rerank if rerank is None else rerank
+        pooled, _, query_chunk_vectors = self._embed_situations([current_situation])[0]
+
+        n_candidates = n_matches * self.rerank_candidates if rerank else n_matches
         results = self.situation_collection.query(
-            query_embeddings=[query_embedding],
-            n_results=n_matches,
+            query_embeddings=[pooled.tolist()],
+            n_results=n_candidates,
+            where=build_memory_filter(filters),
             include=["metadatas", "documents", "distances"],
         )
 
@@ -66,14 +284,122 @@ class FinancialSituationMemory:
         for i in range(len(results["documents"][0])):
             matched_results.append(
                 {
+                    "id": results["ids"][0][i],
                     "matched_situation": results["documents"][0][i],
                     "recommendation": results["metadatas"][0][i]["recommendation"],
                     "similarity_score": 1 - results["distances"][0][i],
                 }
             )
 
-        return matched_results
+        if rerank and matched_results:
+            scores = self._chunk_scores(
+                query_chunk_vectors, [match["id"] for match in matched_results]
+            )
+            for match in matched_results:
+                match["rerank_score"] = scores.get(match["id"], 0.0)
+            matched_results.sort(key=lambda match: match["rerank_score"], reverse=True)
+
+        return matched_results[:n_matches]
+
+    def state_filters(self, state):
+        """Build the configured default retrieval filters for an agent state.
+
+        With memory_filter_before_trade_date only lessons from earlier trade dates are
+        eligible; with memory_filter_outcome_before_trade_date only lessons whose outcome
+        was realized before the trade date are (look-ahead-free backtests); with
+        memory_filter_same_ticker only lessons about the same ticker are.
+        """
+        filters = {}
+        if self.filter_before_trade_date:
+            filters["before_date"] = state["trade_date"]
+        if self.filter_outcome_before_trade_date:
+            filters["outcome_before_date"] = state["trade_date"]
+        if self.filter_same_ticker:
+            filters["ticker"] = state["company_of_interest"]
+        return filters or None
+
+    def _chunk_scores(self, query_chunk_vectors, situation_ids):
+        """Score stored situations by mean best-chunk cosine similarity to the query chunks."""
+        stored = self.chunk_collection.get(
+            where={"parent_id": {"$in": list(situation_ids)}},
+            include=["embeddings", "metadatas"],
+        )
+        if len(stored["ids"]) == 0:
+            return {}
+
+        vectors = np.asarray(stored["embeddings"], dtype=np.float32)
+        parents = np.asarray([meta["parent_id"] for meta in stored["metadatas"]])
+        similarities = query_chunk_vectors @ vectors.T
+
+        scores = {}
+        for situation_id in situation_ids:
+            mask = parents == situation_id
+            if mask.any():
+                scores[situation_id] = float(similarities[:, mask].max(axis=1).mean())
+        return scores
+
+
+def build_memory_filter(filters):
+    """Translate retrieval filters into a Chroma where clause.
+
+    Supported keys: ticker, sector, market_regime (a value or a list of values),
+    before_date / after_date (exclusive, yyyy-mm-dd), outcome_before_date (exclusive
+    bound on outcome_date; lessons without one are excluded) and min_return /
+    max_return (bounds on realized_return). Returns None when nothing is filtered.
+    """
+    if not filters:
+        return None
+
+    clauses = []
+    for key in ("ticker", "sector", "market_regime"):
+        value = filters.get(key)
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple, set)):
+            clauses.append({key: {"$in": list(value)}})
+        else:
+            clauses.append({key: value})
+    if filters.get("before_date"):
+        clauses.append({"trade_date_ord": {"$lt": _date_ordinal(filters["before_date"])}})
+    if filters.get("after_date"):
+        clauses.append({"trade_date_ord": {"$gt": _date_ordinal(filters["after_date"])}})
+    if filters.get("outcome_before_date"):
+        clauses.append(
+            {"outcome_date_ord": {"$lt": _date_ordinal(filters["outcome_before_date"])}}
+        )
+    if filters.get("min_return") is not None:
+        clauses.append({"realized_return": {"$gte": float(filters["min_return"])}})
+    if filters.get("max_return") is not None:
+        clauses.append({"realized_return": {"$lte": float(filters["max_return"])}})
+
+    if not clauses:
+        return None
+    if len(clauses) == 1:
+        return clauses[0]
+    return {"$and": clauses}
+
+
+def _date_ordinal(trade_date):
+    """yyyy-mm-dd -> yyyymmdd integer, usable in numeric range filters."""
+    return int(str(trade_date)[:10].replace("-", ""))
+
 
+def _clean_metadata(metadata):
+    """Keep scalar metadata values and derive the numeric trade and outcome dates."""
+    cleaned = {
+        key: value
+        for key, value in metadata.items()
+        if isinstance(value, (str, int, float, bool))
+    }
+    if "trade_date" in cleaned:
+        cleaned["trade_date"] = str(cleaned["trade_date"])[:10]
+        cleaned["trade_date_ord"] = _date_ordinal(cleaned["trade_date"])
+    if "outcome_date" in cleaned:
+        cleaned["outcome_date"] = str(cleaned["outcome_date"])[:10]
+        cleaned["outcome_date_ord"] = _date_ordinal(cleaned["outcome_date"])
+    if "realized_return" in cleaned:
+        cleaned["realized_return"] = float(cleaned["realized_return"])
+    return cleaned
 
 if __name__ == "__main__":
     # Example usage
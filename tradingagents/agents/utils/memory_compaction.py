@@ -0,0 +1,85 @@
+import numpy as np
+
+
+class MemoryCompactor:
+    """Keeps a FinancialSituationMemory bounded by merging near-duplicates and capping its size."""
+
+    def __init__(self, similarity_threshold=0.95, max_size=None, summarizer=None):
+        """Initialize the compactor.
+
+        Args:
+            similarity_threshold: Cosine similarity of pooled situation vectors above which
+                two situations are treated as duplicates
+            max_size: Maximum number of situations kept per memory (oldest are dropped first),
+                or None for no cap
+            summarizer: Optional callable taking a list of lessons (newest first) and returning
+                one merged lesson. Without it the newest lesson of each cluster is kept.
+        """
+        self.similarity_threshold = similarity_threshold
+        self.max_size = max_size
+        self.summarizer = summarizer
+
+    def compact(self, memory):
+        """Compact a memory in place and return statistics about what was removed."""
+        records = memory.get_all()
+        records.sort(key=lambda r: r["metadata"].get("created_at", 0.0), reverse=True)
+
+        clusters = self._cluster(records)
+        to_delete = []
+        merged = 0
+        for cluster in clusters:
+            if len(cluster) == 1:
+                continue
+            leader, duplicates = cluster[0], cluster[1:]
+            lessons = [record["metadata"]["recommendation"] for record in cluster]
+            metadata = dict(leader["metadata"])
+            if self.summarizer is not None:
+                metadata["recommendation"] = self.summarizer(lessons)
+            metadata["merged_count"] = sum(
+                record["metadata"].get("merged_count", 1) for record in cluster
+            )
+            memory.update_metadata(leader["id"], metadata)
+            to_delete.extend(record["id"] for record in duplicates)
+            merged += len(duplicates)
+
+        # Clusters are ordered newest first, so the tail holds the oldest survivors
+        leaders = [cluster[0] for cluster in clusters]
+        evicted = 0
+        if self.max_size is not None and len(leaders) > self.max_size:
+            evicted = len(leaders) - self.max_size
+            to_delete.extend(record["id"] for record in leaders[self.max_size :])
+
+        memory.delete(to_delete)
+
+        return {
+            "before": len(records),
+            "after": len(records) - len(to_delete),
+            "merged": merged,
+            "evicted": evicted,
+        }
+
+    def _cluster(self, records):
+        """Greedy leader clustering: each record joins the most similar earlier leader."""
+        clusters = []
+        # Leader vectors live in the first len(clusters) rows of a preallocated matrix
+        leaders = None
+        for record in records:
+            vector = np.asarray(record["embedding"], dtype=np.float32)
+            norm = np.linalg.norm(vector)
+            vector = vector / norm if norm else vector
+            if clusters:
+                similarities = leaders[: len(clusters)] @ vector
+                best = int(np.argmax(similarities))
+                if similarities[best] >= self.similarity_threshold:
+                    clusters[best].append(record)
+                    continue
+            if leaders is None:
+                leaders = np.empty((min(len(records), 64), len(vector)), dtype=np.float32)
+            elif len(clusters) == len(leaders):
+                # Grow geometrically so appending stays amortized O(d)
+                grown = np.empty((min(len(records), 2 * len(leaders)), len(vector)), dtype=np.float32)
+                grown[: len(leaders)] = leaders
+                leaders = grown
+            leaders[len(clusters)] = vector
+            clusters.append([record])
+        return clusters
@@ -1,6 +1,6 @@
 from langchain_core.tools import tool
 from typing import Annotated
-from tradingagents.dataflows.interface import route_to_vendor
+from tradingagents.dataflows.interface import route_to_vendor, aroute_to_vendor
 
 @tool
 def get_news(
@@ -69,3 +69,31 @@ def get_insider_transactions(
         str: A report of insider transaction data
     """
     return route_to_vendor("get_insider_transactions", ticker, curr_date)
+
+
+# Native coroutines used by ToolNode when the graph runs with ainvoke/astream
+
+async def aget_news(ticker: str, start_date: str, end_date: str) -> str:
+    """Async variant of get_news."""
+    return await aroute_to_vendor("get_news", ticker, start_date, end_date)
+
+
+async def aget_global_news(curr_date: str, look_back_days: int = 7, limit: int = 5) -> str:
+    """Async variant of get_global_news."""
+    return await aroute_to_vendor("get_global_news", curr_date, look_back_days, limit)
+
+
+async def aget_insider_sentiment(ticker: str, curr_date: str) -> str:
+    """Async variant of get_insider_sentiment."""
+    return await aroute_to_vendor("get_insider_sentiment", ticker, curr_date)
+
+
+async def aget_insider_transactions(ticker: str, curr_date: str) -> str:
+    """Async variant of get_insider_transactions."""
+    return await aroute_to_vendor("get_insider_transactions", ticker, curr_date)
+
+
+get_news.coroutine = aget_news
+get_global_news.coroutine = aget_global_news
+get_insider_sentiment.coroutine = aget_insider_sentiment
+get_insider_transactions.coroutine = aget_insider_transactions
@@ -0,0 +1,228 @@
+import json
+import os
+import threading
+
+import numpy as np
+
+
+class NumpyVectorCollection:
+    """In-process vector collection exposing the subset of the Chroma collection API used by
+    FinancialSituationMemory (add/query/get/update/delete/count).
+
+    Vectors are kept L2-normalized in a float32 matrix, so an exact top-k search is a single
+    matrix-vector product. With a persist directory the matrix is saved as a .npy file and
+    memory-mapped on load; documents and metadata are kept in a JSON file next to it.
+
+    Writers build new lists/matrices and swap them in under the lock (files are replaced
+    atomically), so readers work on a consistent snapshot without holding the lock while
+    they compute.
+    """
+
+    def __init__(self, name, persist_dir=None):
+        self.name = name
+        self.path = os.path.join(persist_dir, name) if persist_dir else None
+        self._lock = threading.Lock()
+        self._ids = []
+        self._documents = []
+        self._metadatas = []
+        self._vectors = None
+        if self.path and os.path.exists(self._records_file):
+            self._load()
+
+    @property
+    def _records_file(self):
+        return os.path.join(self.path, "records.json")
+
+    @property
+    def _vectors_file(self):
+        return os.path.join(self.path, "vectors.npy")
+
+    def _load(self):
+        with open(self._records_file, "r", encoding="utf-8") as f:
+            records = json.load(f)
+        self._ids = records["ids"]
+        self._documents = records["documents"]
+        self._metadatas = records["metadatas"]
+        if self._ids:
+            self._vectors = np.load(self._vectors_file, mmap_mode="r")
+
+    def _save(self, vectors_changed=True):
+        if not self.path:
+            return
+        os.makedirs(self.path, exist_ok=True)
+        if vectors_changed:
+            # Written to a temporary file and swapped in: a reader still holding the
+            # previous memory map keeps its (unlinked) file instead of seeing it truncated
+            vectors = self._vectors if self._vectors is not None else np.zeros((0, 0), np.float32)
+            tmp_file = f"{self._vectors_file}.tmp"
+            with open(tmp_file, "wb") as f:
+                np.save(f, np.ascontiguousarray(vectors))
+            os.replace(tmp_file, self._vectors_file)
+        tmp_file = f"{self._records_file}.tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "ids": self._ids,
+                    "documents": self._documents,
+                    "metadatas": self._metadatas,
+                },
+                f,
+            )
+        os.replace(tmp_file, self._records_file)
+        if vectors_changed and self._ids:
+            self._vectors = np.load(self._vectors_file, mmap_mode="r")
+
+    def _snapshot(self):
+        """(ids, documents, metadatas, vectors) as of now; writers never mutate them in place."""
+        with self._lock:
+            return self._ids, self._documents, self._metadatas, self._vectors
+
+    def count(self):
+        with self._lock:
+            return len(self._ids)
+
+    def add(self, ids, embeddings, documents=None, metadatas=None):
+        if not ids:
+            return
+        vectors = normalize_rows(np.asarray(embeddings, dtype=np.float32))
+        with self._lock:
+            existing = set(self._ids)
+            duplicates = [i for i in ids if i in existing]
+            if duplicates:
+                raise ValueError(f"Duplicate ids in collection '{self.name}': {duplicates}")
+            self._ids = self._ids + list(ids)
+            self._documents = self._documents + list(documents or [None] * len(ids))
+            self._metadatas = self._metadatas + list(metadatas or [{} for _ in ids])
+            if self._vectors is None or len(self._vectors) == 0:
+                self._vectors = vectors
+            else:
+                self._vectors = np.vstack([self._vectors, vectors])
+            self._save()
+
+    def query(self, query_embeddings, n_results=10, where=None, include=None):
+        include = include or ["metadatas", "documents", "distances"]
+        ids, documents, metadatas, vectors = self._snapshot()
+        candidates = _matching_indices(metadatas, where)
+        results = {"ids": [], "documents": [], "metadatas": [], "distances": []}
+
+        for query in query_embeddings:
+            query = normalize_rows(np.asarray([query], dtype=np.float32))[0]
+            if len(candidates) == 0:
+                top = np.zeros(0, dtype=int)
+                similarities = np.zeros(0, dtype=np.float32)
+            else:
+                similarities = vectors[candidates] @ query
+                k = min(n_results, len(candidates))
+                top = np.argpartition(-similarities, k - 1)[:k]
+                top = top[np.argsort(-similarities[top])]
+
+            indices = [int(candidates[i]) for i in top]
+            results["ids"].append([ids[i] for i in indices])
+            results["documents"].append([documents[i] for i in indices])
+            results["metadatas"].append([metadatas[i] for i in indices])
+            # Squared L2 distance between unit vectors, matching Chroma's default space
+            results["distances"].append([float(2 - 2 * similarities[i]) for i in top])
+
+        return {key: value for key, value in results.items() if key == "ids" or key in include}
+
+    def get(self, ids=None, where=None, include=None):
+        include = include or ["metadatas", "documents"]
+        all_ids, documents, metadatas, vectors = self._snapshot()
+        indices = _select(all_ids, metadatas, ids, where)
+
+        results = {"ids": [all_ids[i] for i in indices]}
+        if "documents" in include:
+            results["documents"] = [documents[i] for i in indices]
+        if "metadatas" in include:
+            results["metadatas"] = [metadatas[i] for i in indices]
+        if "embeddings" in include:
+            results["embeddings"] = (
+                np.asarray(vectors[indices]) if len(indices) else np.zeros((0, 0))
+            )
+        return results
+
+    def update(self, ids, metadatas=None, documents=None):
+        with self._lock:
+            positions = {id_: i for i, id_ in enumerate(self._ids)}
+            new_metadatas = list(self._metadatas)
+            new_documents = list(self._documents)
+            for j, id_ in enumerate(ids):
+                if id_ not in positions:
+                    continue
+                if metadatas is not None:
+                    new_metadatas[positions[id_]] = metadatas[j]
+                if documents is not None:
+                    new_documents[positions[id_]] = documents[j]
+            self._metadatas = new_metadatas
+            self._documents = new_documents
+            self._save(vectors_changed=False)
+
+    def delete(self, ids=None, where=None):
+        with self._lock:
+            removed = {
+                self._ids[i] for i in _select(self._ids, self._metadatas, ids, where)
+            }
+            if not removed:
+                return
+            keep = [i for i, id_ in enumerate(self._ids) if id_ not in removed]
+            self._ids = [self._ids[i] for i in keep]
+            self._documents = [self._documents[i] for i in keep]
+            self._metadatas = [self._metadatas[i] for i in keep]
+            self._vectors = np.asarray(self._vectors[keep]) if keep else None
+            self._save()
+
+
+def _matching_indices(metadatas, where):
+    if not where:
+        return np.arange(len(metadatas))
+    return np.asarray(
+        [i for i, metadata in enumerate(metadatas) if _matches(metadata, where)],
+        dtype=int,
+    )
+
+
+def _select(all_ids, metadatas, ids, where):
+    """Indices of the records matching the where clause and, if given, the ids."""
+    indices = _matching_indices(metadatas, where)
+    if ids is not None:
+        wanted = set(ids)
+        indices = [i for i in indices if all_ids[i] in wanted]
+    return indices
+
+
+_OPERATORS = {
+    "$eq": lambda value, target: value == target,
+    "$ne": lambda value, target: value != target,
+    "$in": lambda value, target: value in target,
+    "$nin": lambda value, target: value not in target,
+    "$lt": lambda value, target: value is not None and value < target,
+    "$lte": lambda value, target: value is not None and value <= target,
+    "$gt": lambda value, target: value is not None and value > target,
+    "$gte": lambda value, target: value is not None and value >= target,
+}
+
+
+def _matches(metadata, where):
+    """Evaluate a Chroma-style where clause against one metadata dict."""
+    for key, condition in where.items():
+        if key == "$and":
+            if not all(_matches(metadata, clause) for clause in condition):
+                return False
+        elif key == "$or":
+            if not any(_matches(metadata, clause) for clause in condition):
+                return False
+        elif isinstance(condition, dict):
+            value = metadata.get(key)
+            for operator, target in condition.items():
+                if not _OPERATORS[operator](value, target):
+                    return False
+        elif metadata.get(key) != condition:
+            return False
+    return True
+
+
+def normalize_rows(vectors):
+    """L2-normalize the rows of a 2-D array, leaving zero rows untouched."""
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
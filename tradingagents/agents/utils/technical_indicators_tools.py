@@ -1,6 +1,6 @@
 from langchain_core.tools import tool
 from typing import Annotated
-from tradingagents.dataflows.interface import route_to_vendor
+from tradingagents.dataflows.interface import route_to_vendor, aroute_to_vendor
 
 @tool
 def get_indicators(
@@ -20,4 +20,14 @@ def get_indicators(
     Returns:
         str: A formatted dataframe containing the technical indicators for the specified ticker symbol and indicator.
     """
-    return route_to_vendor("get_indicators", symbol, indicator, curr_date, look_back_days)
\ No newline at end of file
+    return route_to_vendor("get_indicators", symbol, indicator, curr_date, look_back_days)
+
+
+# Native coroutines used by ToolNode when the graph runs with ainvoke/astream
+
+async def aget_indicators(symbol: str, indicator: str, curr_date: str, look_back_days: int = 30) -> str:
+    """Async variant of get_indicators."""
+    return await aroute_to_vendor("get_indicators", symbol, indicator, curr_date, look_back_days)
+
+
+get_indicators.coroutine = aget_indicators
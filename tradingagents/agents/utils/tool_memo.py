@@ -0,0 +1,142 @@
+import asyncio
+import json
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+
+from langchain_core.tools import StructuredTool
+
+from tradingagents.instrumentation.metrics import observe_cache
+from tradingagents.instrumentation.tracing import record_event
+
+# Memo of the propagation running in the current context (None outside a run)
+_current_memo: ContextVar[Optional["ToolMemo"]] = ContextVar("tool_memo", default=None)
+
+
+class ToolMemo:
+    """Tool results of one propagation, keyed by (tool name, arguments).
+
+    Concurrent identical calls (e.g. parallel analysts both asking for the same news
+    window) wait for the first one instead of hitting the vendor twice. Vendor error
+    strings are handed to the waiting callers but not memoized, so a transient failure is
+    retried by the next call.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._results: Dict[str, Any] = {}
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._pending: Dict[str, "asyncio.Future"] = {}
+        self._counts: Dict[str, Dict[str, int]] = {}
+
+    def call(self, tool_name: str, kwargs: Dict[str, Any], compute):
+        key = _memo_key(tool_name, kwargs)
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            with self._lock:
+                hit = key in self._results
+                self._count(tool_name, hit)
+                if hit:
+                    return self._results[key]
+            result = compute()
+            if _memoizable(result):
+                with self._lock:
+                    self._results[key] = result
+            return result
+
+    async def acall(self, tool_name: str, kwargs: Dict[str, Any], compute):
+        key = _memo_key(tool_name, kwargs)
+        with self._lock:
+            if key in self._results:
+                self._count(tool_name, True)
+                return self._results[key]
+            # An identical call already in flight is awaited rather than repeated
+            task = self._pending.get(key)
+            self._count(tool_name, task is not None)
+            if task is None:
+                task = asyncio.ensure_future(compute())
+                self._pending[key] = task
+                task.add_done_callback(lambda done: self._settle(key, done))
+        # Shielded, so one cancelled caller does not cancel the call the others await
+        return await asyncio.shield(task)
+
+    def _settle(self, key, task):
+        with self._lock:
+            if self._pending.get(key) is task:
+                del self._pending[key]
+            if not task.cancelled() and task.exception() is None and _memoizable(task.result()):
+                self._results[key] = task.result()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hits and misses of this run, in total and per tool."""
+        with self._lock:
+            by_tool = {name: dict(counts) for name, counts in self._counts.items()}
+        return {
+            "hits": sum(counts["hits"] for counts in by_tool.values()),
+            "misses": sum(counts["misses"] for counts in by_tool.values()),
+            "by_tool": by_tool,
+        }
+
+    def clear(self):
+        """Drop the memoized results (the counters are kept)."""
+        with self._lock:
+            self._results.clear()
+            self._key_locks.clear()
+            self._pending.clear()
+
+    def _count(self, tool_name, hit):
+        counts = self._counts.setdefault(tool_name, {"hits": 0, "misses": 0})
+        counts["hits" if hit else "misses"] += 1
+        record_event("tool_memo", "cache", tool=tool_name, cache_hit=hit)
+        observe_cache("tool_memo", hit)
+
+
+@contextmanager
+def tool_memo_scope():
+    """Memoize tool calls made within the block (one propagation) and clear them after."""
+    memo = ToolMemo()
+    token = _current_memo.set(memo)
+    try:
+        yield memo
+    finally:
+        _current_memo.reset(token)
+        memo.clear()
+
+
+def memoize_tool(tool: StructuredTool) -> StructuredTool:
+    """Copy of a tool that reuses results of identical calls within a tool_memo_scope.
+
+    Outside a scope the copy behaves exactly like the original tool.
+    """
+
+    def run(**kwargs):
+        memo = _current_memo.get()
+        if memo is None:
+            return tool.func(**kwargs)
+        return memo.call(tool.name, kwargs, lambda: tool.func(**kwargs))
+
+    async def arun(**kwargs):
+        memo = _current_memo.get()
+        if memo is None:
+            return await tool.coroutine(**kwargs)
+        return await memo.acall(tool.name, kwargs, lambda: tool.coroutine(**kwargs))
+
+    return StructuredTool.from_function(
+        func=run,
+        coroutine=arun if tool.coroutine is not None else None,
+        name=tool.name,
+        description=tool.description,
+        args_schema=tool.args_schema,
+        infer_schema=False,
+    )
+
+
+def _memoizable(result):
+    # Vendors report failures as "Error ..." strings rather than raising
+    return not (isinstance(result, str) and result.lstrip().startswith("Error"))
+
+
+def _memo_key(tool_name, kwargs):
+    return f"{tool_name}:{json.dumps(kwargs, sort_keys=True, default=str)}"
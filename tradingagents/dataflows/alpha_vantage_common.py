@@ -4,6 +4,10 @@ import pandas as pd
 import json
 from datetime import datetime
 from io import StringIO
+from .errors import VendorRateLimitError
+from .logging_utils import get_vendor_logger
+
+logger = get_vendor_logger("alpha_vantage")
 
 API_BASE_URL = "https://www.alphavantage.co/query"
 
@@ -35,7 +39,7 @@ def format_datetime_for_api(date_input) -> str:
     else:
         raise ValueError(f"Date must be string or datetime object, got {type(date_input)}")
 
-class AlphaVantageRateLimitError(Exception):
+class AlphaVantageRateLimitError(VendorRateLimitError):
     """Exception raised when Alpha Vantage API rate limit is exceeded."""
     pass
 
@@ -118,5 +122,5 @@ def _filter_csv_by_date_range(csv_data: str, start_date: str, end_date: str) ->
 
     except Exception as e:
         # If filtering fails, return original data with a warning
-        print(f"Warning: Failed to filter CSV data by date range: {e}")
+        logger.warning("Failed to filter CSV data by date range: %s", e)
         return csv_data
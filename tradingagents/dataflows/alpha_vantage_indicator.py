@@ -1,4 +1,7 @@
 from .alpha_vantage_common import _make_api_request
+from .logging_utils import get_vendor_logger
+
+logger = get_vendor_logger("alpha_vantage")
 
 def get_indicator(
     symbol: str,
@@ -218,5 +221,5 @@ def get_indicator(
         return result_str
 
     except Exception as e:
-        print(f"Error getting Alpha Vantage indicator data for {indicator}: {e}")
+        logger.error("Error getting Alpha Vantage indicator data for %s: %s", indicator, e)
         return f"Error retrieving {indicator} data: {str(e)}"
@@ -1,10 +1,15 @@
 import tradingagents.default_config as default_config
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Dict, Optional
 
 # Use default config but allow it to be overridden
 _config: Optional[Dict] = None
 DATA_DIR: Optional[str] = None
 
+# Config of the propagation running in the current context (None outside a run)
+_run_config: ContextVar[Optional[Dict]] = ContextVar("dataflows_run_config", default=None)
+
 
 def initialize_config():
     """Initialize the configuration with default values."""
@@ -24,11 +29,37 @@ def set_config(config: Dict):
 
 
 def get_config() -> Dict:
-    """Get the current configuration."""
+    """Get the current configuration (the run's own inside a config_scope)."""
+    run_config = _run_config.get()
+    if run_config is not None:
+        return run_config.copy()
     if _config is None:
         initialize_config()
     return _config.copy()
 
 
+@contextmanager
+def config_scope(config: Dict):
+    """Serve `config`, merged over the process-wide configuration, from get_config in this context.
+
+    The override is a context variable, so it follows the run into the threads and tasks
+    that copy its context (LangGraph nodes, tool calls) while concurrent runs of other
+    graphs keep their own vendor routing, replay mode and budgets.
+
+    Args:
+        config: Configuration values of the run
+
+    Yields:
+        The merged configuration
+    """
+    merged = get_config()
+    merged.update(config)
+    token = _run_config.set(merged)
+    try:
+        yield merged
+    finally:
+        _run_config.reset(token)
+
+
 # Initialize with default config
 initialize_config()
@@ -0,0 +1,6 @@
+class VendorRateLimitError(Exception):
+    """Raised by a vendor implementation when its API rate limit is exceeded.
+
+    Defined apart from the vendor modules so the router can catch it without importing
+    them (and their SDKs) up front.
+    """
@@ -11,6 +11,9 @@ from tenacity import (
     retry_if_exception_type,
     retry_if_result,
 )
+from .logging_utils import get_vendor_logger
+
+logger = get_vendor_logger("google")
 
 
 def is_rate_limited(response):
@@ -88,7 +91,7 @@ def getNewsData(query, start_date, end_date):
                         }
                     )
                 except Exception as e:
-                    print(f"Error processing result: {e}")
+                    logger.debug("Error processing result: %s", e)
                     # If one of the fields is not found, skip this result
                     continue
 
@@ -102,7 +105,7 @@ def getNewsData(query, start_date, end_date):
             page += 1
 
         except Exception as e:
-            print(f"Failed after multiple retries: {e}")
+            logger.warning("Failed after multiple retries: %s", e)
             break
 
     return news_results
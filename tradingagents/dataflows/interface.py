@@ -1,24 +1,17 @@
+import importlib
+import logging
+import time
+from functools import lru_cache
 from typing import Annotated
 
-# Import from vendor-specific modules
-from .local import get_YFin_data, get_finnhub_news, get_finnhub_company_insider_sentiment, get_finnhub_company_insider_transactions, get_simfin_balance_sheet, get_simfin_cashflow, get_simfin_income_statements, get_reddit_global_news, get_reddit_company_news
-from .y_finance import get_YFin_data_online, get_stock_stats_indicators_window, get_balance_sheet as get_yfinance_balance_sheet, get_cashflow as get_yfinance_cashflow, get_income_statement as get_yfinance_income_statement, get_insider_transactions as get_yfinance_insider_transactions
-from .google import get_google_news
-from .openai import get_stock_news_openai, get_global_news_openai, get_fundamentals_openai
-from .alpha_vantage import (
-    get_stock as get_alpha_vantage_stock,
-    get_indicator as get_alpha_vantage_indicator,
-    get_fundamentals as get_alpha_vantage_fundamentals,
-    get_balance_sheet as get_alpha_vantage_balance_sheet,
-    get_cashflow as get_alpha_vantage_cashflow,
-    get_income_statement as get_alpha_vantage_income_statement,
-    get_insider_transactions as get_alpha_vantage_insider_transactions,
-    get_news as get_alpha_vantage_news
-)
-from .alpha_vantage_common import AlphaVantageRateLimitError
-
 # Configuration and routing logic
 from .config import get_config
+from .errors import VendorRateLimitError
+from .logging_utils import get_vendor_logger, log_vendor_attempt
+from .replay import REPLAY_VENDOR, ReplayMissError, make_replay_vendor, record_response, replay_mode
+from tradingagents.instrumentation.tracing import trace_span
+
+logger = logging.getLogger(__name__)
 
 # Tools organized by category
 TOOLS_CATEGORIES = {
@@ -58,64 +51,93 @@ VENDOR_LIST = [
     "local",
     "yfinance",
     "openai",
-    "google"
+    "google",
+    "replay",
 ]
 
-# Mapping of methods to their vendor-specific implementations
+# Mapping of methods to their vendor-specific implementations, as "module:function"
+# references. A vendor module (and the SDKs it pulls in: pandas, yfinance, openai, ...)
+# is only imported the first time one of its functions is routed to.
 VENDOR_METHODS = {
     # core_stock_apis
     "get_stock_data": {
-        "alpha_vantage": get_alpha_vantage_stock,
-        "yfinance": get_YFin_data_online,
-        "local": get_YFin_data,
+        "alpha_vantage": "alpha_vantage:get_stock",
+        "yfinance": "y_finance:get_YFin_data_online",
+        "local": "local:get_YFin_data",
     },
     # technical_indicators
     "get_indicators": {
-        "alpha_vantage": get_alpha_vantage_indicator,
-        "yfinance": get_stock_stats_indicators_window,
-        "local": get_stock_stats_indicators_window
+        "alpha_vantage": "alpha_vantage:get_indicator",
+        "yfinance": "y_finance:get_stock_stats_indicators_window",
+        "local": "y_finance:get_stock_stats_indicators_window"
     },
     # fundamental_data
     "get_fundamentals": {
-        "alpha_vantage": get_alpha_vantage_fundamentals,
-        "openai": get_fundamentals_openai,
+        "alpha_vantage": "alpha_vantage:get_fundamentals",
+        "openai": "openai:get_fundamentals_openai",
     },
     "get_balance_sheet": {
-        "alpha_vantage": get_alpha_vantage_balance_sheet,
-        "yfinance": get_yfinance_balance_sheet,
-        "local": get_simfin_balance_sheet,
+        "alpha_vantage": "alpha_vantage:get_balance_sheet",
+        "yfinance": "y_finance:get_balance_sheet",
+        "local": "local:get_simfin_balance_sheet",
     },
     "get_cashflow": {
-        "alpha_vantage": get_alpha_vantage_cashflow,
-        "yfinance": get_yfinance_cashflow,
-        "local": get_simfin_cashflow,
+        "alpha_vantage": "alpha_vantage:get_cashflow",
+        "yfinance": "y_finance:get_cashflow",
+        "local": "local:get_simfin_cashflow",
     },
     "get_income_statement": {
-        "alpha_vantage": get_alpha_vantage_income_statement,
-        "yfinance": get_yfinance_income_statement,
-        "local": get_simfin_income_statements,
+        "alpha_vantage": "alpha_vantage:get_income_statement",
+        "yfinance": "y_finance:get_income_statement",
+        "local": "local:get_simfin_income_statements",
     },
     # news_data
     "get_news": {
-        "alpha_vantage": get_alpha_vantage_news,
-        "openai": get_stock_news_openai,
-        "google": get_google_news,
-        "local": [get_finnhub_news, get_reddit_company_news, get_google_news],
+        "alpha_vantage": "alpha_vantage:get_news",
+        "openai": "openai:get_stock_news_openai",
+        "google": "google:get_google_news",
+        "local": ["local:get_finnhub_news", "local:get_reddit_company_news", "google:get_google_news"],
     },
     "get_global_news": {
-        "openai": get_global_news_openai,
-        "local": get_reddit_global_news
+        "openai": "openai:get_global_news_openai",
+        "local": "local:get_reddit_global_news"
     },
     "get_insider_sentiment": {
-        "local": get_finnhub_company_insider_sentiment
+        "local": "local:get_finnhub_company_insider_sentiment"
     },
     "get_insider_transactions": {
-        "alpha_vantage": get_alpha_vantage_insider_transactions,
-        "yfinance": get_yfinance_insider_transactions,
-        "local": get_finnhub_company_insider_transactions,
+        "alpha_vantage": "alpha_vantage:get_insider_transactions",
+        "yfinance": "y_finance:get_insider_transactions",
+        "local": "local:get_finnhub_company_insider_transactions",
     },
 }
 
+# Every method can be served from a recorded archive (see replay.py)
+for _method in VENDOR_METHODS:
+    VENDOR_METHODS[_method][REPLAY_VENDOR] = make_replay_vendor(_method)
+
+@lru_cache(maxsize=None)
+def _import_vendor_function(ref: str):
+    module_name, function_name = ref.split(":")
+    return getattr(importlib.import_module(f".{module_name}", __package__), function_name)
+
+
+def resolve_vendor_impl(impl):
+    """Vendor implementation(s) behind a VENDOR_METHODS entry, importing the module on first use.
+
+    Args:
+        impl: A "module:function" reference (relative to tradingagents.dataflows), a
+            callable, or a list of either
+
+    Returns:
+        The callable, or a list of callables for a list entry
+    """
+    if isinstance(impl, list):
+        return [resolve_vendor_impl(item) for item in impl]
+    if isinstance(impl, str):
+        return _import_vendor_function(impl)
+    return impl
+
 def get_category_for_method(method: str) -> str:
     """Get the category that contains the specified method."""
     for category, info in TOOLS_CATEGORIES.items():
@@ -129,6 +151,10 @@ def get_vendor(category: str, method: str = None) -> str:
     """
     config = get_config()
 
+    # Replay mode serves every category from the recorded archive
+    if replay_mode() == "replay":
+        return REPLAY_VENDOR
+
     # Check tool-level configuration first (if method provided)
     if method:
         tool_vendors = config.get("tool_vendors", {})
@@ -153,15 +179,20 @@ def route_to_vendor(method: str, *args, **kwargs):
     all_available_vendors = list(VENDOR_METHODS[method].keys())
     
     # Create fallback vendor list: primary vendors first, then remaining vendors as fallbacks
+    # (the replay vendor is only ever used when configured explicitly)
     fallback_vendors = primary_vendors.copy()
     for vendor in all_available_vendors:
-        if vendor not in fallback_vendors:
+        if vendor not in fallback_vendors and vendor != REPLAY_VENDOR:
             fallback_vendors.append(vendor)
 
-    # Debug: Print fallback ordering
-    primary_str = " → ".join(primary_vendors)
-    fallback_str = " → ".join(fallback_vendors)
-    print(f"DEBUG: {method} - Primary: [{primary_str}] | Full fallback order: [{fallback_str}]")
+    # Fallback ordering (joined only when someone reads it)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "%s - Primary: [%s] | Full fallback order: [%s]",
+            method,
+            " → ".join(primary_vendors),
+            " → ".join(fallback_vendors),
+        )
 
     # Track results and execution state
     results = []
@@ -170,12 +201,16 @@ def route_to_vendor(method: str, *args, **kwargs):
     successful_vendor = None
 
     for vendor in fallback_vendors:
+        vendor_logger = get_vendor_logger(vendor)
         if vendor not in VENDOR_METHODS[method]:
             if vendor in primary_vendors:
-                print(f"INFO: Vendor '{vendor}' not supported for method '{method}', falling back to next vendor")
+                vendor_logger.info(
+                    "Vendor '%s' not supported for method '%s', falling back to next vendor",
+                    vendor,
+                    method,
+                )
             continue
 
-        vendor_impl = VENDOR_METHODS[method][vendor]
         is_primary_vendor = vendor in primary_vendors
         vendor_attempt_count += 1
 
@@ -183,62 +218,140 @@ def route_to_vendor(method: str, *args, **kwargs):
         if is_primary_vendor:
             any_primary_vendor_attempted = True
 
-        # Debug: Print current attempt
-        vendor_type = "PRIMARY" if is_primary_vendor else "FALLBACK"
-        print(f"DEBUG: Attempting {vendor_type} vendor '{vendor}' for {method} (attempt #{vendor_attempt_count})")
+        vendor_logger.debug(
+            "Attempting %s vendor '%s' for %s (attempt #%d)",
+            "PRIMARY" if is_primary_vendor else "FALLBACK",
+            vendor,
+            method,
+            vendor_attempt_count,
+        )
+
+        vendor_ref = VENDOR_METHODS[method][vendor]
+        try:
+            vendor_impl = resolve_vendor_impl(vendor_ref)
+        except ImportError as e:
+            # The vendor's SDK is not installed; treat it like a failed attempt
+            log_vendor_attempt(
+                method, vendor, str(vendor_ref), vendor_attempt_count,
+                is_primary_vendor, 0.0, "error", str(e),
+            )
+            vendor_logger.warning("Vendor '%s' unavailable for %s: %s", vendor, method, e)
+            continue
 
         # Handle list of methods for a vendor
         if isinstance(vendor_impl, list):
             vendor_methods = [(impl, vendor) for impl in vendor_impl]
-            print(f"DEBUG: Vendor '{vendor}' has multiple implementations: {len(vendor_methods)} functions")
+            vendor_logger.debug(
+                "Vendor '%s' has multiple implementations: %d functions",
+                vendor,
+                len(vendor_methods),
+            )
         else:
             vendor_methods = [(vendor_impl, vendor)]
 
         # Run methods for this vendor
         vendor_results = []
         for impl_func, vendor_name in vendor_methods:
+            start = time.perf_counter()
             try:
-                print(f"DEBUG: Calling {impl_func.__name__} from vendor '{vendor_name}'...")
-                result = impl_func(*args, **kwargs)
+                vendor_logger.debug("Calling %s from vendor '%s'", impl_func.__name__, vendor_name)
+                with trace_span(
+                    method,
+                    "vendor",
+                    vendor=vendor_name,
+                    function=impl_func.__name__,
+                    attempt=vendor_attempt_count,
+                ) as span:
+                    result = impl_func(*args, **kwargs)
+                    span.set(output_chars=len(str(result)))
                 vendor_results.append(result)
-                print(f"SUCCESS: {impl_func.__name__} from vendor '{vendor_name}' completed successfully")
-                    
-            except AlphaVantageRateLimitError as e:
-                if vendor == "alpha_vantage":
-                    print(f"RATE_LIMIT: Alpha Vantage rate limit exceeded, falling back to next available vendor")
-                    print(f"DEBUG: Rate limit details: {e}")
+                log_vendor_attempt(
+                    method, vendor_name, impl_func.__name__, vendor_attempt_count,
+                    is_primary_vendor, time.perf_counter() - start, "success",
+                )
+                vendor_logger.debug(
+                    "%s from vendor '%s' completed successfully", impl_func.__name__, vendor_name
+                )
+
+            except VendorRateLimitError as e:
+                log_vendor_attempt(
+                    method, vendor_name, impl_func.__name__, vendor_attempt_count,
+                    is_primary_vendor, time.perf_counter() - start, "rate_limited", str(e),
+                )
+                vendor_logger.warning(
+                    "%s rate limit exceeded, falling back to next available vendor: %s",
+                    vendor,
+                    e,
+                )
                 # Continue to next vendor for fallback
                 continue
+            except ReplayMissError as e:
+                log_vendor_attempt(
+                    method, vendor_name, impl_func.__name__, vendor_attempt_count,
+                    is_primary_vendor, time.perf_counter() - start, "replay_miss", str(e),
+                )
+                if get_config().get("replay_strict", True):
+                    raise
+                vendor_logger.warning("%s, falling back to live vendors", e)
+                continue
             except Exception as e:
                 # Log error but continue with other implementations
-                print(f"FAILED: {impl_func.__name__} from vendor '{vendor_name}' failed: {e}")
+                log_vendor_attempt(
+                    method, vendor_name, impl_func.__name__, vendor_attempt_count,
+                    is_primary_vendor, time.perf_counter() - start, "error", str(e),
+                )
+                vendor_logger.warning(
+                    "%s from vendor '%s' failed: %s", impl_func.__name__, vendor_name, e
+                )
                 continue
 
         # Add this vendor's results
         if vendor_results:
             results.extend(vendor_results)
             successful_vendor = vendor
-            result_summary = f"Got {len(vendor_results)} result(s)"
-            print(f"SUCCESS: Vendor '{vendor}' succeeded - {result_summary}")
+            vendor_logger.debug(
+                "Vendor '%s' succeeded - got %d result(s)", vendor, len(vendor_results)
+            )
             
             # Stopping logic: Stop after first successful vendor for single-vendor configs
             # Multiple vendor configs (comma-separated) may want to collect from multiple sources
             if len(primary_vendors) == 1:
-                print(f"DEBUG: Stopping after successful vendor '{vendor}' (single-vendor config)")
                 break
         else:
-            print(f"FAILED: Vendor '{vendor}' produced no results")
+            vendor_logger.info("Vendor '%s' produced no results for %s", vendor, method)
 
     # Final result summary
     if not results:
-        print(f"FAILURE: All {vendor_attempt_count} vendor attempts failed for method '{method}'")
+        logger.error(
+            "All %d vendor attempts failed for method '%s'", vendor_attempt_count, method
+        )
         raise RuntimeError(f"All vendor implementations failed for method '{method}'")
     else:
-        print(f"FINAL: Method '{method}' completed with {len(results)} result(s) from {vendor_attempt_count} vendor attempt(s)")
+        logger.debug(
+            "Method '%s' completed with %d result(s) from %d vendor attempt(s)",
+            method,
+            len(results),
+            vendor_attempt_count,
+        )
 
     # Return single result if only one, otherwise concatenate as string
     if len(results) == 1:
-        return results[0]
+        result = results[0]
     else:
         # Convert all results to strings and concatenate
-        return '\n'.join(str(result) for result in results)
\ No newline at end of file
+        result = '\n'.join(str(result) for result in results)
+
+    if successful_vendor != REPLAY_VENDOR:
+        record_response(method, args, kwargs, result)
+    return result
+
+
+async def aroute_to_vendor(method: str, *args, **kwargs):
+    """Async variant of route_to_vendor.
+
+    The vendor implementations are blocking (requests/yfinance), so the routing runs in a
+    worker thread and the event loop stays free to drive other analyses meanwhile.
+    """
+    import asyncio
+
+    return await asyncio.to_thread(route_to_vendor, method, *args, **kwargs)
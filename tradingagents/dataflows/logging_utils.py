@@ -0,0 +1,93 @@
+import json
+import logging
+import os
+
+from tradingagents.instrumentation.metrics import observe_vendor_attempt
+
+# Root of the dataflows logger hierarchy:
+#   tradingagents.dataflows                  routing decisions and summaries
+#   tradingagents.dataflows.vendors.<vendor> per-vendor attempts and vendor module errors
+#   tradingagents.dataflows.attempts         one machine-readable record per vendor attempt
+LOGGER_NAME = "tradingagents.dataflows"
+ATTEMPT_LOGGER_NAME = f"{LOGGER_NAME}.attempts"
+
+# Library default: emit nothing unless the application configures logging
+logging.getLogger(LOGGER_NAME).addHandler(logging.NullHandler())
+
+attempt_logger = logging.getLogger(ATTEMPT_LOGGER_NAME)
+
+
+def get_vendor_logger(vendor: str) -> logging.Logger:
+    """Logger of one data vendor, e.g. tradingagents.dataflows.vendors.alpha_vantage."""
+    return logging.getLogger(f"{LOGGER_NAME}.vendors.{vendor}")
+
+
+def log_vendor_attempt(method, vendor, function, attempt, primary, latency, outcome, error=None):
+    """Emit the machine-readable record of one vendor attempt.
+
+    The attempt is counted in the vendor metrics (when enabled). The log record carries
+    a "vendor_attempt" dict (method, vendor, function, attempt, primary, latency_s,
+    outcome, error); nothing is built unless the attempts logger is enabled for INFO.
+    """
+    observe_vendor_attempt(method, vendor, outcome, latency)
+    if not attempt_logger.isEnabledFor(logging.INFO):
+        return
+    attempt_logger.info(
+        "%s via %s (attempt #%d): %s in %.3fs",
+        method,
+        vendor,
+        attempt,
+        outcome,
+        latency,
+        extra={
+            "vendor_attempt": {
+                "method": method,
+                "vendor": vendor,
+                "function": function,
+                "attempt": attempt,
+                "primary": primary,
+                "latency_s": round(latency, 4),
+                "outcome": outcome,
+                "error": error,
+            }
+        },
+    )
+
+
+class VendorAttemptJsonFormatter(logging.Formatter):
+    """Formats vendor attempt records as one JSON object per line."""
+
+    def format(self, record):
+        payload = {"time": record.created}
+        payload.update(getattr(record, "vendor_attempt", {"message": record.getMessage()}))
+        return json.dumps(payload, default=str)
+
+
+def configure_dataflow_logging(config):
+    """Apply the dataflows logging settings of a config.
+
+    Keys:
+        dataflow_log_level: Level of the whole dataflows hierarchy, e.g. "WARNING"
+        vendor_log_levels: Per-vendor overrides, e.g. {"alpha_vantage": "DEBUG"}
+        vendor_attempt_log: Path of a JSON Lines file receiving every vendor attempt
+    """
+    level = config.get("dataflow_log_level")
+    if level:
+        logging.getLogger(LOGGER_NAME).setLevel(str(level).upper())
+
+    for vendor, vendor_level in (config.get("vendor_log_levels") or {}).items():
+        get_vendor_logger(vendor).setLevel(str(vendor_level).upper())
+
+    path = config.get("vendor_attempt_log")
+    if path:
+        path = os.path.abspath(path)
+        already_attached = any(
+            isinstance(handler, logging.FileHandler) and handler.baseFilename == path
+            for handler in attempt_logger.handlers
+        )
+        if not already_attached:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            handler = logging.FileHandler(path, encoding="utf-8")
+            handler.setFormatter(VendorAttemptJsonFormatter())
+            attempt_logger.addHandler(handler)
+        attempt_logger.setLevel(logging.INFO)
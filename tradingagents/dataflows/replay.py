@@ -0,0 +1,159 @@
+import gzip
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from tradingagents.instrumentation.metrics import observe_cache
+
+from .config import get_config
+from .logging_utils import get_vendor_logger
+
+logger = get_vendor_logger("replay")
+
+REPLAY_VENDOR = "replay"
+
+
+class ReplayMissError(LookupError):
+    """Raised by the replay vendor when the archive holds no response for a call."""
+
+
+def replay_key(method: str, args, kwargs) -> str:
+    """Archive key of one routed call: the method plus its arguments, as canonical JSON."""
+    return json.dumps(
+        [method, list(args), {name: kwargs[name] for name in sorted(kwargs)}],
+        default=str,
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+
+
+class ReplayArchive:
+    """Vendor responses keyed by (method, args), stored as gzip-compressed JSON Lines.
+
+    Each recorded call is appended as one {"key", "method", "response", "recorded_at"}
+    line, so a crashed run keeps everything recorded so far. Responses are stored as
+    text, i.e. what the agents' tools hand to the LLM; identical responses are not
+    written twice and the latest recording of a key wins.
+    """
+
+    def __init__(self, path):
+        """Initialize the archive.
+
+        Args:
+            path: Archive file (conventionally *.jsonl.gz; a plain .jsonl is read and written uncompressed)
+        """
+        self.path = os.path.abspath(path)
+        self._lock = threading.Lock()
+        self._responses: Optional[Dict[str, str]] = None
+
+    def _opener(self):
+        return gzip.open if self.path.endswith(".gz") else open
+
+    def _load(self) -> Dict[str, str]:
+        if self._responses is None:
+            responses = {}
+            if os.path.exists(self.path):
+                with self._opener()(self.path, "rt", encoding="utf-8") as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        try:
+                            entry = json.loads(line)
+                        except json.JSONDecodeError:
+                            # A line cut short by an interrupted write
+                            continue
+                        responses[entry["key"]] = entry["response"]
+            self._responses = responses
+        return self._responses
+
+    def get(self, method: str, args, kwargs) -> str:
+        """Recorded response of a call; raises ReplayMissError if there is none."""
+        key = replay_key(method, args, kwargs)
+        with self._lock:
+            responses = self._load()
+            observe_cache("replay", key in responses)
+            if key not in responses:
+                raise ReplayMissError(f"No recorded response for {key} in {self.path}")
+            return responses[key]
+
+    def record(self, method: str, args, kwargs, response: Any):
+        """Store the response of a call (converted to text)."""
+        key = replay_key(method, args, kwargs)
+        response = response if isinstance(response, str) else str(response)
+        with self._lock:
+            responses = self._load()
+            if responses.get(key) == response:
+                return
+            responses[key] = response
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            line = json.dumps(
+                {"key": key, "method": method, "response": response, "recorded_at": time.time()},
+                ensure_ascii=False,
+            )
+            with self._opener()(self.path, "at", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+    def __len__(self):
+        with self._lock:
+            return len(self._load())
+
+    def methods(self) -> Dict[str, int]:
+        """Number of recorded responses per method."""
+        counts: Dict[str, int] = {}
+        with self._lock:
+            for key in self._load():
+                method = json.loads(key)[0]
+                counts[method] = counts.get(method, 0) + 1
+        return counts
+
+
+_archives: Dict[str, ReplayArchive] = {}
+_archives_lock = threading.Lock()
+
+
+def replay_path(config=None) -> str:
+    """Archive path of a config: replay_path, or <results_dir>/replay/vendor_responses.jsonl.gz."""
+    config = config or get_config()
+    return config.get("replay_path") or os.path.join(
+        config.get("results_dir", "./results"), "replay", "vendor_responses.jsonl.gz"
+    )
+
+
+def get_archive(path=None) -> ReplayArchive:
+    """Shared archive instance of a path (default: the configured one)."""
+    path = os.path.abspath(path or replay_path())
+    with _archives_lock:
+        if path not in _archives:
+            _archives[path] = ReplayArchive(path)
+        return _archives[path]
+
+
+def replay_mode() -> Optional[str]:
+    """The configured replay_mode: None, "record" or "replay"."""
+    mode = get_config().get("replay_mode")
+    if mode not in (None, "record", "replay"):
+        raise ValueError(f"Unsupported replay_mode: {mode}")
+    return mode
+
+
+def make_replay_vendor(method: str):
+    """Vendor implementation of a method that serves responses from the archive."""
+
+    def replay_vendor(*args, **kwargs):
+        return get_archive().get(method, args, kwargs)
+
+    replay_vendor.__name__ = f"replay_{method}"
+    return replay_vendor
+
+
+def record_response(method: str, args, kwargs, response):
+    """Record a routed call's final response when replay_mode is "record"."""
+    if replay_mode() != "record":
+        return
+    try:
+        get_archive().record(method, args, kwargs, response)
+    except OSError as e:
+        logger.warning("Could not record %s response: %s", method, e)
@@ -3,8 +3,25 @@ import yfinance as yf
 from stockstats import wrap
 from typing import Annotated
 import os
+import threading
 from .config import get_config, DATA_DIR
 
+# yf.download shares module-level state between calls and is not thread-safe
+_yf_download_lock = threading.Lock()
+
+
+def download_daily_prices(symbol, start_date, end_date) -> pd.DataFrame:
+    """Daily auto-adjusted OHLCV from Yahoo Finance, one download at a time per process."""
+    with _yf_download_lock:
+        return yf.download(
+            symbol,
+            start=start_date,
+            end=end_date,
+            multi_level_index=False,
+            progress=False,
+            auto_adjust=True,
+        )
+
 
 class StockstatsUtils:
     @staticmethod
@@ -57,14 +74,7 @@ class StockstatsUtils:
                 data = pd.read_csv(data_file)
                 data["Date"] = pd.to_datetime(data["Date"])
             else:
-                data = yf.download(
-                    symbol,
-                    start=start_date,
-                    end=end_date,
-                    multi_level_index=False,
-                    progress=False,
-                    auto_adjust=True,
-                )
+                data = download_daily_prices(symbol, start_date, end_date)
                 data = data.reset_index()
                 data.to_csv(data_file, index=False)
 
@@ -3,7 +3,22 @@ from datetime import datetime
 from dateutil.relativedelta import relativedelta
 import yfinance as yf
 import os
-from .stockstats_utils import StockstatsUtils
+import threading
+from collections import OrderedDict
+from .config import get_config
+from .stockstats_utils import StockstatsUtils, download_daily_prices
+from .logging_utils import get_vendor_logger
+from tradingagents.instrumentation.metrics import observe_cache
+
+logger = get_vendor_logger("yfinance")
+
+# Price history used for indicators, shared by concurrent indicator tool calls: several
+# indicators requested in one LLM turn must not each download the same 15 years of data.
+# Least recently used frames are evicted beyond "price_history_cache_size", so a
+# long-running worker does not keep every ticker x day forever.
+_price_history_cache = OrderedDict()
+_price_history_locks = {}
+_price_history_guard = threading.Lock()
 
 def get_YFin_data_online(
     symbol: Annotated[str, "ticker symbol of the company"],
@@ -163,7 +178,7 @@ def get_stock_stats_indicators_window(
             ind_string += f"{date_str}: {value}\n"
         
     except Exception as e:
-        print(f"Error getting bulk stockstats data: {e}")
+        logger.warning("Error getting bulk stockstats data: %s", e)
         # Fallback to original implementation if bulk method fails
         ind_string = ""
         curr_date_dt = datetime.strptime(curr_date, "%Y-%m-%d")
@@ -231,21 +246,8 @@ def _get_stock_stats_bulk(
             f"{symbol}-YFin-data-{start_date_str}-{end_date_str}.csv",
         )
         
-        if os.path.exists(data_file):
-            data = pd.read_csv(data_file)
-            data["Date"] = pd.to_datetime(data["Date"])
-        else:
-            data = yf.download(
-                symbol,
-                start=start_date_str,
-                end=end_date_str,
-                multi_level_index=False,
-                progress=False,
-                auto_adjust=True,
-            )
-            data = data.reset_index()
-            data.to_csv(data_file, index=False)
-        
+        data = _load_price_history(symbol, start_date_str, end_date_str, data_file)
+
         df = wrap(data)
         df["Date"] = df["Date"].dt.strftime("%Y-%m-%d")
     
@@ -267,6 +269,40 @@ def _get_stock_stats_bulk(
     return result_dict
 
 
+def _load_price_history(symbol, start_date, end_date, data_file):
+    """Daily OHLCV for the indicator window, downloaded or read once per process.
+
+    Returns a copy, since stockstats adds indicator columns to the frame it wraps.
+    """
+    import pandas as pd
+
+    with _price_history_guard:
+        lock = _price_history_locks.setdefault(data_file, threading.Lock())
+
+    with lock:
+        with _price_history_guard:
+            data = _price_history_cache.get(data_file)
+            if data is not None:
+                _price_history_cache.move_to_end(data_file)
+        observe_cache("price_history", data is not None)
+        if data is None:
+            if os.path.exists(data_file):
+                data = pd.read_csv(data_file)
+                data["Date"] = pd.to_datetime(data["Date"])
+            else:
+                data = download_daily_prices(symbol, start_date, end_date)
+                data = data.reset_index()
+                data.to_csv(data_file, index=False)
+            max_size = max(1, get_config().get("price_history_cache_size", 32))
+            with _price_history_guard:
+                _price_history_cache[data_file] = data
+                while len(_price_history_cache) > max_size:
+                    evicted, _ = _price_history_cache.popitem(last=False)
+                    _price_history_locks.pop(evicted, None)
+
+    return data.copy()
+
+
 def get_stockstats_indicator(
     symbol: Annotated[str, "ticker symbol of the company"],
     indicator: Annotated[str, "technical indicator to get the analysis and report of"],
@@ -285,8 +321,11 @@ def get_stockstats_indicator(
             curr_date,
         )
     except Exception as e:
-        print(
-            f"Error getting stockstats indicator data for indicator {indicator} on {curr_date}: {e}"
+        logger.error(
+            "Error getting stockstats indicator data for indicator %s on %s: %s",
+            indicator,
+            curr_date,
+            e,
         )
         return ""
 
@@ -3,20 +3,94 @@ import os
 DEFAULT_CONFIG = {
     "project_dir": os.path.abspath(os.path.join(os.path.dirname(__file__), ".")),
     "results_dir": os.getenv("TRADINGAGENTS_RESULTS_DIR", "./results"),
+    "run_log_dir": "eval_results",     # Append-only per-ticker state logs (run_log.jsonl)
+    "run_log_compress": False,         # Gzip the state logs (run_log.jsonl.gz)
     "data_dir": "/Users/yluo/Documents/Code/ScAI/FR1-data",
     "data_cache_dir": os.path.join(
         os.path.abspath(os.path.join(os.path.dirname(__file__), ".")),
         "dataflows/data_cache",
     ),
     # LLM settings
-    "llm_provider": "google",
+    "llm_provider": "google",          # Options: openai, anthropic, google, ollama, openrouter, fake
     "deep_think_llm": "gemini-3-flash-preview",
     "quick_think_llm": "gemini-2.0-flash",
     "backend_url": None,  # Not needed for Google
+    # Fake provider settings (llm_provider "fake": offline, deterministic, no API calls)
+    "fake_llm_responses": None,        # Scripted replies cycled in call order (None = use the template)
+    "fake_llm_template": None,         # Reply template with {ticker}, {date}, {signal}, {filler} (None = built-in)
+    "fake_llm_signal": "HOLD",         # Signal written into templated replies
+    "fake_llm_latency": 0.0,           # Artificial seconds per call
+    "fake_llm_latency_jitter": 0.0,    # +/- seconds of deterministic jitter around fake_llm_latency
+    "fake_llm_output_tokens": 200,     # Approximate tokens per templated reply
+    "fake_llm_tool_calls": True,       # Call every bound tool once before answering
     # Debate and discussion settings
     "max_debate_rounds": 1,
     "max_risk_discuss_rounds": 1,
     "max_recur_limit": 100,
+    # Run the selected analysts concurrently, each with its own message channel
+    "parallel_analysts": False,
+    # Context budget settings
+    "context_budget_enabled": False,   # Compress reports and debate history in the debate prompts
+    "context_report_tokens": 1500,     # Max tokens per analyst report after compression
+    "context_history_tokens": 3000,    # Max tokens of debate history per prompt (newest turns verbatim)
+    "context_node_tokens": 12000,      # Max tokens of variable context per debate node prompt
+    # Memory settings
+    "memory_backend": "chroma",        # Options: chroma, numpy (in-process, no Chroma import)
+    "memory_dir": None,                # numpy backend: directory to persist/mmap vectors (None = in-memory)
+    "memory_chunk_size": 2000,         # Max characters per embedded situation chunk
+    "memory_max_chunks": 16,           # Max chunks embedded per situation
+    "memory_embedding_batch_size": 256,  # Max inputs per embeddings request
+    "memory_embedding_batch_chars": 200_000,  # Max total characters per embeddings request
+    "memory_rerank": False,            # Re-rank pooled matches by per-chunk similarity
+    "memory_rerank_candidates": 5,     # Pooled candidates fetched per requested match
+    "memory_compaction_threshold": 0.95,  # Cosine similarity treated as a duplicate situation
+    "memory_max_size": 1000,           # Max situations kept per role after compaction
+    "memory_filter_before_trade_date": False,  # Only retrieve lessons from earlier trade dates
+    "memory_filter_outcome_before_trade_date": False,  # Only retrieve lessons whose outcome date is earlier
+    "memory_filter_same_ticker": False,        # Only retrieve lessons about the same ticker
+    # Batch settings
+    "batch_max_workers": 4,            # Max concurrent propagations in propagate_batch
+    "graph_pool_size": 4,              # Graphs (one per config) kept alive by a GraphPool
+    # Reflection settings
+    "parallel_reflection": False,      # Run the five role reflections concurrently
+    "reflection_max_workers": 5,       # Max concurrent reflection LLM calls
+    # LLM response cache settings
+    "llm_cache_enabled": False,        # Replay identical LLM calls from a disk cache
+    "llm_cache_path": None,            # SQLite file (None = <data_cache_dir>/llm_cache.sqlite)
+    "llm_cache_nodes": None,           # Node types to cache (None = all): analysts, report_compressor,
+                                       # researchers, research_manager, trader, risk_debators,
+                                       # risk_manager, signal_processor, reflector
+    # Signal processing settings
+    "signal_fast_path": True,          # Parse BUY/SELL/HOLD markers, asking the LLM only if ambiguous
+    # Tracing settings
+    "tracing_enabled": False,          # Record spans for nodes, LLM calls, tool calls and vendor attempts
+    "tracing_path": None,              # JSONL span file (None = <results_dir>/traces/spans.jsonl)
+    "tracing_print_summary": True,     # Print a per-span timing table after each traced propagate
+    # Profiling settings
+    "profiling_enabled": False,        # Sample CPU profiles per node on every propagate (or propagate(profile=True))
+    "profiling_dir": None,             # Output root (None = <results_dir>/profiles)
+    "profiling_interval": 0.005,       # Seconds between stack samples
+    "profiling_top_n": 20,             # Hotspots listed in the summary
+    # Metrics settings (process-wide registry, see tradingagents.instrumentation.metrics)
+    "metrics_enabled": False,          # Count vendor calls, cache hits, LLM tokens/latency per node, queue depth
+    "metrics_port": None,              # Serve /metrics (Prometheus text) and /snapshot (JSON) on this port
+    "metrics_host": "127.0.0.1",       # Bind address of the metrics endpoint
+    # Checkpoint settings
+    "checkpoint_enabled": False,       # Persist graph checkpoints so interrupted runs resume
+    "checkpoint_path": None,           # SQLite file (None = <results_dir>/checkpoints.sqlite)
+    # Tool settings
+    "tool_memo_enabled": True,         # Reuse results of identical tool calls within one propagate run
+    "tool_max_concurrency": 8,         # Max tool calls of one LLM turn run concurrently (None = LangGraph default)
+    "price_history_cache_size": 32,    # Indicator price histories kept in memory per process (LRU)
+    # Dataflows logging (logger hierarchy "tradingagents.dataflows")
+    "dataflow_log_level": None,        # Level of all dataflows loggers, e.g. "DEBUG" (None = leave as configured)
+    "vendor_log_levels": {},           # Per-vendor levels, e.g. {"alpha_vantage": "DEBUG"}
+    "vendor_attempt_log": None,        # JSONL file receiving one record per vendor attempt
+    # Vendor record/replay
+    "replay_mode": None,               # None, "record" (archive every routed vendor response) or
+                                       # "replay" (serve all data from the archive, no network)
+    "replay_path": None,               # Archive file (None = <results_dir>/replay/vendor_responses.jsonl.gz)
+    "replay_strict": True,             # Replay: fail on a missing response instead of calling live vendors
     # Data vendor configuration
     # Category-level configuration (default for all tools in category)
     "data_vendors": {
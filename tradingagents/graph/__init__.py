@@ -6,6 +6,24 @@ from .setup import GraphSetup
 from .propagation import Propagator
 from .reflection import Reflector
 from .signal_processing import SignalProcessor
+from .batch import BatchRunner, BatchResult, write_batch_results
+from .pool import GraphPool, get_graph_pool
+from .run_log import RunLog
+
+# The backtester pulls in pandas; load it on first access
+_LAZY_ATTRIBUTES = {
+    "Backtester": ".backtest",
+    "summarize_backtest": ".backtest",
+    "save_backtest": ".backtest",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        import importlib
+
+        return getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     "TradingAgentsGraph",
@@ -14,4 +32,13 @@ __all__ = [
     "Propagator",
     "Reflector",
     "SignalProcessor",
+    "BatchRunner",
+    "BatchResult",
+    "write_batch_results",
+    "GraphPool",
+    "get_graph_pool",
+    "Backtester",
+    "summarize_backtest",
+    "save_backtest",
+    "RunLog",
 ]
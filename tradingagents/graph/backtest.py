@@ -0,0 +1,253 @@
+# TradingAgents/graph/backtest.py
+
+import os
+import re
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from tradingagents.dataflows.config import get_config
+from .batch import BatchRunner
+
+POSITIONS = {"BUY": 1, "HOLD": 0, "SELL": -1}
+
+
+class Backtester:
+    """Runs TradingAgentsGraph over a range of trading days and scores its decisions.
+
+    Price history is downloaded once per ticker and cached; forward returns are computed
+    from it. Trading days are processed in chronological waves: all jobs of a wave run
+    concurrently, and a decision's reflection is only stored once its holding period has
+    ended before the next wave starts, so no propagation ever sees a lesson whose outcome
+    lies in its future.
+    """
+
+    def __init__(
+        self,
+        graph,
+        holding_period: int = 1,
+        max_workers: int = 1,
+        dates_per_wave: Optional[int] = None,
+        reflect: bool = True,
+    ):
+        """Initialize the backtester.
+
+        Args:
+            graph: TradingAgentsGraph used for the propagations and reflections
+            holding_period: Trading days between a decision and the close its return is measured at
+            max_workers: Maximum concurrent propagations
+            dates_per_wave: Trading days run concurrently (tickers always run concurrently).
+                The default of 1 uses exactly the lessons a sequential run would; larger
+                values trade some recent lessons for date-level parallelism and stay
+                look-ahead-free.
+            reflect: Feed realized returns back into the agents' memories
+        """
+        self.graph = graph
+        self.holding_period = max(1, holding_period)
+        self.max_workers = max(1, max_workers)
+        self.dates_per_wave = max(1, dates_per_wave or 1)
+        self.reflect = reflect
+
+    def run(
+        self,
+        tickers: List[str],
+        start_date: str,
+        end_date: str,
+        price_data: Optional[Dict[str, pd.DataFrame]] = None,
+    ) -> pd.DataFrame:
+        """Backtest the tickers between start_date and end_date (inclusive).
+
+        Args:
+            tickers: Ticker symbols to trade
+            start_date: First trade date, yyyy-mm-dd
+            end_date: Last trade date, yyyy-mm-dd
+            price_data: Optional preloaded OHLCV per ticker (Date index or column, Close column)
+
+        Returns:
+            DataFrame with one row per (ticker, trade date): decision, position, close,
+            forward return, PnL, cumulative PnL and any error
+        """
+        price_data = price_data or {}
+        closes = {
+            ticker: self._closes(price_data.get(ticker), ticker, start_date, end_date)
+            for ticker in tickers
+        }
+
+        # Forward returns use only prices, so they are known up front and attached to
+        # each job; they are fed back to the agents only once their outcome date passed
+        jobs = []
+        for ticker, close in closes.items():
+            dates = list(close.index)
+            for i, day in enumerate(dates):
+                if not (start_date <= day <= end_date):
+                    continue
+                exit_index = i + self.holding_period
+                jobs.append(
+                    {
+                        "ticker": ticker,
+                        "trade_date": day,
+                        "close": float(close.iloc[i]),
+                        "forward_return": (
+                            float(close.iloc[exit_index] / close.iloc[i] - 1)
+                            if exit_index < len(dates)
+                            else None
+                        ),
+                        "outcome_date": dates[exit_index] if exit_index < len(dates) else None,
+                    }
+                )
+
+        # Memories must never surface a lesson whose outcome is not realized before the
+        # trade date (lessons stored by an earlier run included). The graph may be shared
+        # (e.g. pooled), so its live-run setting is restored afterwards.
+        memories = list(self.graph._role_memories().values())
+        previous_filters = [memory.filter_outcome_before_trade_date for memory in memories]
+        for memory in memories:
+            memory.filter_outcome_before_trade_date = True
+        try:
+            rows = self._run_waves(jobs)
+        finally:
+            for memory, previous in zip(memories, previous_filters):
+                memory.filter_outcome_before_trade_date = previous
+
+        table = pd.DataFrame(rows)
+        if not table.empty:
+            table = table.sort_values(["ticker", "trade_date"]).reset_index(drop=True)
+            table["cumulative_pnl"] = table.groupby("ticker")["pnl"].transform(
+                lambda pnl: pnl.fillna(0.0).cumsum()
+            )
+        return table
+
+    def _run_waves(self, jobs) -> List[Dict]:
+        """Run the jobs wave by wave, storing lessons once their outcome is known; returns the rows."""
+        trade_dates = sorted({job["trade_date"] for job in jobs})
+        runner = BatchRunner(self.graph, self.max_workers)
+        pending_lessons = []
+        rows = []
+
+        for start in range(0, len(trade_dates), self.dates_per_wave):
+            wave_dates = set(trade_dates[start : start + self.dates_per_wave])
+            wave_start = min(wave_dates)
+
+            if self.reflect:
+                pending_lessons = self._reflect_known_outcomes(pending_lessons, wave_start)
+
+            wave_jobs = [job for job in jobs if job["trade_date"] in wave_dates]
+            results = runner.run(
+                [(job["ticker"], job["trade_date"]) for job in wave_jobs]
+            )
+
+            for job, result in zip(wave_jobs, results):
+                position = _position(result.decision) if result.ok else 0
+                pnl = (
+                    position * job["forward_return"]
+                    if job["forward_return"] is not None
+                    else None
+                )
+                rows.append(
+                    {
+                        "ticker": job["ticker"],
+                        "trade_date": job["trade_date"],
+                        "decision": (result.decision or "").strip(),
+                        "position": position,
+                        "close": job["close"],
+                        "forward_return": job["forward_return"],
+                        "pnl": pnl,
+                        "error": result.error,
+                    }
+                )
+                # Reflect on the realized market move, not the PnL: a HOLD's PnL is
+                # always 0, whatever the price did
+                if result.ok and job["forward_return"] is not None:
+                    pending_lessons.append(
+                        (job["outcome_date"], result.final_state, job["forward_return"])
+                    )
+
+        if self.reflect:
+            # Remaining outcomes are all known by now; store them for future runs
+            self._reflect_known_outcomes(pending_lessons, None)
+        return rows
+
+    def _reflect_known_outcomes(self, pending_lessons, as_of):
+        """Store lessons whose outcome date is before as_of, in chronological order."""
+        ready, waiting = [], []
+        for lesson in pending_lessons:
+            if as_of is None or lesson[0] < as_of:
+                ready.append(lesson)
+            else:
+                waiting.append(lesson)
+
+        if ready:
+            ready.sort(key=lambda lesson: lesson[1]["trade_date"])
+            self.graph.reflect_and_remember_batch(
+                [
+                    (state, forward_return, {"outcome_date": outcome_date})
+                    for outcome_date, state, forward_return in ready
+                ]
+            )
+        return waiting
+
+    def _closes(self, data, ticker, start_date, end_date) -> pd.Series:
+        """Close prices indexed by yyyy-mm-dd, covering the range plus the holding period."""
+        if data is None:
+            data = self._download_prices(ticker, start_date, end_date)
+        data = data.reset_index() if "Date" not in data.columns else data
+        dates = pd.to_datetime(data["Date"]).dt.strftime("%Y-%m-%d")
+        close = pd.Series(data["Close"].astype(float).values, index=dates)
+        close = close[close.index >= start_date].dropna()
+        return close[~close.index.duplicated()].sort_index()
+
+    def _download_prices(self, ticker, start_date, end_date) -> pd.DataFrame:
+        """Download daily OHLCV once per (ticker, range) and cache it as CSV."""
+        from tradingagents.dataflows.stockstats_utils import download_daily_prices
+
+        config = get_config()
+        # Enough calendar days after end_date to cover the holding period
+        download_end = pd.Timestamp(end_date) + pd.Timedelta(
+            days=self.holding_period * 2 + 10
+        )
+        download_end = min(download_end, pd.Timestamp.today().normalize()).strftime(
+            "%Y-%m-%d"
+        )
+
+        os.makedirs(config["data_cache_dir"], exist_ok=True)
+        data_file = os.path.join(
+            config["data_cache_dir"],
+            f"{ticker}-backtest-{start_date}-{download_end}.csv",
+        )
+        if os.path.exists(data_file):
+            return pd.read_csv(data_file)
+
+        data = download_daily_prices(ticker, start_date, download_end)
+        data = data.reset_index()
+        data.to_csv(data_file, index=False)
+        return data
+
+
+def _position(decision: Optional[str]) -> int:
+    """Map a processed signal (BUY/SELL/HOLD) to a position of +1/-1/0."""
+    match = re.search(r"\b(BUY|SELL|HOLD)\b", (decision or "").upper())
+    return POSITIONS[match.group(1)] if match else 0
+
+
+def summarize_backtest(table: pd.DataFrame) -> pd.DataFrame:
+    """Per-ticker summary: trades, hit rate and total PnL of a backtest table."""
+    scored = table.dropna(subset=["pnl"])
+    traded = scored[scored["position"] != 0]
+    return pd.DataFrame(
+        {
+            "days": scored.groupby("ticker").size(),
+            "trades": traded.groupby("ticker").size(),
+            "hit_rate": traded.assign(hit=traded["pnl"] > 0).groupby("ticker")["hit"].mean(),
+            "total_pnl": scored.groupby("ticker")["pnl"].sum(),
+        }
+    ).fillna({"trades": 0})
+
+
+def save_backtest(table: pd.DataFrame, tickers: List[str], start_date: str, end_date: str) -> Path:
+    """Write a backtest table to results_dir/backtest/ as CSV."""
+    directory = Path(get_config()["results_dir"]) / "backtest"
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{'_'.join(tickers)}_{start_date}_{end_date}.csv"
+    table.to_csv(path, index=False)
+    return path
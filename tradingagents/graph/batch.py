@@ -0,0 +1,117 @@
+# TradingAgents/graph/batch.py
+
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from tradingagents.instrumentation.metrics import BATCH_QUEUE_DEPTH
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one (ticker, date) job of a batch run."""
+
+    ticker: str
+    trade_date: str
+    decision: Optional[str] = None
+    final_state: Optional[Dict[str, Any]] = field(default=None, repr=False)
+    error: Optional[str] = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary of the job suitable for JSON output."""
+        final_state = self.final_state or {}
+        return {
+            "ticker": self.ticker,
+            "trade_date": self.trade_date,
+            "decision": self.decision,
+            "error": self.error,
+            "elapsed": round(self.elapsed, 3),
+            "final_trade_decision": final_state.get("final_trade_decision"),
+        }
+
+
+class BatchRunner:
+    """Runs many (ticker, date) propagations through one graph with bounded concurrency.
+
+    All jobs share the graph's LLM clients, memories, data caches and compiled workflow;
+    each job's state stays local to its worker thread.
+    """
+
+    def __init__(self, graph, max_workers: int = 4):
+        """Initialize with a TradingAgentsGraph and the maximum number of concurrent jobs."""
+        self.graph = graph
+        self.max_workers = max(1, max_workers)
+
+    def run(
+        self,
+        jobs: Iterable[Tuple[str, str]],
+        on_result: Callable[[BatchResult], None] = None,
+    ) -> List[BatchResult]:
+        """Run every job and return the results in job order.
+
+        Args:
+            jobs: Iterable of (ticker, trade_date) pairs
+            on_result: Optional callback invoked as each job finishes
+
+        Returns:
+            One BatchResult per job; failed jobs carry the error instead of a decision
+        """
+        jobs = [(ticker, str(trade_date)) for ticker, trade_date in jobs]
+        results: List[Optional[BatchResult]] = [None] * len(jobs)
+        BATCH_QUEUE_DEPTH.inc(len(jobs))
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self._run_job, ticker, trade_date): index
+                for index, (ticker, trade_date) in enumerate(jobs)
+            }
+            for future in as_completed(futures):
+                result = future.result()
+                results[futures[future]] = result
+                if on_result is not None:
+                    on_result(result)
+
+        return results
+
+    def _run_job(self, ticker: str, trade_date: str) -> BatchResult:
+        BATCH_QUEUE_DEPTH.dec()
+        start = time.perf_counter()
+        try:
+            final_state, decision = self.graph.run_propagation(ticker, trade_date)
+            return BatchResult(
+                ticker=ticker,
+                trade_date=trade_date,
+                decision=decision,
+                final_state=final_state,
+                elapsed=time.perf_counter() - start,
+            )
+        except Exception as e:
+            return BatchResult(
+                ticker=ticker,
+                trade_date=trade_date,
+                error=f"{type(e).__name__}: {e}",
+                elapsed=time.perf_counter() - start,
+            )
+
+
+def write_batch_results(results: List[BatchResult], output_path) -> Path:
+    """Write the summaries of all batch results to one JSON file."""
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    summary = {
+        "total": len(results),
+        "succeeded": sum(1 for result in results if result.ok),
+        "failed": sum(1 for result in results if not result.ok),
+        "results": [result.to_dict() for result in results],
+    }
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=4, ensure_ascii=False)
+    return output_path
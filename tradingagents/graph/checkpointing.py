@@ -0,0 +1,131 @@
+# TradingAgents/graph/checkpointing.py
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+# Config keys that change what the analyst stage produces
+ANALYST_CONFIG_KEYS = (
+    "llm_provider",
+    "quick_think_llm",
+    "backend_url",
+    "data_vendors",
+    "tool_vendors",
+)
+
+# Config keys that only say where files go or how a run is observed; every other key
+# can change the graph's shape or output and is part of the run hash
+RUN_CONFIG_EXCLUDED_KEYS = (
+    "project_dir",
+    "results_dir",
+    "run_log_dir",
+    "run_log_compress",
+    "data_cache_dir",
+    "llm_cache_path",
+    "checkpoint_enabled",
+    "checkpoint_path",
+    "tracing_enabled",
+    "tracing_path",
+    "tracing_print_summary",
+    "profiling_enabled",
+    "profiling_dir",
+    "profiling_interval",
+    "profiling_top_n",
+    "metrics_enabled",
+    "metrics_port",
+    "metrics_host",
+    "dataflow_log_level",
+    "vendor_log_levels",
+    "vendor_attempt_log",
+    "batch_max_workers",
+    "graph_pool_size",
+)
+
+
+def run_config_keys(config: Dict[str, Any]) -> Tuple[str, ...]:
+    """Config keys that change what a full run produces: all but RUN_CONFIG_EXCLUDED_KEYS."""
+    return tuple(sorted(key for key in config if key not in RUN_CONFIG_EXCLUDED_KEYS))
+
+# Analyst type -> state field holding its report
+ANALYST_REPORT_FIELDS = {
+    "market": "market_report",
+    "social": "sentiment_report",
+    "news": "news_report",
+    "fundamentals": "fundamentals_report",
+}
+
+
+def config_hash(config: Dict[str, Any], keys: Iterable[str], extra: Any = None) -> str:
+    """Short stable hash of the given config keys (plus any extra value)."""
+    payload = {key: config.get(key) for key in keys}
+    payload["__extra__"] = extra
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+class CheckpointStore:
+    """SQLite-backed LangGraph checkpointer plus a table of completed analyst reports.
+
+    Graph checkpoints are keyed by (ticker, date, run config hash) so an interrupted run
+    resumes from its last completed node. Analyst reports are keyed by (ticker, date,
+    analyst config hash) so a run whose only changes are downstream (debate rounds, deep
+    model) can start straight at the research debate.
+    """
+
+    def __init__(self, path: str):
+        try:
+            from langgraph.checkpoint.sqlite import SqliteSaver
+        except ImportError as e:
+            raise ImportError(
+                "Checkpointing requires the langgraph-checkpoint-sqlite package: "
+                "pip install langgraph-checkpoint-sqlite"
+            ) from e
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.saver = SqliteSaver(self.conn)
+        with self._lock:
+            self.conn.execute(
+                """CREATE TABLE IF NOT EXISTS analyst_reports (
+                    ticker TEXT NOT NULL,
+                    trade_date TEXT NOT NULL,
+                    analyst_hash TEXT NOT NULL,
+                    reports TEXT NOT NULL,
+                    PRIMARY KEY (ticker, trade_date, analyst_hash)
+                )"""
+            )
+            self.conn.commit()
+
+    @staticmethod
+    def thread_id(ticker: str, trade_date: str, run_hash: str) -> str:
+        """LangGraph thread id of a (ticker, date, config) run."""
+        return f"{ticker}:{trade_date}:{run_hash}"
+
+    def save_reports(
+        self, ticker: str, trade_date: str, analyst_hash: str, reports: Dict[str, str]
+    ):
+        """Store the completed analyst reports of a run."""
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO analyst_reports VALUES (?, ?, ?, ?)",
+                (ticker, str(trade_date), analyst_hash, json.dumps(reports)),
+            )
+            self.conn.commit()
+
+    def load_reports(
+        self, ticker: str, trade_date: str, analyst_hash: str
+    ) -> Optional[Dict[str, str]]:
+        """Return previously completed analyst reports, or None."""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT reports FROM analyst_reports WHERE ticker = ? AND trade_date = ? AND analyst_hash = ?",
+                (ticker, str(trade_date), analyst_hash),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
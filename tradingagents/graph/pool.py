@@ -0,0 +1,210 @@
+# TradingAgents/graph/pool.py
+
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from tradingagents.default_config import DEFAULT_CONFIG
+
+from .batch import BatchResult
+from .checkpointing import config_hash
+
+DEFAULT_ANALYSTS = ("market", "social", "news", "fundamentals")
+
+
+class GraphPool:
+    """Reuses TradingAgentsGraph instances across propagations, one per configuration.
+
+    Building a graph creates the LLM clients, the five role memories, the tool nodes and
+    the compiled StateGraph. A long-running worker asks the pool instead, so that cost is
+    paid once per distinct (config, analysts, debug) and every later job only runs the
+    graph. Graphs are keyed by a hash of the whole config and evicted least recently used
+    beyond `max_graphs`.
+
+    Jobs run through run_propagation, which keeps the run's state local to the call, so
+    concurrent jobs on one pooled graph do not see each other's ticker or final state.
+    Reflect on a pooled run by passing its final state to reflect_and_remember(state=...)
+    or reflect_and_remember_batch.
+
+    Each run reads its own graph's dataflows config (see config_scope), so graphs of
+    different configs can serve jobs concurrently. An evicted graph's Chroma collections
+    are dropped once no job holds it any more: propagate and propagate_batch hold their
+    graph for the run, other callers use lease().
+    """
+
+    def __init__(self, max_graphs: int = None):
+        """Initialize the pool.
+
+        Args:
+            max_graphs: Graphs kept alive at once (defaults to the "graph_pool_size" config)
+        """
+        self.max_graphs = max(1, max_graphs or DEFAULT_CONFIG.get("graph_pool_size", 4))
+        self._lock = threading.Lock()
+        self._build_locks: Dict[str, threading.Lock] = {}
+        self._graphs: "OrderedDict[str, Any]" = OrderedDict()
+        self._leases: Dict[Any, int] = {}
+        self._retired: Set[Any] = set()
+        self._hits = 0
+        self._misses = 0
+        self._build_seconds = 0.0
+
+    @staticmethod
+    def key(selected_analysts: Sequence[str], config: Dict[str, Any], debug: bool = False) -> str:
+        """Pool key of a graph: a hash of the whole config, the analysts and the debug flag."""
+        return config_hash(config, sorted(config), extra=[list(selected_analysts), bool(debug)])
+
+    def get(self, selected_analysts: Sequence[str] = DEFAULT_ANALYSTS, config: Dict[str, Any] = None, debug: bool = False):
+        """Pooled graph of a configuration, built on first request.
+
+        The graph is closed when it is evicted; callers that keep running it after
+        further get() calls should hold it with lease() instead.
+
+        Args:
+            selected_analysts: Analyst types of the graph
+            config: Configuration dictionary. If None, uses default config
+            debug: Whether the graph runs in debug mode
+
+        Returns:
+            The shared TradingAgentsGraph
+        """
+        return self._acquire(selected_analysts, config, debug, lease=False)
+
+    @contextmanager
+    def lease(self, selected_analysts: Sequence[str] = DEFAULT_ANALYSTS, config: Dict[str, Any] = None, debug: bool = False):
+        """Pooled graph of a configuration, held for the block so eviction cannot close it mid-run."""
+        graph = self._acquire(selected_analysts, config, debug, lease=True)
+        try:
+            yield graph
+        finally:
+            self._release(graph)
+
+    def _acquire(self, selected_analysts, config, debug, lease):
+        from .trading_graph import TradingAgentsGraph
+
+        config = config or DEFAULT_CONFIG
+        key = self.key(selected_analysts, config, debug)
+
+        with self._lock:
+            graph = self._graphs.get(key)
+            if graph is not None:
+                self._graphs.move_to_end(key)
+                self._hits += 1
+                if lease:
+                    self._leases[graph] = self._leases.get(graph, 0) + 1
+                return graph
+            build_lock = self._build_locks.setdefault(key, threading.Lock())
+
+        # One build per key; other threads asking for the same config wait for it
+        with build_lock:
+            with self._lock:
+                graph = self._graphs.get(key)
+                if graph is not None:
+                    self._hits += 1
+                    if lease:
+                        self._leases[graph] = self._leases.get(graph, 0) + 1
+                    return graph
+            start = time.perf_counter()
+            graph = TradingAgentsGraph(list(selected_analysts), debug=debug, config=dict(config))
+            with self._lock:
+                self._misses += 1
+                self._build_seconds += time.perf_counter() - start
+                self._graphs[key] = graph
+                if lease:
+                    self._leases[graph] = self._leases.get(graph, 0) + 1
+                evicted = []
+                while len(self._graphs) > self.max_graphs:
+                    evicted_key, evicted_graph = self._graphs.popitem(last=False)
+                    self._build_locks.pop(evicted_key, None)
+                    evicted.append(evicted_graph)
+                closable = self._retire(evicted)
+        for old_graph in closable:
+            old_graph.close()
+        return graph
+
+    def _retire(self, graphs):
+        # Called under the lock: graphs no job holds are returned for closing, the
+        # others are closed by the last _release
+        closable = []
+        for graph in graphs:
+            if self._leases.get(graph):
+                self._retired.add(graph)
+            else:
+                closable.append(graph)
+        return closable
+
+    def _release(self, graph):
+        with self._lock:
+            remaining = self._leases.get(graph, 0) - 1
+            if remaining > 0:
+                self._leases[graph] = remaining
+                return
+            self._leases.pop(graph, None)
+            if graph not in self._retired:
+                return
+            self._retired.discard(graph)
+        graph.close()
+
+    def propagate(
+        self,
+        company_name: str,
+        trade_date: str,
+        selected_analysts: Sequence[str] = DEFAULT_ANALYSTS,
+        config: Dict[str, Any] = None,
+    ):
+        """Run one propagation on the pooled graph of a configuration.
+
+        Returns:
+            (final state, signal) of this run only
+        """
+        with self.lease(selected_analysts, config) as graph:
+            return graph.run_propagation(company_name, trade_date)
+
+    def propagate_batch(
+        self,
+        jobs: Iterable[Tuple[str, str]],
+        selected_analysts: Sequence[str] = DEFAULT_ANALYSTS,
+        config: Dict[str, Any] = None,
+        max_workers: int = None,
+        on_result: Callable[[BatchResult], None] = None,
+    ) -> List[BatchResult]:
+        """Run many (ticker, trade_date) jobs concurrently on the pooled graph (see propagate_batch)."""
+        with self.lease(selected_analysts, config) as graph:
+            return graph.propagate_batch(jobs, max_workers=max_workers, on_result=on_result)
+
+    def stats(self) -> Dict[str, Any]:
+        """Graphs alive, hits/misses of get() and the total time spent building graphs."""
+        with self._lock:
+            return {
+                "graphs": len(self._graphs),
+                "hits": self._hits,
+                "misses": self._misses,
+                "build_seconds": round(self._build_seconds, 3),
+            }
+
+    def clear(self):
+        """Drop and close every pooled graph (leased graphs are closed when their jobs finish)."""
+        with self._lock:
+            closable = self._retire(list(self._graphs.values()))
+            self._graphs.clear()
+            self._build_locks.clear()
+        for graph in closable:
+            graph.close()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._graphs)
+
+
+_default_pool: Optional[GraphPool] = None
+_default_pool_lock = threading.Lock()
+
+
+def get_graph_pool() -> GraphPool:
+    """The process-wide graph pool."""
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = GraphPool()
+        return _default_pool
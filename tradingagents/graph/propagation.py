@@ -11,9 +11,14 @@ from tradingagents.agents.utils.agent_states import (
 class Propagator:
     """Handles state initialization and propagation through the graph."""
 
-    def __init__(self, max_recur_limit=100):
-        """Initialize with configuration parameters."""
+    def __init__(self, max_recur_limit=100, max_concurrency=None):
+        """Initialize with configuration parameters.
+
+        max_concurrency bounds the threads LangGraph uses for concurrent work, including
+        the tool calls a ToolNode runs in parallel for one LLM turn (None = default).
+        """
         self.max_recur_limit = max_recur_limit
+        self.max_concurrency = max_concurrency
 
     def create_initial_state(
         self, company_name: str, trade_date: str
@@ -43,7 +48,10 @@ class Propagator:
 
     def get_graph_args(self) -> Dict[str, Any]:
         """Get arguments for the graph invocation."""
+        config = {"recursion_limit": self.max_recur_limit}
+        if self.max_concurrency:
+            config["max_concurrency"] = self.max_concurrency
         return {
             "stream_mode": "values",
-            "config": {"recursion_limit": self.max_recur_limit},
+            "config": config,
         }
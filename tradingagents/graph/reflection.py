@@ -1,13 +1,32 @@
 # TradingAgents/graph/reflection.py
 
-from typing import Dict, Any
-from langchain_openai import ChatOpenAI
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# Role name -> (component label, function extracting the role's output from the state)
+REFLECTION_ROLES = {
+    "bull": ("BULL", lambda state: state["investment_debate_state"]["bull_history"]),
+    "bear": ("BEAR", lambda state: state["investment_debate_state"]["bear_history"]),
+    "trader": ("TRADER", lambda state: state["trader_investment_plan"]),
+    "invest_judge": (
+        "INVEST JUDGE",
+        lambda state: state["investment_debate_state"]["judge_decision"],
+    ),
+    "risk_manager": (
+        "RISK JUDGE",
+        lambda state: state["risk_debate_state"]["judge_decision"],
+    ),
+}
 
 
 class Reflector:
     """Handles reflection on decisions and updating memory."""
 
-    def __init__(self, quick_thinking_llm: ChatOpenAI):
+    def __init__(self, quick_thinking_llm):
         """Initialize the reflector with an LLM."""
         self.quick_thinking_llm = quick_thinking_llm
         self.reflection_system_prompt = self._get_reflection_prompt()
@@ -55,6 +74,23 @@ Adhere strictly to these instructions, and ensure your output is detailed, accur
 
         return f"{curr_market_report}\n\n{curr_sentiment_report}\n\n{curr_news_report}\n\n{curr_fundamentals_report}"
 
+    def _lesson_metadata(
+        self, current_state: Dict[str, Any], returns_losses, metadata=None
+    ) -> Dict[str, Any]:
+        """Build the retrieval metadata stored with a lesson.
+
+        Ticker and trade date come from the state, the realized return from numeric
+        returns_losses; metadata adds fields such as sector or market_regime.
+        """
+        lesson_metadata = {
+            "ticker": current_state["company_of_interest"],
+            "trade_date": current_state["trade_date"],
+        }
+        if isinstance(returns_losses, (int, float)) and not isinstance(returns_losses, bool):
+            lesson_metadata["realized_return"] = float(returns_losses)
+        lesson_metadata.update(metadata or {})
+        return lesson_metadata
+
     def _reflect_on_component(
         self, component_type: str, report: str, situation: str, returns_losses
     ) -> str:
@@ -70,7 +106,23 @@ Adhere strictly to these instructions, and ensure your output is detailed, accur
         result = self.quick_thinking_llm.invoke(messages).content
         return result
 
-    def reflect_bull_researcher(self, current_state, returns_losses, bull_memory):
+    def summarize_lessons(self, lessons: List[str]) -> str:
+        """Merge the lessons of near-duplicate situations into a single lesson."""
+        joined = "\n\n".join(
+            f"Lesson {i}:\n{lesson}" for i, lesson in enumerate(lessons, 1)
+        )
+        messages = [
+            (
+                "system",
+                "You consolidate trading lessons learned in near-identical market situations. Merge the lessons below into one concise lesson that keeps every distinct insight and corrective action, drops repetition, and favors the earlier-listed (more recent) lessons when they conflict.",
+            ),
+            ("human", joined),
+        ]
+        return self.quick_thinking_llm.invoke(messages).content
+
+    def reflect_bull_researcher(
+        self, current_state, returns_losses, bull_memory, metadata=None
+    ):
         """Reflect on bull researcher's analysis and update memory."""
         situation = self._extract_current_situation(current_state)
         bull_debate_history = current_state["investment_debate_state"]["bull_history"]
@@ -78,9 +130,12 @@ Adhere strictly to these instructions, and ensure your output is detailed, accur
         result = self._reflect_on_component(
             "BULL", bull_debate_history, situation, returns_losses
         )
-        bull_memory.add_situations([(situation, result)])
+        lesson_metadata = self._lesson_metadata(current_state, returns_losses, metadata)
+        bull_memory.add_situations([(situation, result, lesson_metadata)])
 
-    def reflect_bear_researcher(self, current_state, returns_losses, bear_memory):
+    def reflect_bear_researcher(
+        self, current_state, returns_losses, bear_memory, metadata=None
+    ):
         """Reflect on bear researcher's analysis and update memory."""
         situation = self._extract_current_situation(current_state)
         bear_debate_history = current_state["investment_debate_state"]["bear_history"]
@@ -88,9 +143,12 @@ Adhere strictly to these instructions, and ensure your output is detailed, accur
         result = self._reflect_on_component(
             "BEAR", bear_debate_history, situation, returns_losses
         )
-        bear_memory.add_situations([(situation, result)])
+        lesson_metadata = self._lesson_metadata(current_state, returns_losses, metadata)
+        bear_memory.add_situations([(situation, result, lesson_metadata)])
 
-    def reflect_trader(self, current_state, returns_losses, trader_memory):
+    def reflect_trader(
+        self, current_state, returns_losses, trader_memory, metadata=None
+    ):
         """Reflect on trader's decision and update memory."""
         situation = self._extract_current_situation(current_state)
         trader_decision = current_state["trader_investment_plan"]
@@ -98,9 +156,12 @@ Adhere strictly to these instructions, and ensure your output is detailed, accur
         result = self._reflect_on_component(
             "TRADER", trader_decision, situation, returns_losses
         )
-        trader_memory.add_situations([(situation, result)])
+        lesson_metadata = self._lesson_metadata(current_state, returns_losses, metadata)
+        trader_memory.add_situations([(situation, result, lesson_metadata)])
 
-    def reflect_invest_judge(self, current_state, returns_losses, invest_judge_memory):
+    def reflect_invest_judge(
+        self, current_state, returns_losses, invest_judge_memory, metadata=None
+    ):
         """Reflect on investment judge's decision and update memory."""
         situation = self._extract_current_situation(current_state)
         judge_decision = current_state["investment_debate_state"]["judge_decision"]
@@ -108,9 +169,12 @@ Adhere strictly to these instructions, and ensure your output is detailed, accur
         result = self._reflect_on_component(
             "INVEST JUDGE", judge_decision, situation, returns_losses
         )
-        invest_judge_memory.add_situations([(situation, result)])
+        lesson_metadata = self._lesson_metadata(current_state, returns_losses, metadata)
+        invest_judge_memory.add_situations([(situation, result, lesson_metadata)])
 
-    def reflect_risk_manager(self, current_state, returns_losses, risk_manager_memory):
+    def reflect_risk_manager(
+        self, current_state, returns_losses, risk_manager_memory, metadata=None
+    ):
         """Reflect on risk manager's decision and update memory."""
         situation = self._extract_current_situation(current_state)
         judge_decision = current_state["risk_debate_state"]["judge_decision"]
@@ -118,4 +182,103 @@ Adhere strictly to these instructions, and ensure your output is detailed, accur
         result = self._reflect_on_component(
             "RISK JUDGE", judge_decision, situation, returns_losses
         )
-        risk_manager_memory.add_situations([(situation, result)])
+        lesson_metadata = self._lesson_metadata(current_state, returns_losses, metadata)
+        risk_manager_memory.add_situations([(situation, result, lesson_metadata)])
+
+    def reflect_all(
+        self,
+        current_state: Dict[str, Any],
+        returns_losses,
+        memories: Dict[str, Any],
+        max_workers: int = None,
+        metadata: Dict[str, Any] = None,
+    ) -> Dict[str, Exception]:
+        """Reflect on every role concurrently and update their memories.
+
+        Args:
+            current_state: Final state of a propagation
+            returns_losses: Realized returns of the decision
+            memories: Mapping of role name (see REFLECTION_ROLES) to its memory
+            max_workers: Maximum number of concurrent reflection calls
+            metadata: Extra lesson metadata, e.g. sector or market_regime
+
+        Returns:
+            Mapping of role name to the exception that role failed with
+        """
+        errors = self.reflect_batch(
+            [(current_state, returns_losses, metadata or {})], memories, max_workers
+        )
+        return {role: error for (_, role), error in errors.items()}
+
+    def reflect_batch(
+        self,
+        states_and_returns: List[Tuple],
+        memories: Dict[str, Any],
+        max_workers: int = None,
+    ) -> Dict[Tuple[int, str], Exception]:
+        """Reflect on many (state, returns) pairs concurrently and update memories.
+
+        The reflection LLM calls run in a bounded thread pool. Each role's memory is then
+        updated with a single batched insert, keeping the input order. A failing reflection
+        only drops its own lesson.
+
+        Args:
+            states_and_returns: List of (final state, returns_losses) pairs, optionally
+                with a third element holding extra lesson metadata
+            memories: Mapping of role name (see REFLECTION_ROLES) to its memory
+            max_workers: Maximum number of concurrent reflection calls
+
+        Returns:
+            Mapping of (pair index, role name) to the exception that reflection failed with
+        """
+        situations = [
+            self._extract_current_situation(state) for state, *_ in states_and_returns
+        ]
+        lesson_metadata = [
+            self._lesson_metadata(state, returns_losses, extra[0] if extra else None)
+            for state, returns_losses, *extra in states_and_returns
+        ]
+        tasks = [
+            (index, role)
+            for index in range(len(states_and_returns))
+            for role in memories
+        ]
+
+        def reflect_task(task):
+            index, role = task
+            state, returns_losses = states_and_returns[index][:2]
+            component_type, get_report = REFLECTION_ROLES[role]
+            return self._reflect_on_component(
+                component_type, get_report(state), situations[index], returns_losses
+            )
+
+        def run_isolated(task):
+            try:
+                return reflect_task(task), None
+            except Exception as e:
+                return None, e
+
+        errors = {}
+        lessons = {role: [] for role in memories}
+        with ThreadPoolExecutor(max_workers=max_workers or len(REFLECTION_ROLES)) as executor:
+            for task, (result, error) in zip(tasks, executor.map(run_isolated, tasks)):
+                index, role = task
+                if error is not None:
+                    logger.warning("Reflection for %s (state #%d) failed: %s", role, index, error)
+                    errors[task] = error
+                else:
+                    lessons[role].append(
+                        (situations[index], result, lesson_metadata[index])
+                    )
+
+        for role, role_lessons in lessons.items():
+            if not role_lessons:
+                continue
+            try:
+                memories[role].add_situations(role_lessons)
+            except Exception as e:
+                logger.warning("Storing reflections for %s failed: %s", role, e)
+                for index in range(len(states_and_returns)):
+                    errors.setdefault((index, role), e)
+
+        return errors
@@ -0,0 +1,110 @@
+# TradingAgents/graph/run_log.py
+
+import gzip
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+
+class RunLog:
+    """Append-only JSON Lines log of propagation states, one file per ticker.
+
+    Each propagation appends a single line {"ticker", "trade_date", "logged_at", "state"},
+    so logging cost does not grow with the number of runs and nothing has to be kept in
+    memory. With compression, lines are appended as gzip members, which gzip readers
+    concatenate transparently. When a (ticker, date) is logged more than once, the
+    readers return the latest entry.
+    """
+
+    def __init__(self, directory, compress: bool = False):
+        """Initialize the log.
+
+        Args:
+            directory: Root directory; files go to <directory>/<ticker>/TradingAgentsStrategy_logs/
+            compress: Write gzip-compressed run_log.jsonl.gz files instead of run_log.jsonl
+        """
+        self.directory = Path(directory)
+        self.compress = compress
+        self._lock = threading.Lock()
+
+    def path(self, ticker: str) -> Path:
+        """Log file of a ticker."""
+        name = "run_log.jsonl.gz" if self.compress else "run_log.jsonl"
+        return self.directory / ticker / "TradingAgentsStrategy_logs" / name
+
+    def append(self, ticker: str, trade_date, state: Dict[str, Any]) -> Path:
+        """Append the state of one (ticker, trade_date) run and return the log file."""
+        line = json.dumps(
+            {
+                "ticker": ticker,
+                "trade_date": str(trade_date),
+                "logged_at": time.time(),
+                "state": state,
+            },
+            ensure_ascii=False,
+        )
+        path = self.path(ticker)
+        with self._lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            opener = gzip.open if self.compress else open
+            with opener(path, "at", encoding="utf-8") as f:
+                f.write(line + "\n")
+        return path
+
+    def iter_entries(self, ticker: str) -> Iterator[Dict[str, Any]]:
+        """Yield every logged entry of a ticker in the order it was written."""
+        for path in self._existing_paths(ticker):
+            opener = gzip.open if path.suffix == ".gz" else open
+            with opener(path, "rt", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        # A line cut short by an interrupted write
+                        continue
+
+    def read(self, ticker: str) -> Dict[str, Dict[str, Any]]:
+        """Latest logged state per trade date of a ticker."""
+        latest = {}
+        for entry in self.iter_entries(ticker):
+            current = latest.get(entry["trade_date"])
+            if current is None or entry["logged_at"] >= current["logged_at"]:
+                latest[entry["trade_date"]] = entry
+        return {trade_date: entry["state"] for trade_date, entry in latest.items()}
+
+    def get(self, ticker: str, trade_date) -> Optional[Dict[str, Any]]:
+        """Latest logged state of one (ticker, trade_date), or None."""
+        found = None
+        for entry in self.iter_entries(ticker):
+            if entry["trade_date"] == str(trade_date) and (
+                found is None or entry["logged_at"] >= found["logged_at"]
+            ):
+                found = entry
+        return found["state"] if found else None
+
+    def trade_dates(self, ticker: str) -> List[str]:
+        """Sorted trade dates logged for a ticker."""
+        return sorted({entry["trade_date"] for entry in self.iter_entries(ticker)})
+
+    def tickers(self) -> List[str]:
+        """Tickers with a log under the directory."""
+        if not self.directory.is_dir():
+            return []
+        return sorted(
+            entry.name
+            for entry in os.scandir(self.directory)
+            if entry.is_dir() and any(True for _ in self._existing_paths(entry.name))
+        )
+
+    def _existing_paths(self, ticker: str) -> Iterator[Path]:
+        # Both variants, so switching compression keeps earlier entries readable
+        directory = self.directory / ticker / "TradingAgentsStrategy_logs"
+        for name in ("run_log.jsonl", "run_log.jsonl.gz"):
+            if (directory / name).exists():
+                yield directory / name
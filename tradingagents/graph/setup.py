@@ -1,12 +1,12 @@
 # TradingAgents/graph/setup.py
 
 from typing import Dict, Any
-from langchain_openai import ChatOpenAI
 from langgraph.graph import END, StateGraph, START
 from langgraph.prebuilt import ToolNode
 
 from tradingagents.agents import *
 from tradingagents.agents.utils.agent_states import AgentState
+from tradingagents.llms.cache import with_llm_cache
 
 from .conditional_logic import ConditionalLogic
 
@@ -16,8 +16,8 @@ class GraphSetup:
 
     def __init__(
         self,
-        quick_thinking_llm: ChatOpenAI,
-        deep_thinking_llm: ChatOpenAI,
+        quick_thinking_llm,
+        deep_thinking_llm,
         tool_nodes: Dict[str, ToolNode],
         bull_memory,
         bear_memory,
@@ -25,8 +25,14 @@ class GraphSetup:
         invest_judge_memory,
         risk_manager_memory,
         conditional_logic: ConditionalLogic,
+        llm_cache=None,
+        llm_cache_nodes=None,
     ):
-        """Initialize with required components."""
+        """Initialize with required components.
+
+        llm_cache is an optional DiskLLMCache; llm_cache_nodes limits it to the given
+        node types (None caches every node).
+        """
         self.quick_thinking_llm = quick_thinking_llm
         self.deep_thinking_llm = deep_thinking_llm
         self.tool_nodes = tool_nodes
@@ -36,9 +42,19 @@ class GraphSetup:
         self.invest_judge_memory = invest_judge_memory
         self.risk_manager_memory = risk_manager_memory
         self.conditional_logic = conditional_logic
+        self.llm_cache = llm_cache
+        self.llm_cache_nodes = llm_cache_nodes
+
+    def _llm(self, llm, node_type):
+        """The LLM a node of node_type should use, with response caching if enabled."""
+        return with_llm_cache(llm, self.llm_cache, node_type, self.llm_cache_nodes)
 
     def setup_graph(
-        self, selected_analysts=["market", "social", "news", "fundamentals"]
+        self,
+        selected_analysts=["market", "social", "news", "fundamentals"],
+        parallel_analysts=False,
+        checkpointer=None,
+        report_budget=None,
     ):
         """Set up and compile the agent workflow graph.
 
@@ -48,6 +64,12 @@ class GraphSetup:
                 - "social": Social media analyst
                 - "news": News analyst
                 - "fundamentals": Fundamentals analyst
+            parallel_analysts (bool): Fan out from START to every selected analyst, each
+                with its own message channel, and join before the Bull Researcher instead
+                of chaining the analysts in sequence
+            checkpointer: Optional LangGraph checkpointer saving the state after every node
+            report_budget (int): If set, a Report Compressor node condenses every analyst
+                report longer than this many tokens before the research debate
         """
         if len(selected_analysts) == 0:
             raise ValueError("Trading Agents Graph Setup Error: no analysts selected!")
@@ -59,55 +81,86 @@ class GraphSetup:
 
         if "market" in selected_analysts:
             analyst_nodes["market"] = create_market_analyst(
-                self.quick_thinking_llm
+                self._llm(self.quick_thinking_llm, "analysts")
             )
             delete_nodes["market"] = create_msg_delete()
             tool_nodes["market"] = self.tool_nodes["market"]
 
         if "social" in selected_analysts:
             analyst_nodes["social"] = create_social_media_analyst(
-                self.quick_thinking_llm
+                self._llm(self.quick_thinking_llm, "analysts")
             )
             delete_nodes["social"] = create_msg_delete()
             tool_nodes["social"] = self.tool_nodes["social"]
 
         if "news" in selected_analysts:
             analyst_nodes["news"] = create_news_analyst(
-                self.quick_thinking_llm
+                self._llm(self.quick_thinking_llm, "analysts")
             )
             delete_nodes["news"] = create_msg_delete()
             tool_nodes["news"] = self.tool_nodes["news"]
 
         if "fundamentals" in selected_analysts:
             analyst_nodes["fundamentals"] = create_fundamentals_analyst(
-                self.quick_thinking_llm
+                self._llm(self.quick_thinking_llm, "analysts")
             )
             delete_nodes["fundamentals"] = create_msg_delete()
             tool_nodes["fundamentals"] = self.tool_nodes["fundamentals"]
 
         # Create researcher and manager nodes
         bull_researcher_node = create_bull_researcher(
-            self.quick_thinking_llm, self.bull_memory
+            self._llm(self.quick_thinking_llm, "researchers"), self.bull_memory
         )
         bear_researcher_node = create_bear_researcher(
-            self.quick_thinking_llm, self.bear_memory
+            self._llm(self.quick_thinking_llm, "researchers"), self.bear_memory
         )
         research_manager_node = create_research_manager(
-            self.deep_thinking_llm, self.invest_judge_memory
+            self._llm(self.deep_thinking_llm, "research_manager"), self.invest_judge_memory
+        )
+        trader_node = create_trader(
+            self._llm(self.quick_thinking_llm, "trader"), self.trader_memory
         )
-        trader_node = create_trader(self.quick_thinking_llm, self.trader_memory)
 
         # Create risk analysis nodes
-        risky_analyst = create_risky_debator(self.quick_thinking_llm)
-        neutral_analyst = create_neutral_debator(self.quick_thinking_llm)
-        safe_analyst = create_safe_debator(self.quick_thinking_llm)
+        debator_llm = self._llm(self.quick_thinking_llm, "risk_debators")
+        risky_analyst = create_risky_debator(debator_llm)
+        neutral_analyst = create_neutral_debator(debator_llm)
+        safe_analyst = create_safe_debator(debator_llm)
         risk_manager_node = create_risk_manager(
-            self.deep_thinking_llm, self.risk_manager_memory
+            self._llm(self.deep_thinking_llm, "risk_manager"), self.risk_manager_memory
         )
 
         # Create workflow
         workflow = StateGraph(AgentState)
 
+        # The analyst stage ends at the Bull Researcher, or at the report compressor
+        analysts_exit = "Bull Researcher"
+        if report_budget:
+            analysts_exit = "Report Compressor"
+            workflow.add_node(
+                "Report Compressor",
+                create_report_compressor(
+                    self._llm(self.quick_thinking_llm, "report_compressor"),
+                    report_budget,
+                ),
+            )
+            workflow.add_edge("Report Compressor", "Bull Researcher")
+
+        if parallel_analysts:
+            # Each analyst reads and writes its own "<type>_messages" channel
+            for analyst_type in selected_analysts:
+                messages_key = f"{analyst_type}_messages"
+                analyst_nodes[analyst_type] = scope_messages(
+                    analyst_nodes[analyst_type], messages_key
+                )
+                delete_nodes[analyst_type] = scope_messages(
+                    delete_nodes[analyst_type], messages_key
+                )
+                tool_nodes[analyst_type] = ToolNode(
+                    list(tool_nodes[analyst_type].tools_by_name.values()),
+                    messages_key=messages_key,
+                )
+
         # Add analyst nodes to the graph
         for analyst_type, node in analyst_nodes.items():
             workflow.add_node(f"{analyst_type.capitalize()} Analyst", node)
@@ -127,30 +180,10 @@ class GraphSetup:
         workflow.add_node("Risk Judge", risk_manager_node)
 
         # Define edges
-        # Start with the first analyst
-        first_analyst = selected_analysts[0]
-        workflow.add_edge(START, f"{first_analyst.capitalize()} Analyst")
-
-        # Connect analysts in sequence
-        for i, analyst_type in enumerate(selected_analysts):
-            current_analyst = f"{analyst_type.capitalize()} Analyst"
-            current_tools = f"tools_{analyst_type}"
-            current_clear = f"Msg Clear {analyst_type.capitalize()}"
-
-            # Add conditional edges for current analyst
-            workflow.add_conditional_edges(
-                current_analyst,
-                getattr(self.conditional_logic, f"should_continue_{analyst_type}"),
-                [current_tools, current_clear],
-            )
-            workflow.add_edge(current_tools, current_analyst)
-
-            # Connect to next analyst or to Bull Researcher if this is the last analyst
-            if i < len(selected_analysts) - 1:
-                next_analyst = f"{selected_analysts[i+1].capitalize()} Analyst"
-                workflow.add_edge(current_clear, next_analyst)
-            else:
-                workflow.add_edge(current_clear, "Bull Researcher")
+        if parallel_analysts:
+            self._connect_parallel_analysts(workflow, selected_analysts, analysts_exit)
+        else:
+            self._connect_sequential_analysts(workflow, selected_analysts, analysts_exit)
 
         # Add remaining edges
         workflow.add_conditional_edges(
@@ -199,4 +232,57 @@ class GraphSetup:
         workflow.add_edge("Risk Judge", END)
 
         # Compile and return
-        return workflow.compile()
+        return workflow.compile(checkpointer=checkpointer)
+
+    def _connect_sequential_analysts(
+        self, workflow, selected_analysts, exit_node="Bull Researcher"
+    ):
+        """Chain the analysts one after another, ending at exit_node."""
+        # Start with the first analyst
+        first_analyst = selected_analysts[0]
+        workflow.add_edge(START, f"{first_analyst.capitalize()} Analyst")
+
+        # Connect analysts in sequence
+        for i, analyst_type in enumerate(selected_analysts):
+            current_analyst = f"{analyst_type.capitalize()} Analyst"
+            current_tools = f"tools_{analyst_type}"
+            current_clear = f"Msg Clear {analyst_type.capitalize()}"
+
+            # Add conditional edges for current analyst
+            workflow.add_conditional_edges(
+                current_analyst,
+                getattr(self.conditional_logic, f"should_continue_{analyst_type}"),
+                [current_tools, current_clear],
+            )
+            workflow.add_edge(current_tools, current_analyst)
+
+            # Connect to next analyst or to the exit node if this is the last analyst
+            if i < len(selected_analysts) - 1:
+                next_analyst = f"{selected_analysts[i+1].capitalize()} Analyst"
+                workflow.add_edge(current_clear, next_analyst)
+            else:
+                workflow.add_edge(current_clear, exit_node)
+
+    def _connect_parallel_analysts(
+        self, workflow, selected_analysts, exit_node="Bull Researcher"
+    ):
+        """Fan out from START to every analyst and join them before exit_node."""
+        clear_nodes = []
+        for analyst_type in selected_analysts:
+            current_analyst = f"{analyst_type.capitalize()} Analyst"
+            current_tools = f"tools_{analyst_type}"
+            current_clear = f"Msg Clear {analyst_type.capitalize()}"
+
+            workflow.add_edge(START, current_analyst)
+            workflow.add_conditional_edges(
+                current_analyst,
+                self.conditional_logic.should_continue_analyst(
+                    analyst_type, f"{analyst_type}_messages"
+                ),
+                [current_tools, current_clear],
+            )
+            workflow.add_edge(current_tools, current_analyst)
+            clear_nodes.append(current_clear)
+
+        # The exit node waits until every analyst branch has finished
+        workflow.add_edge(clear_nodes, exit_node)
@@ -1,14 +1,111 @@
 # TradingAgents/graph/signal_processing.py
 
-from langchain_openai import ChatOpenAI
+import re
+import threading
+from typing import Optional, Tuple
+
+
+DECISIONS = ("BUY", "SELL", "HOLD")
+
+# "FINAL TRANSACTION PROPOSAL: **BUY**", as required by the trader and analyst prompts
+_PROPOSAL_PATTERN = re.compile(
+    r"FINAL\s+TRANSACTION\s+PROPOSAL\s*:?\s*\**\s*(BUY|SELL|HOLD)\b(?!\s*/)",
+    re.IGNORECASE,
+)
+# "Recommendation: **Sell**", "Final decision - Hold", "Verdict: BUY"
+_LABELLED_PATTERN = re.compile(
+    r"\b(?:final\s+)?(?:recommendation|decision|verdict|action|rating)\s*[:\-]\s*\**\s*(buy|sell|hold)\b(?!\s*/)",
+    re.IGNORECASE,
+)
+# "**Buy**" or "**Recommend: Hold**"
+_BOLD_PATTERN = re.compile(
+    r"\*\*\s*(?:[A-Za-z ]{0,20}:\s*)?(buy|sell|hold)\s*[.!]?\s*\*\*",
+    re.IGNORECASE,
+)
+# Any mention of a decision, e.g. "sell", "holding", "buying"
+_DECISION_WORD_PATTERN = re.compile(r"\b(buy|sell|hold)(?:s|ing)?\b", re.IGNORECASE)
+# A cue is someone else's view or a rejected option when its sentence negates it or
+# attributes it to another participant ("The Risky Analyst pushes for **Buy**")
+_QUALIFIER_PATTERN = re.compile(
+    r"\b(?:not|no|never|don't|do\s+not|shouldn't|avoid|against|rather\s+than|instead\s+of|"
+    r"analysts?|trader(?:'s)?|bull(?:ish)?|bear(?:ish)?|researchers?|risky|safe|neutral|"
+    r"aggressive|conservative)\b",
+    re.IGNORECASE,
+)
+_SENTENCE_END = re.compile(r"[.!?;\n…]")
+
+
+def extract_signal(full_signal: str) -> Optional[str]:
+    """Deterministically extract BUY/SELL/HOLD from the markers the prompts ask for.
+
+    Only the closing cue counts, and only when nothing around it contradicts it; any
+    doubt returns None so the caller asks the LLM:
+
+    - The last final transaction proposal or labelled recommendation ("Recommendation:
+      Sell") decides, unless a different decision word follows it.
+    - Without such a marker, bold decision words ("**Hold**") decide only if they sit in
+      the last paragraph and no other decision word appears anywhere in the text.
+    - A cue whose sentence negates it or attributes it to another participant ("not",
+      "the Risky Analyst ...", "the trader's plan") is never accepted.
+    """
+    text = full_signal or ""
+
+    markers = sorted(
+        list(_PROPOSAL_PATTERN.finditer(text)) + list(_LABELLED_PATTERN.finditer(text)),
+        key=lambda match: match.start(),
+    )
+    if markers:
+        cue = markers[-1]
+        decision = cue.group(1).upper()
+        if _decision_words(text[cue.end():]) - {decision}:
+            return None
+        return None if _is_qualified(text, cue) else decision
+
+    bold = list(_BOLD_PATTERN.finditer(text))
+    if not bold:
+        return None
+    cue = bold[-1]
+    decision = cue.group(1).upper()
+    if _decision_words(text) != {decision}:
+        return None
+    if cue.start() < _last_paragraph_start(text):
+        return None
+    return None if _is_qualified(text, cue) else decision
+
+
+def _decision_words(text: str):
+    return {word.upper() for word in _DECISION_WORD_PATTERN.findall(text)}
+
+
+def _last_paragraph_start(text: str) -> int:
+    stripped = text.rstrip()
+    return stripped.rfind("\n\n") + 1
+
+
+def _is_qualified(text: str, cue) -> bool:
+    """Whether the sentence holding a cue negates it or attributes it to someone else."""
+    before = text[: cue.start()]
+    sentence_start = max((m.end() for m in _SENTENCE_END.finditer(before)), default=0)
+    after = _SENTENCE_END.search(text, cue.end())
+    sentence_end = after.start() if after else len(text)
+    # Words inside the cue itself ("FINAL TRANSACTION PROPOSAL", "Recommendation") are fine
+    context = text[sentence_start : cue.start()] + " " + text[cue.end() : sentence_end]
+    return _QUALIFIER_PATTERN.search(context) is not None
 
 
 class SignalProcessor:
     """Processes trading signals to extract actionable decisions."""
 
-    def __init__(self, quick_thinking_llm: ChatOpenAI):
-        """Initialize with an LLM for processing."""
+    def __init__(self, quick_thinking_llm, fast_path: bool = True):
+        """Initialize with an LLM for processing.
+
+        With fast_path, decisions are parsed from the explicit markers in the signal and
+        the LLM is only asked when the text is ambiguous.
+        """
         self.quick_thinking_llm = quick_thinking_llm
+        self.fast_path = fast_path
+        self._lock = threading.Lock()
+        self._path_counts = {"rule": 0, "llm": 0}
 
     def process_signal(self, full_signal: str) -> str:
         """
@@ -20,12 +117,44 @@ class SignalProcessor:
         Returns:
             Extracted decision (BUY, SELL, or HOLD)
         """
-        messages = [
+        return self.process_signal_with_path(full_signal)[0]
+
+    def process_signal_with_path(self, full_signal: str) -> Tuple[str, str]:
+        """Like process_signal, but also return the path taken ("rule" or "llm")."""
+        decision = extract_signal(full_signal) if self.fast_path else None
+        if decision is not None:
+            return decision, self._record("rule")
+
+        decision = self.quick_thinking_llm.invoke(self._get_messages(full_signal)).content
+        return decision, self._record("llm")
+
+    async def aprocess_signal(self, full_signal: str) -> str:
+        """Async variant of process_signal."""
+        decision = extract_signal(full_signal) if self.fast_path else None
+        if decision is not None:
+            self._record("rule")
+            return decision
+
+        response = await self.quick_thinking_llm.ainvoke(self._get_messages(full_signal))
+        self._record("llm")
+        return response.content
+
+    def path_counts(self):
+        """Number of signals processed by the rule-based path and by the LLM."""
+        with self._lock:
+            return dict(self._path_counts)
+
+    def _record(self, path: str) -> str:
+        with self._lock:
+            self._path_counts[path] += 1
+        return path
+
+    def _get_messages(self, full_signal: str):
+        """Build the extraction prompt for a trading signal."""
+        return [
             (
                 "system",
                 "You are an efficient assistant designed to analyze paragraphs or financial reports provided by a group of analysts. Your task is to extract the investment decision: SELL, BUY, or HOLD. Provide only the extracted decision (SELL, BUY, or HOLD) as your output, without adding any additional text or information.",
             ),
             ("human", full_signal),
         ]
-
-        return self.quick_thinking_llm.invoke(messages).content
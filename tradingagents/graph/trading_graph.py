@@ -1,26 +1,45 @@
 # TradingAgents/graph/trading_graph.py
 
+import asyncio
 import os
-from pathlib import Path
-import json
+import threading
+import time
+from contextlib import ExitStack, contextmanager
 from datetime import date
 from typing import Dict, Any, Tuple, List, Optional
 
-from langchain_openai import ChatOpenAI
-from langchain_anthropic import ChatAnthropic
-from langchain_google_genai import ChatGoogleGenerativeAI
-
 from langgraph.prebuilt import ToolNode
 
 from tradingagents.agents import *
 from tradingagents.default_config import DEFAULT_CONFIG
 from tradingagents.agents.utils.memory import FinancialSituationMemory
+from tradingagents.agents.utils.memory_compaction import MemoryCompactor
+from tradingagents.agents.utils.tool_memo import memoize_tool, tool_memo_scope
 from tradingagents.agents.utils.agent_states import (
     AgentState,
     InvestDebateState,
     RiskDebateState,
 )
-from tradingagents.dataflows.config import set_config
+from tradingagents.dataflows.config import config_scope, set_config
+from tradingagents.dataflows.logging_utils import configure_dataflow_logging
+from tradingagents.llms.cache import DiskLLMCache, with_llm_cache
+from tradingagents.llms.factory import create_llm
+from tradingagents.instrumentation.metrics import (
+    PROPAGATION_LATENCY,
+    PROPAGATIONS,
+    PROPAGATIONS_IN_FLIGHT,
+    enable_metrics,
+    snapshot,
+    start_metrics_server,
+)
+from tradingagents.instrumentation.profiling import RunProfiler, format_profile_summary
+from tradingagents.instrumentation.tracing import (
+    JsonlSpanExporter,
+    Tracer,
+    format_span_summary,
+    summarize_spans,
+    trace_span,
+)
 
 # Import the new abstract tool methods from agent_utils
 from tradingagents.agents.utils.agent_utils import (
@@ -41,6 +60,15 @@ from .setup import GraphSetup
 from .propagation import Propagator
 from .reflection import Reflector
 from .signal_processing import SignalProcessor
+from .batch import BatchRunner
+from .run_log import RunLog
+from .checkpointing import (
+    ANALYST_CONFIG_KEYS,
+    ANALYST_REPORT_FIELDS,
+    CheckpointStore,
+    config_hash,
+    run_config_keys,
+)
 
 
 class TradingAgentsGraph:
@@ -64,6 +92,7 @@ class TradingAgentsGraph:
 
         # Update the interface's config
         set_config(self.config)
+        configure_dataflow_logging(self.config)
 
         # Create necessary directories
         os.makedirs(
@@ -71,19 +100,19 @@ class TradingAgentsGraph:
             exist_ok=True,
         )
 
-        # Initialize LLMs
-        if self.config["llm_provider"].lower() == "openai" or self.config["llm_provider"] == "ollama" or self.config["llm_provider"] == "openrouter":
-            self.deep_thinking_llm = ChatOpenAI(model=self.config["deep_think_llm"], base_url=self.config["backend_url"])
-            self.quick_thinking_llm = ChatOpenAI(model=self.config["quick_think_llm"], base_url=self.config["backend_url"])
-        elif self.config["llm_provider"].lower() == "anthropic":
-            self.deep_thinking_llm = ChatAnthropic(model=self.config["deep_think_llm"], base_url=self.config["backend_url"])
-            self.quick_thinking_llm = ChatAnthropic(model=self.config["quick_think_llm"], base_url=self.config["backend_url"])
-        elif self.config["llm_provider"].lower() == "google":
-            self.deep_thinking_llm = ChatGoogleGenerativeAI(model=self.config["deep_think_llm"])
-            self.quick_thinking_llm = ChatGoogleGenerativeAI(model=self.config["quick_think_llm"])
-        else:
-            raise ValueError(f"Unsupported LLM provider: {self.config['llm_provider']}")
-        
+        # Initialize LLMs (only the configured provider's package is imported)
+        self.deep_thinking_llm = create_llm(self.config, self.config["deep_think_llm"])
+        self.quick_thinking_llm = create_llm(self.config, self.config["quick_think_llm"])
+
+        # Response cache shared by the nodes listed in "llm_cache_nodes"
+        self.llm_cache = None
+        if self.config.get("llm_cache_enabled", False):
+            self.llm_cache = DiskLLMCache(
+                self.config.get("llm_cache_path")
+                or os.path.join(self.config["data_cache_dir"], "llm_cache.sqlite")
+            )
+        llm_cache_nodes = self.config.get("llm_cache_nodes")
+
         # Initialize memories
         self.bull_memory = FinancialSituationMemory("bull_memory", self.config)
         self.bear_memory = FinancialSituationMemory("bear_memory", self.config)
@@ -106,23 +135,85 @@ class TradingAgentsGraph:
             self.invest_judge_memory,
             self.risk_manager_memory,
             self.conditional_logic,
+            llm_cache=self.llm_cache,
+            llm_cache_nodes=llm_cache_nodes,
         )
 
-        self.propagator = Propagator()
-        self.reflector = Reflector(self.quick_thinking_llm)
-        self.signal_processor = SignalProcessor(self.quick_thinking_llm)
+        self.propagator = Propagator(
+            max_concurrency=self.config.get("tool_max_concurrency")
+        )
+        self.reflector = Reflector(
+            with_llm_cache(
+                self.quick_thinking_llm, self.llm_cache, "reflector", llm_cache_nodes
+            )
+        )
+        self.signal_processor = SignalProcessor(
+            with_llm_cache(
+                self.quick_thinking_llm, self.llm_cache, "signal_processor", llm_cache_nodes
+            ),
+            fast_path=self.config.get("signal_fast_path", True),
+        )
 
-        # State tracking
+        # State tracking (last propagate only; run_propagation leaves it untouched)
+        self._last_run_lock = threading.Lock()
         self.curr_state = None
         self.ticker = None
-        self.log_states_dict = {}  # date to full state dict
+        self.tool_memo_stats = None  # tool memo hits/misses of the last propagate
+        self.trace_summary = None  # per node/tool/LLM/vendor timings of the last propagate
+        self.profile_summary = None  # per node wall/cpu/wait times and hotspots of the last profiled propagate
+        self.run_log = RunLog(
+            self.config.get("run_log_dir", "eval_results"),
+            compress=self.config.get("run_log_compress", False),
+        )
+
+        # Tracing
+        self.tracer = None
+        if self.config.get("tracing_enabled", False):
+            self.tracer = Tracer(
+                JsonlSpanExporter(
+                    self.config.get("tracing_path")
+                    or os.path.join(self.config["results_dir"], "traces", "spans.jsonl")
+                )
+            )
+
+        # Metrics: process-wide registry, optionally served over HTTP for long-running workers
+        self.metrics_server = None
+        if self.config.get("metrics_enabled", False):
+            enable_metrics()
+            if self.config.get("metrics_port"):
+                self.metrics_server = start_metrics_server(
+                    self.config["metrics_port"],
+                    self.config.get("metrics_host", "127.0.0.1"),
+                )
+
+        # Checkpointing
+        self.selected_analysts = list(selected_analysts)
+        self.checkpoints = None
+        if self.config.get("checkpoint_enabled", False):
+            self.checkpoints = CheckpointStore(
+                self.config.get("checkpoint_path")
+                or os.path.join(self.config["results_dir"], "checkpoints.sqlite")
+            )
 
         # Set up the graph
-        self.graph = self.graph_setup.setup_graph(selected_analysts)
+        self.graph = self.graph_setup.setup_graph(
+            selected_analysts,
+            parallel_analysts=self.config.get("parallel_analysts", False),
+            checkpointer=self.checkpoints.saver if self.checkpoints else None,
+            report_budget=(
+                self.config.get("context_report_tokens", 1500)
+                if self.config.get("context_budget_enabled", False)
+                else None
+            ),
+        )
 
     def _create_tool_nodes(self) -> Dict[str, ToolNode]:
-        """Create tool nodes for different data sources using abstract methods."""
-        return {
+        """Create tool nodes for different data sources using abstract methods.
+
+        With "tool_memo_enabled", identical tool calls within one propagation are served
+        from a per-run memo (see tool_memo_scope).
+        """
+        tool_nodes = {
             "market": ToolNode(
                 [
                     # Core stock data tools
@@ -157,10 +248,48 @@ class TradingAgentsGraph:
             ),
         }
 
-    def propagate(self, company_name, trade_date):
-        """Run the trading agents graph for a company on a specific date."""
+        if self.config.get("tool_memo_enabled", True):
+            tool_nodes = {
+                name: ToolNode(
+                    [memoize_tool(tool) for tool in node.tools_by_name.values()]
+                )
+                for name, node in tool_nodes.items()
+            }
+        return tool_nodes
+
+    def propagate(self, company_name, trade_date, profile=None):
+        """Run the trading agents graph for a company on a specific date.
+
+        Args:
+            company_name: Ticker symbol
+            trade_date: Trade date (yyyy-mm-dd)
+            profile: Profile this run (see profiling); None = the "profiling_enabled" config
+        """
+
+        final_state, signal, run_info = self._propagate(company_name, trade_date, profile)
 
-        self.ticker = company_name
+        # Store current state for reflection (updated together, so concurrent
+        # propagate calls never leave one run's ticker next to another's state)
+        with self._last_run_lock:
+            self.ticker = company_name
+            self.curr_state = final_state
+            self.tool_memo_stats = run_info["tool_memo_stats"]
+            self.trace_summary = run_info.get("trace_summary")
+            self.profile_summary = run_info.get("profile_summary")
+
+        return final_state, signal
+
+    def run_propagation(self, company_name, trade_date):
+        """Run the graph for one (ticker, date) without touching the per-instance state.
+
+        Unlike propagate, this does not update ticker/curr_state, so several propagations
+        can run concurrently on the same graph (see propagate_batch).
+        """
+        final_state, signal, _ = self._propagate(company_name, trade_date)
+        return final_state, signal
+
+    def _propagate(self, company_name, trade_date, profile=None):
+        """Run and log one propagation; returns (final state, signal, run info)."""
 
         # Initialize state
         init_agent_state = self.propagator.create_initial_state(
@@ -168,33 +297,296 @@ class TradingAgentsGraph:
         )
         args = self.propagator.get_graph_args()
 
+        with self._run_scope(company_name, trade_date, args, profile) as run_info:
+            if self.checkpoints is not None:
+                final_state = self._run_with_checkpoints(
+                    company_name, trade_date, init_agent_state, args
+                )
+            else:
+                final_state = self._run_graph(init_agent_state, args)
+
+            # Log state
+            with trace_span("log_state", "io"):
+                self._log_state(trade_date, final_state, run_info["tool_memo"].stats())
+
+            # Process the decision
+            with trace_span("process_signal", "signal"):
+                signal = self.process_signal(final_state["final_trade_decision"])
+
+        return final_state, signal, run_info
+
+    @contextmanager
+    def _run_scope(self, company_name, trade_date, args, profile=None):
+        """Per-run dataflows config and tool memo and, if enabled, tracing and profiling around one propagation.
+
+        Adds the tracing/profiling/metrics callback handlers to the graph args and counts
+        the run in the propagation metrics. The yielded run info holds "tool_memo" during
+        the run and "tool_memo_stats" (plus "trace_summary" when tracing and
+        "profile_summary" when profiling) after it.
+        """
+        if profile is None:
+            profile = self.config.get("profiling_enabled", False)
+
+        run_info = {}
+        trace = None
+        with ExitStack() as stack:
+            # Dataflows read this graph's config for the run, whatever other graphs set
+            stack.enter_context(config_scope(self.config))
+
+            # Tool results are memoized for this run only
+            tool_memo = stack.enter_context(tool_memo_scope())
+            run_info["tool_memo"] = tool_memo
+
+            if self.tracer is not None:
+                from tradingagents.instrumentation.callbacks import (
+                    TracingCallbackHandler,
+                )
+
+                _add_callback(args, TracingCallbackHandler())
+                trace = stack.enter_context(
+                    self.tracer.trace(
+                        f"propagate {company_name} {trade_date}",
+                        ticker=company_name,
+                        trade_date=str(trade_date),
+                    )
+                )
+
+            if profile:
+                profiler = stack.enter_context(
+                    self.profiling(company_name, trade_date, args)
+                )
+                run_info["profiler"] = profiler
+
+            if self.config.get("metrics_enabled", False):
+                from tradingagents.instrumentation.callbacks import (
+                    MetricsCallbackHandler,
+                )
+
+                _add_callback(args, MetricsCallbackHandler())
+
+            PROPAGATIONS_IN_FLIGHT.inc()
+            started = time.perf_counter()
+            outcome = "error"
+            try:
+                yield run_info
+                outcome = "success"
+            finally:
+                PROPAGATIONS_IN_FLIGHT.dec()
+                PROPAGATIONS.inc(outcome=outcome)
+                PROPAGATION_LATENCY.observe(time.perf_counter() - started)
+
+        if trace is not None:
+            rows = summarize_spans(trace.finished_spans())
+            run_info["trace_summary"] = rows
+            if self.config.get("tracing_print_summary", True):
+                print(format_span_summary(rows, trace.root.duration))
+
+        if "profiler" in run_info:
+            run_info["profile_summary"] = run_info["profiler"].summary()
+
+        run_info["tool_memo_stats"] = tool_memo.stats()
+
+    @contextmanager
+    def profiling(self, company_name, trade_date, args):
+        """Profile the graph run made with args inside the block.
+
+        Node CPU samples, wall/CPU/wait times and the top hotspots are written to
+        <profiling_dir>/<ticker>/<date>_<time>/ (a speedscope file, pstats .prof files
+        and summary.json/.txt) and the summary is printed. Usable around a custom
+        graph.stream loop, as the CLI does.
+
+        Args:
+            company_name: Ticker symbol (names the output directory)
+            trade_date: Trade date (names the output directory)
+            args: Graph args of the run; the profiling callback handler is added to them
+
+        Yields:
+            The RunProfiler
+        """
+        from tradingagents.instrumentation.callbacks import ProfilingCallbackHandler
+
+        profiler = RunProfiler(
+            interval=self.config.get("profiling_interval", 0.005),
+            top_n=self.config.get("profiling_top_n", 20),
+        )
+        _add_callback(args, ProfilingCallbackHandler(profiler))
+        try:
+            with profiler:
+                yield profiler
+        finally:
+            directory = os.path.join(
+                self.config.get("profiling_dir")
+                or os.path.join(self.config["results_dir"], "profiles"),
+                str(company_name),
+                f"{trade_date}_{time.strftime('%H%M%S')}",
+            )
+            profiler.write(directory)
+            print(format_profile_summary(profiler.summary()))
+            print(f"Profiles written to {directory}")
+
+    def _run_graph(self, graph_input, args):
+        """Invoke (or, in debug mode, stream) the graph and return the final state."""
         if self.debug:
             # Debug mode with tracing
             trace = []
-            for chunk in self.graph.stream(init_agent_state, **args):
+            for chunk in self.graph.stream(graph_input, **args):
                 if len(chunk["messages"]) == 0:
                     pass
                 else:
                     chunk["messages"][-1].pretty_print()
                     trace.append(chunk)
 
-            final_state = trace[-1]
-        else:
-            # Standard mode without tracing
-            final_state = self.graph.invoke(init_agent_state, **args)
+            return trace[-1]
 
-        # Store current state for reflection
-        self.curr_state = final_state
+        # Standard mode without tracing
+        return self.graph.invoke(graph_input, **args)
 
-        # Log state
-        self._log_state(trade_date, final_state)
+    def _run_with_checkpoints(self, company_name, trade_date, init_agent_state, args):
+        """Run the graph on a checkpointed thread, resuming or reusing earlier work.
 
-        # Return decision and processed signal
-        return final_state, self.process_signal(final_state["final_trade_decision"])
+        A run whose thread already has a final state returns it; an interrupted one
+        resumes from its last completed node. Otherwise, analyst reports completed by an
+        earlier run with the same analyst configuration are loaded and the graph starts
+        at the research debate.
+        """
+        run_hash = config_hash(
+            self.config, run_config_keys(self.config), extra=self.selected_analysts
+        )
+        analyst_hash = config_hash(
+            self.config, ANALYST_CONFIG_KEYS, extra=sorted(self.selected_analysts)
+        )
+        thread_config = {
+            **args["config"],
+            "configurable": {
+                "thread_id": CheckpointStore.thread_id(
+                    company_name, trade_date, run_hash
+                )
+            },
+        }
+        run_args = {**args, "config": thread_config}
+
+        snapshot = self.graph.get_state(thread_config)
+        if snapshot.values and not snapshot.next:
+            # This exact run already finished
+            return snapshot.values
+
+        graph_input = init_agent_state
+        if snapshot.next:
+            # Interrupted run: continue from the last saved node
+            graph_input = None
+        elif not self.config.get("parallel_analysts", False):
+            reports = self.checkpoints.load_reports(company_name, trade_date, analyst_hash)
+            if reports:
+                # Resume as if the last analyst's message clear just finished
+                last_clear = f"Msg Clear {self.selected_analysts[-1].capitalize()}"
+                self.graph.update_state(
+                    thread_config, {**init_agent_state, **reports}, as_node=last_clear
+                )
+                graph_input = None
+
+        try:
+            return self._run_graph(graph_input, run_args)
+        finally:
+            # Keep finished analyst reports even if a later stage failed
+            values = self.graph.get_state(thread_config).values
+            reports = {
+                ANALYST_REPORT_FIELDS[analyst]: values.get(ANALYST_REPORT_FIELDS[analyst])
+                for analyst in self.selected_analysts
+            }
+            if all(reports.values()):
+                self.checkpoints.save_reports(
+                    company_name, trade_date, analyst_hash, reports
+                )
+
+    def metrics_snapshot(self):
+        """Current values of the process metrics (vendor calls and latencies, cache hit
+        ratios, rate limits, LLM calls/tokens/latency per node, propagations, queue depth).
+
+        Recording requires the "metrics_enabled" config; see also the "metrics_port"
+        Prometheus endpoint.
+        """
+        return snapshot()
+
+    def propagate_batch(self, jobs, max_workers=None, on_result=None):
+        """Run many (ticker, trade_date) jobs concurrently on this graph.
+
+        Args:
+            jobs: Iterable of (ticker, trade_date) pairs
+            max_workers: Maximum concurrent propagations (defaults to "batch_max_workers")
+            on_result: Optional callback invoked with each BatchResult as it finishes
+
+        Returns:
+            List of BatchResult in job order; failures are reported per job
+        """
+        runner = BatchRunner(
+            self, max_workers or self.config.get("batch_max_workers", 4)
+        )
+        return runner.run(jobs, on_result=on_result)
+
+    async def propagate_async(self, company_name, trade_date, profile=None):
+        """Asynchronous variant of propagate.
+
+        Runs the graph with ainvoke/astream, so many tickers can be analyzed concurrently
+        on one event loop, e.g. with asyncio.gather. Tools use their async variants; the
+        agent nodes are dispatched to LangGraph's executor threads. With checkpointing
+        enabled the run goes through the synchronous SQLite checkpointer on a worker
+        thread instead.
 
-    def _log_state(self, trade_date, final_state):
-        """Log the final state to a JSON file."""
-        self.log_states_dict[str(trade_date)] = {
+        Args:
+            company_name: Ticker symbol
+            trade_date: Trade date (yyyy-mm-dd)
+            profile: Profile this run (see profiling); None = the "profiling_enabled" config
+        """
+        if self.checkpoints is not None:
+            final_state, signal, run_info = await asyncio.to_thread(
+                self._propagate, company_name, trade_date, profile
+            )
+        else:
+            init_agent_state = self.propagator.create_initial_state(
+                company_name, trade_date
+            )
+            args = self.propagator.get_graph_args()
+
+            with self._run_scope(company_name, trade_date, args, profile) as run_info:
+                if self.debug:
+                    trace = []
+                    async for chunk in self.graph.astream(init_agent_state, **args):
+                        if len(chunk["messages"]) > 0:
+                            chunk["messages"][-1].pretty_print()
+                            trace.append(chunk)
+
+                    final_state = trace[-1]
+                else:
+                    final_state = await self.graph.ainvoke(init_agent_state, **args)
+
+                with trace_span("log_state", "io"):
+                    await asyncio.to_thread(
+                        self._log_state,
+                        trade_date,
+                        final_state,
+                        run_info["tool_memo"].stats(),
+                    )
+
+                with trace_span("process_signal", "signal"):
+                    signal = await self.signal_processor.aprocess_signal(
+                        final_state["final_trade_decision"]
+                    )
+
+        with self._last_run_lock:
+            self.ticker = company_name
+            self.curr_state = final_state
+            self.tool_memo_stats = run_info["tool_memo_stats"]
+            self.trace_summary = run_info.get("trace_summary")
+            self.profile_summary = run_info.get("profile_summary")
+        return final_state, signal
+
+    def _log_state(self, trade_date, final_state, tool_memo_stats=None):
+        """Append the final state (and the run's tool memo hit counters) to the run log.
+
+        Nothing is kept in memory; read logged states back with self.run_log.
+        """
+        ticker = final_state["company_of_interest"]
+        log_entry = {
             "company_of_interest": final_state["company_of_interest"],
             "trade_date": final_state["trade_date"],
             "market_report": final_state["market_report"],
@@ -223,35 +615,139 @@ class TradingAgentsGraph:
             "investment_plan": final_state["investment_plan"],
             "final_trade_decision": final_state["final_trade_decision"],
         }
+        if tool_memo_stats is not None:
+            log_entry["tool_memo_stats"] = tool_memo_stats
+
+        self.run_log.append(ticker, trade_date, log_entry)
 
-        # Save to file
-        directory = Path(f"eval_results/{self.ticker}/TradingAgentsStrategy_logs/")
-        directory.mkdir(parents=True, exist_ok=True)
+    def reflect_and_remember(self, returns_losses, parallel=None, metadata=None, state=None):
+        """Reflect on decisions and update memory based on returns.
 
-        with open(
-            f"eval_results/{self.ticker}/TradingAgentsStrategy_logs/full_states_log_{trade_date}.json",
-            "w",
-        ) as f:
-            json.dump(self.log_states_dict, f, indent=4)
+        With parallel reflection (argument or the "parallel_reflection" config), the five
+        role reflections run concurrently and a failing role does not stop the others;
+        the failures are returned as a mapping of role name to exception. metadata adds
+        retrieval fields such as sector or market_regime to the stored lessons. state is
+        the final state to reflect on (default: that of the last propagate); pass the
+        state returned by run_propagation when the graph is shared, e.g. by a GraphPool.
+        """
+        if state is None:
+            state = self.curr_state
+        if parallel is None:
+            parallel = self.config.get("parallel_reflection", False)
+
+        if parallel:
+            return self.reflector.reflect_all(
+                state,
+                returns_losses,
+                self._role_memories(),
+                max_workers=self.config.get("reflection_max_workers"),
+                metadata=metadata,
+            )
 
-    def reflect_and_remember(self, returns_losses):
-        """Reflect on decisions and update memory based on returns."""
         self.reflector.reflect_bull_researcher(
-            self.curr_state, returns_losses, self.bull_memory
+            state, returns_losses, self.bull_memory, metadata
         )
         self.reflector.reflect_bear_researcher(
-            self.curr_state, returns_losses, self.bear_memory
+            state, returns_losses, self.bear_memory, metadata
         )
         self.reflector.reflect_trader(
-            self.curr_state, returns_losses, self.trader_memory
+            state, returns_losses, self.trader_memory, metadata
         )
         self.reflector.reflect_invest_judge(
-            self.curr_state, returns_losses, self.invest_judge_memory
+            state, returns_losses, self.invest_judge_memory, metadata
         )
         self.reflector.reflect_risk_manager(
-            self.curr_state, returns_losses, self.risk_manager_memory
+            state, returns_losses, self.risk_manager_memory, metadata
         )
+        return {}
+
+    def reflect_and_remember_batch(self, states_and_returns):
+        """Reflect on many (final_state, returns_losses) pairs concurrently.
+
+        Args:
+            states_and_returns: List of (final state, returns_losses) pairs, e.g. one per
+                (ticker, date) propagation, in the order their lessons should be stored.
+                A third element may hold extra lesson metadata.
+
+        Returns:
+            Mapping of (pair index, role name) to the exception that reflection failed with
+        """
+        return self.reflector.reflect_batch(
+            states_and_returns,
+            self._role_memories(),
+            max_workers=self.config.get("reflection_max_workers"),
+        )
+
+    def compact_memories(self, summarize=False):
+        """Merge near-duplicate lessons and cap the size of every role's memory.
+
+        Args:
+            summarize: Merge duplicate lessons with the LLM instead of keeping the newest one
+
+        Returns:
+            Mapping of role name to compaction statistics
+        """
+        compactor = MemoryCompactor(
+            similarity_threshold=self.config.get("memory_compaction_threshold", 0.95),
+            max_size=self.config.get("memory_max_size"),
+            summarizer=self.reflector.summarize_lessons if summarize else None,
+        )
+        return {
+            role: compactor.compact(memory)
+            for role, memory in self._role_memories().items()
+        }
+
+    def _role_memories(self):
+        """Map reflection role names to their memories."""
+        return {
+            "bull": self.bull_memory,
+            "bear": self.bear_memory,
+            "trader": self.trader_memory,
+            "invest_judge": self.invest_judge_memory,
+            "risk_manager": self.risk_manager_memory,
+        }
+
+    def close(self):
+        """Release the role memories' collections; the graph must not run afterwards."""
+        for memory in self._role_memories().values():
+            memory.close()
+
+    def backtest(
+        self,
+        tickers,
+        start_date,
+        end_date,
+        holding_period=1,
+        max_workers=None,
+        dates_per_wave=None,
+    ):
+        """Run the agents over every trading day in a date range and score the decisions.
+
+        See Backtester for how date-level parallelism (dates_per_wave) stays look-ahead-free.
+
+        Returns:
+            DataFrame with decision, forward return and PnL per (ticker, trade date)
+        """
+        from .backtest import Backtester
+
+        backtester = Backtester(
+            self,
+            holding_period=holding_period,
+            max_workers=max_workers or self.config.get("batch_max_workers", 4),
+            dates_per_wave=dates_per_wave,
+        )
+        with config_scope(self.config):
+            return backtester.run(tickers, start_date, end_date)
+
+    def llm_cache_stats(self):
+        """Hit/miss statistics of the LLM response cache per node type (empty if disabled)."""
+        return self.llm_cache.stats() if self.llm_cache is not None else {}
 
     def process_signal(self, full_signal):
         """Process a signal to extract the core decision."""
         return self.signal_processor.process_signal(full_signal)
+
+
+def _add_callback(args, handler):
+    """Add a callback handler to the graph args of a run."""
+    args["config"]["callbacks"] = list(args["config"].get("callbacks") or []) + [handler]
@@ -0,0 +1,42 @@
+# The LangChain callback handlers live in .callbacks, so the dataflows layer can record
+# spans without importing langchain_core.
+from .metrics import (
+    REGISTRY,
+    MetricsRegistry,
+    MetricsServer,
+    enable_metrics,
+    snapshot,
+    start_metrics_server,
+)
+from .profiling import RunProfiler, format_profile_summary
+from .tracing import (
+    JsonlSpanExporter,
+    Span,
+    Trace,
+    Tracer,
+    current_trace,
+    format_span_summary,
+    record_event,
+    summarize_spans,
+    trace_span,
+)
+
+__all__ = [
+    "JsonlSpanExporter",
+    "MetricsRegistry",
+    "MetricsServer",
+    "REGISTRY",
+    "RunProfiler",
+    "Span",
+    "Trace",
+    "Tracer",
+    "current_trace",
+    "enable_metrics",
+    "format_profile_summary",
+    "format_span_summary",
+    "record_event",
+    "snapshot",
+    "start_metrics_server",
+    "summarize_spans",
+    "trace_span",
+]
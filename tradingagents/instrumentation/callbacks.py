@@ -0,0 +1,240 @@
+import threading
+import time
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+from .metrics import LLM_CALLS, LLM_LATENCY, LLM_TOKENS
+from .tracing import (
+    current_trace,
+    end_span,
+    reset_current_span,
+    set_current_span,
+    start_span,
+)
+
+
+class TracingCallbackHandler(BaseCallbackHandler):
+    """LangChain callback handler turning graph nodes, LLM calls and tool calls into spans.
+
+    Node and tool spans become the current span of the context they run in, so vendor
+    attempts and cache lookups made inside them are recorded as their children.
+    """
+
+    # Run in the node's own thread/context instead of LangChain's callback executor
+    run_inline = True
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._spans: Dict[UUID, Any] = {}
+        self._tokens: Dict[UUID, Any] = {}
+        self._parents: Dict[UUID, Optional[UUID]] = {}
+
+    # Graph nodes
+
+    def on_chain_start(self, serialized, inputs, *, run_id, parent_run_id=None, metadata=None, **kwargs):
+        with self._lock:
+            self._parents[run_id] = parent_run_id
+        node = (metadata or {}).get("langgraph_node")
+        name = kwargs.get("name") or (serialized or {}).get("name")
+        # Only the node task itself, not the runnables nested inside it
+        if node and name == node and current_trace() is not None:
+            self._open(run_id, parent_run_id, node, "node", set_current=True)
+
+    def on_chain_end(self, outputs, *, run_id, **kwargs):
+        self._close(run_id)
+
+    def on_chain_error(self, error, *, run_id, **kwargs):
+        self._close(run_id, error=error)
+
+    # LLM calls
+
+    def on_chat_model_start(self, serialized, messages, *, run_id, parent_run_id=None, metadata=None, **kwargs):
+        prompt_chars = sum(len(str(m.content)) for batch in messages for m in batch)
+        self._open_llm(run_id, parent_run_id, serialized, metadata, kwargs, prompt_chars)
+
+    def on_llm_start(self, serialized, prompts, *, run_id, parent_run_id=None, metadata=None, **kwargs):
+        prompt_chars = sum(len(prompt) for prompt in prompts)
+        self._open_llm(run_id, parent_run_id, serialized, metadata, kwargs, prompt_chars)
+
+    def on_llm_end(self, response, *, run_id, **kwargs):
+        input_tokens = output_tokens = output_chars = 0
+        for generations in response.generations:
+            for generation in generations:
+                output_chars += len(generation.text or "")
+                usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+                if usage:
+                    input_tokens += usage.get("input_tokens", 0)
+                    output_tokens += usage.get("output_tokens", 0)
+        if not (input_tokens or output_tokens):
+            usage = (response.llm_output or {}).get("token_usage") or {}
+            input_tokens = usage.get("prompt_tokens", 0)
+            output_tokens = usage.get("completion_tokens", 0)
+        self._close(
+            run_id,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            output_chars=output_chars,
+        )
+
+    def on_llm_error(self, error, *, run_id, **kwargs):
+        self._close(run_id, error=error)
+
+    # Tool calls
+
+    def on_tool_start(self, serialized, input_str, *, run_id, parent_run_id=None, **kwargs):
+        if current_trace() is None:
+            return
+        name = kwargs.get("name") or (serialized or {}).get("name", "tool")
+        self._open(
+            run_id,
+            parent_run_id,
+            name,
+            "tool",
+            set_current=True,
+            input_chars=len(input_str or ""),
+        )
+
+    def on_tool_end(self, output, *, run_id, **kwargs):
+        content = getattr(output, "content", output)
+        self._close(run_id, output_chars=len(str(content)))
+
+    def on_tool_error(self, error, *, run_id, **kwargs):
+        self._close(run_id, error=error)
+
+    # Helpers
+
+    def _open_llm(self, run_id, parent_run_id, serialized, metadata, kwargs, prompt_chars):
+        with self._lock:
+            self._parents[run_id] = parent_run_id
+        if current_trace() is None:
+            return
+        params = kwargs.get("invocation_params") or {}
+        node = (metadata or {}).get("langgraph_node")
+        self._open(
+            run_id,
+            parent_run_id,
+            node or (serialized or {}).get("name", "llm"),
+            "llm",
+            model=params.get("model") or params.get("model_name"),
+            prompt_chars=prompt_chars,
+        )
+
+    def _open(self, run_id, parent_run_id, name, kind, set_current=False, **attributes):
+        span = start_span(name, kind, parent=self._nearest_span(parent_run_id), **attributes)
+        if span is None:
+            return
+        with self._lock:
+            self._spans[run_id] = span
+            self._parents.setdefault(run_id, parent_run_id)
+        if set_current:
+            token = set_current_span(span)
+            with self._lock:
+                self._tokens[run_id] = token
+
+    def _close(self, run_id, error=None, **attributes):
+        with self._lock:
+            span = self._spans.pop(run_id, None)
+            token = self._tokens.pop(run_id, None)
+            self._parents.pop(run_id, None)
+        if token is not None:
+            reset_current_span(token)
+        end_span(span, error=error, **attributes)
+
+    def _nearest_span(self, run_id):
+        """Span of the closest traced ancestor run, skipping untraced wrapper runnables."""
+        with self._lock:
+            while run_id is not None:
+                if run_id in self._spans:
+                    return self._spans[run_id]
+                run_id = self._parents.get(run_id)
+        return None
+
+
+class ProfilingCallbackHandler(BaseCallbackHandler):
+    """Tells a RunProfiler which graph node each thread is currently working for.
+
+    Node runs and the tool calls they make are registered from the thread executing
+    them, so samples of tool worker threads are attributed to the calling node.
+    """
+
+    run_inline = True
+
+    def __init__(self, profiler):
+        self.profiler = profiler
+
+    def on_chain_start(self, serialized, inputs, *, run_id, metadata=None, **kwargs):
+        node = (metadata or {}).get("langgraph_node")
+        name = kwargs.get("name") or (serialized or {}).get("name")
+        if node and name == node:
+            self.profiler.enter(run_id, node, "node")
+
+    def on_chain_end(self, outputs, *, run_id, **kwargs):
+        self.profiler.exit(run_id)
+
+    def on_chain_error(self, error, *, run_id, **kwargs):
+        self.profiler.exit(run_id)
+
+    def on_tool_start(self, serialized, input_str, *, run_id, metadata=None, **kwargs):
+        node = (metadata or {}).get("langgraph_node")
+        if node:
+            self.profiler.enter(run_id, node, "tool")
+
+    def on_tool_end(self, output, *, run_id, **kwargs):
+        self.profiler.exit(run_id)
+
+    def on_tool_error(self, error, *, run_id, **kwargs):
+        self.profiler.exit(run_id)
+
+
+class MetricsCallbackHandler(BaseCallbackHandler):
+    """Records LLM calls, latency and token usage per graph node in the metrics registry."""
+
+    run_inline = True
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._llm_runs: Dict[UUID, Any] = {}
+
+    def on_chat_model_start(self, serialized, messages, *, run_id, metadata=None, **kwargs):
+        self._start(run_id, metadata)
+
+    def on_llm_start(self, serialized, prompts, *, run_id, metadata=None, **kwargs):
+        self._start(run_id, metadata)
+
+    def on_llm_end(self, response, *, run_id, **kwargs):
+        run = self._finish(run_id)
+        if run is None:
+            return
+        node, started = run
+        input_tokens = output_tokens = 0
+        for generations in response.generations:
+            for generation in generations:
+                usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+                if usage:
+                    input_tokens += usage.get("input_tokens", 0)
+                    output_tokens += usage.get("output_tokens", 0)
+        if not (input_tokens or output_tokens):
+            usage = (response.llm_output or {}).get("token_usage") or {}
+            input_tokens = usage.get("prompt_tokens", 0)
+            output_tokens = usage.get("completion_tokens", 0)
+        LLM_CALLS.inc(node=node, outcome="success")
+        LLM_LATENCY.observe(time.perf_counter() - started, node=node)
+        LLM_TOKENS.inc(input_tokens, node=node, direction="input")
+        LLM_TOKENS.inc(output_tokens, node=node, direction="output")
+
+    def on_llm_error(self, error, *, run_id, **kwargs):
+        run = self._finish(run_id)
+        if run is not None:
+            LLM_CALLS.inc(node=run[0], outcome="error")
+            LLM_LATENCY.observe(time.perf_counter() - run[1], node=run[0])
+
+    def _start(self, run_id, metadata):
+        node = (metadata or {}).get("langgraph_node") or "(none)"
+        with self._lock:
+            self._llm_runs[run_id] = (node, time.perf_counter())
+
+    def _finish(self, run_id):
+        with self._lock:
+            return self._llm_runs.pop(run_id, None)
@@ -0,0 +1,328 @@
+import json
+import math
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Latency buckets in seconds, from cache hits to slow LLM/vendor calls
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+class _Metric:
+    """Base of the metric types: one value (or histogram) per label combination."""
+
+    kind = ""
+
+    def __init__(self, registry, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        self._registry = registry
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, ...], Any] = {}
+
+    def _key(self, labels) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self) -> List[Tuple[Dict[str, str], Any]]:
+        with self._lock:
+            items = list(self._values.items())
+        return [(dict(zip(self.labelnames, key)), _copy(value)) for key, value in sorted(items)]
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels):
+        if not self._registry.enabled:
+            return
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def set(self, value: float, **labels):
+        if not self._registry.enabled:
+            return
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels):
+        if not self._registry.enabled:
+            return
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels):
+        self.inc(-amount, **labels)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, registry, name, help_text, labelnames=(), buckets: Iterable[float] = DEFAULT_BUCKETS):
+        super().__init__(registry, name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        if not self._registry.enabled:
+            return
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = {"count": 0, "sum": 0.0, "buckets": [0] * len(self.buckets)}
+            state["count"] += 1
+            state["sum"] += value
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state["buckets"][index] += 1
+                    break
+
+
+class MetricsRegistry:
+    """Process-wide, thread-safe set of counters, gauges and histograms.
+
+    Recording is a no-op until the registry is enabled (metrics_enabled config), so the
+    instrumented code paths cost nothing by default.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, _Metric] = {}
+
+    def counter(self, name, help_text, labelnames=()) -> Counter:
+        return self._register(Counter, name, help_text, labelnames)
+
+    def gauge(self, name, help_text, labelnames=()) -> Gauge:
+        return self._register(Gauge, name, help_text, labelnames)
+
+    def histogram(self, name, help_text, labelnames=(), buckets=DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram, name, help_text, labelnames, buckets=buckets)
+
+    def _register(self, cls, name, help_text, labelnames, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(self, name, help_text, labelnames, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"Metric {name} is already registered as a {metric.kind}")
+            return metric
+
+    def metrics(self) -> List[_Metric]:
+        with self._lock:
+            return [self._metrics[name] for name in sorted(self._metrics)]
+
+    def reset(self):
+        """Zero every metric (the metric definitions are kept)."""
+        for metric in self.metrics():
+            metric.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current values of every metric plus derived cache hit ratios.
+
+        Returns:
+            {"metrics": {name: {"type", "help", "samples": [{"labels", "value"}]}},
+             "cache_hit_ratio": {cache: ratio}}
+        """
+        metrics = {}
+        for metric in self.metrics():
+            metrics[metric.name] = {
+                "type": metric.kind,
+                "help": metric.help,
+                "samples": [{"labels": labels, "value": value} for labels, value in metric.samples()],
+            }
+            if metric.kind == "histogram":
+                metrics[metric.name]["bucket_bounds"] = list(metric.buckets)
+        return {"metrics": metrics, "cache_hit_ratio": cache_hit_ratios(self)}
+
+    def render_prometheus(self) -> str:
+        """All metrics in the Prometheus text exposition format (version 0.0.4)."""
+        lines = []
+        for metric in self.metrics():
+            lines.append(f"# HELP {metric.name} {_escape_help(metric.help)}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for labels, value in metric.samples():
+                if metric.kind == "histogram":
+                    cumulative = 0
+                    for bound, count in zip(metric.buckets, value["buckets"]):
+                        cumulative += count
+                        lines.append(f"{metric.name}_bucket{_labels(labels, le=_number(bound))} {cumulative}")
+                    lines.append(f"{metric.name}_bucket{_labels(labels, le='+Inf')} {value['count']}")
+                    lines.append(f"{metric.name}_sum{_labels(labels)} {_number(value['sum'])}")
+                    lines.append(f"{metric.name}_count{_labels(labels)} {value['count']}")
+                else:
+                    lines.append(f"{metric.name}{_labels(labels)} {_number(value)}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+# Dataflows
+VENDOR_CALLS = REGISTRY.counter(
+    "tradingagents_vendor_calls_total", "Vendor attempts by method, vendor and outcome", ("method", "vendor", "outcome")
+)
+VENDOR_LATENCY = REGISTRY.histogram(
+    "tradingagents_vendor_latency_seconds", "Latency of vendor attempts", ("method", "vendor")
+)
+VENDOR_RATE_LIMITS = REGISTRY.counter(
+    "tradingagents_vendor_rate_limited_total", "Vendor attempts rejected by a rate limit", ("vendor",)
+)
+CACHE_REQUESTS = REGISTRY.counter(
+    "tradingagents_cache_requests_total", "Cache lookups by cache and result (hit/miss)", ("cache", "result")
+)
+
+# Graph
+LLM_CALLS = REGISTRY.counter("tradingagents_llm_calls_total", "LLM calls by graph node and outcome", ("node", "outcome"))
+LLM_LATENCY = REGISTRY.histogram("tradingagents_llm_latency_seconds", "LLM call latency by graph node", ("node",))
+LLM_TOKENS = REGISTRY.counter("tradingagents_llm_tokens_total", "LLM tokens by graph node and direction", ("node", "direction"))
+PROPAGATIONS = REGISTRY.counter("tradingagents_propagations_total", "Finished propagations by outcome", ("outcome",))
+PROPAGATION_LATENCY = REGISTRY.histogram("tradingagents_propagation_seconds", "Duration of whole propagations")
+PROPAGATIONS_IN_FLIGHT = REGISTRY.gauge("tradingagents_propagations_in_flight", "Propagations currently running")
+BATCH_QUEUE_DEPTH = REGISTRY.gauge("tradingagents_batch_queue_depth", "Batch jobs submitted but not yet started")
+
+
+def enable_metrics(enabled: bool = True):
+    """Start (or stop) recording into the process registry."""
+    REGISTRY.enabled = enabled
+
+
+def snapshot() -> Dict[str, Any]:
+    """Snapshot of the process registry (see MetricsRegistry.snapshot)."""
+    return REGISTRY.snapshot()
+
+
+def observe_vendor_attempt(method, vendor, outcome, latency):
+    if not REGISTRY.enabled:
+        return
+    VENDOR_CALLS.inc(method=method, vendor=vendor, outcome=outcome)
+    VENDOR_LATENCY.observe(latency, method=method, vendor=vendor)
+    if outcome == "rate_limited":
+        VENDOR_RATE_LIMITS.inc(vendor=vendor)
+
+
+def observe_cache(cache: str, hit: bool):
+    CACHE_REQUESTS.inc(cache=cache, result="hit" if hit else "miss")
+
+
+def cache_hit_ratios(registry=REGISTRY) -> Dict[str, float]:
+    """Hit ratio of every cache that has seen lookups."""
+    counts: Dict[str, Dict[str, float]] = {}
+    metric = next((m for m in registry.metrics() if m.name == CACHE_REQUESTS.name), None)
+    for labels, value in metric.samples() if metric else []:
+        counts.setdefault(labels["cache"], {"hit": 0.0, "miss": 0.0})[labels["result"]] = value
+    return {
+        cache: round(result["hit"] / (result["hit"] + result["miss"]), 4)
+        for cache, result in sorted(counts.items())
+        if result["hit"] + result["miss"]
+    }
+
+
+class MetricsServer:
+    """Local HTTP endpoint serving /metrics (Prometheus text) and /snapshot (JSON)."""
+
+    def __init__(self, registry: MetricsRegistry = REGISTRY, host: str = "127.0.0.1", port: int = 9464):
+        # http.server is only needed once an endpoint is started
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        self.registry = registry
+        registry_ref = registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                path = self.path.split("?", 1)[0]
+                if path == "/metrics":
+                    body = registry_ref.render_prometheus().encode("utf-8")
+                    content_type = "text/plain; version=0.0.4; charset=utf-8"
+                elif path == "/snapshot":
+                    body = json.dumps(registry_ref.snapshot()).encode("utf-8")
+                    content_type = "application/json"
+                else:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        return self._server.server_address[:2]
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="tradingagents-metrics", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+_servers: Dict[Tuple[str, int], MetricsServer] = {}
+_servers_lock = threading.Lock()
+
+
+def start_metrics_server(port: int = 9464, host: str = "127.0.0.1") -> MetricsServer:
+    """Serve the process registry on host:port (once per address) and enable recording."""
+    enable_metrics()
+    with _servers_lock:
+        server = _servers.get((host, port))
+        if server is None:
+            server = _servers[(host, port)] = MetricsServer(REGISTRY, host, port).start()
+        return server
+
+
+def _copy(value):
+    if isinstance(value, dict):
+        return {"count": value["count"], "sum": value["sum"], "buckets": list(value["buckets"])}
+    return value
+
+
+def _number(value) -> str:
+    if isinstance(value, float):
+        if math.isinf(value):
+            return "+Inf" if value > 0 else "-Inf"
+        if value.is_integer():
+            return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def _labels(labels: Dict[str, str], **extra) -> str:
+    labels = {**labels, **extra}
+    if not labels:
+        return ""
+    pairs = ",".join(f'{name}="{_escape_label(value)}"' for name, value in labels.items())
+    return "{" + pairs + "}"
+
+
+def _escape_label(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _escape_help(text) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
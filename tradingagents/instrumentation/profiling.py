@@ -0,0 +1,331 @@
+import json
+import marshal
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+# Leaf functions/modules where a sampled thread is blocked rather than computing
+_WAIT_FUNCTIONS = {
+    "acquire", "wait", "sleep", "select", "poll", "epoll", "recv", "recv_into", "read",
+    "readinto", "readline", "connect", "create_connection", "getaddrinfo", "do_handshake",
+    "_wait_for_tstate_lock", "join",
+}
+_WAIT_MODULES = ("threading.py", "selectors.py", "socket.py", "ssl.py", "queue.py", "_base.py")
+
+_MAX_STACK_DEPTH = 128
+
+# Label of samples taken in the propagating thread outside any node
+OUTSIDE_NODES = "(graph)"
+
+
+class RunProfiler:
+    """Sampling CPU profiler of one propagation, attributing samples to graph nodes.
+
+    A background thread snapshots the stacks of every thread running a node (or a tool
+    call made by one) every `interval` seconds; ProfilingCallbackHandler tells it which
+    node each thread is working for. Unlike cProfile this sees the worker threads of
+    parallel analysts and tool calls and adds no per-call overhead. Node entries also
+    record wall-clock and thread CPU time, so waiting time (LLM, network, locks) can be
+    told apart from computation.
+
+    Results are written as a speedscope file (the format of `py-spy record -f
+    speedscope`), pstats-compatible .prof files (all nodes and one per node) and a
+    top-N hotspot summary.
+    """
+
+    def __init__(self, interval: float = 0.005, top_n: int = 20):
+        """Initialize the profiler.
+
+        Args:
+            interval: Seconds between samples
+            top_n: Number of hotspots in the summary
+        """
+        self.interval = interval
+        self.top_n = top_n
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+        self._owner: Optional[int] = None
+        self._thread_nodes: Dict[int, List[str]] = {}
+        self._entries: Dict[Any, Tuple[int, str, str, float, float]] = {}
+        self._frames: Dict[Tuple[str, int, str], int] = {}
+        self._stacks: Dict[str, Counter] = defaultdict(Counter)
+        self._wait_samples: Counter = Counter()
+        self._nodes: Dict[str, Dict[str, float]] = defaultdict(
+            lambda: {"calls": 0, "wall_s": 0.0, "cpu_s": 0.0}
+        )
+        self.started_at = None
+        self.duration = 0.0
+
+    # Lifecycle
+
+    def start(self):
+        self._owner = threading.get_ident()
+        self.started_at = time.perf_counter()
+        self._stop.clear()
+        self._sampler = threading.Thread(target=self._sample_loop, name="tradingagents-profiler", daemon=True)
+        self._sampler.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.join()
+            self._sampler = None
+        self.duration = time.perf_counter() - self.started_at
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+    # Node bookkeeping (called by ProfilingCallbackHandler from the node's thread)
+
+    def enter(self, run_id, node: str, kind: str = "node"):
+        thread = threading.get_ident()
+        with self._lock:
+            self._thread_nodes.setdefault(thread, []).append(node)
+            self._entries[run_id] = (thread, node, kind, time.perf_counter(), time.thread_time())
+
+    def exit(self, run_id):
+        cpu_now = time.thread_time()
+        thread = threading.get_ident()
+        with self._lock:
+            entry = self._entries.pop(run_id, None)
+            if entry is None:
+                return
+            entry_thread, node, kind, started, cpu_started = entry
+            stack = self._thread_nodes.get(entry_thread)
+            if stack and node in stack:
+                # Remove the innermost occurrence (entries of one thread nest)
+                del stack[len(stack) - 1 - stack[::-1].index(node)]
+            if not stack:
+                self._thread_nodes.pop(entry_thread, None)
+            stats = self._nodes[node]
+            if kind == "node":
+                stats["calls"] += 1
+                stats["wall_s"] += time.perf_counter() - started
+            if entry_thread == thread:
+                stats["cpu_s"] += cpu_now - cpu_started
+
+    # Sampling
+
+    def _sample_loop(self):
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            frames = sys._current_frames()
+            with self._lock:
+                for thread, frame in frames.items():
+                    if thread == own:
+                        continue
+                    nodes = self._thread_nodes.get(thread)
+                    if nodes:
+                        label = nodes[-1]
+                    elif thread == self._owner:
+                        label = OUTSIDE_NODES
+                    else:
+                        continue
+                    stack = self._stack(frame)
+                    self._stacks[label][stack] += 1
+                    if _is_waiting(frame):
+                        self._wait_samples[label] += 1
+
+    def _stack(self, frame) -> Tuple[int, ...]:
+        """Interned frame indexes of a stack, root first."""
+        keys = []
+        while frame is not None and len(keys) < _MAX_STACK_DEPTH:
+            code = frame.f_code
+            keys.append((code.co_filename, code.co_firstlineno, code.co_name))
+            frame = frame.f_back
+        return tuple(self._frames.setdefault(key, len(self._frames)) for key in reversed(keys))
+
+    # Results
+
+    def summary(self) -> Dict[str, Any]:
+        """Per-node timing breakdown and the top-N self-time hotspots.
+
+        Returns:
+            {"duration_s", "interval_s", "samples", "nodes": [...], "hotspots": [...]}
+        """
+        with self._lock:
+            stacks = {label: Counter(counts) for label, counts in self._stacks.items()}
+            wait_samples = Counter(self._wait_samples)
+            node_stats = {node: dict(stats) for node, stats in self._nodes.items()}
+        frames = self._frame_list()
+
+        nodes = []
+        for node in sorted(set(node_stats) | set(stacks)):
+            stats = node_stats.get(node, {"calls": 0, "wall_s": 0.0, "cpu_s": 0.0})
+            samples = sum(stacks.get(node, {}).values())
+            nodes.append(
+                {
+                    "node": node,
+                    "calls": stats["calls"],
+                    "wall_s": round(stats["wall_s"], 4),
+                    "cpu_s": round(stats["cpu_s"], 4),
+                    "wait_s": round(max(0.0, stats["wall_s"] - stats["cpu_s"]), 4),
+                    "samples": samples,
+                    "sampled_wait_pct": round(100.0 * wait_samples[node] / samples, 1) if samples else 0.0,
+                }
+            )
+        nodes.sort(key=lambda row: row["wall_s"], reverse=True)
+
+        self_samples = Counter()
+        for counts in stacks.values():
+            for stack, count in counts.items():
+                if stack:
+                    self_samples[stack[-1]] += count
+        total = sum(self_samples.values())
+        hotspots = [
+            {
+                "function": frames[index][2],
+                "location": f"{frames[index][0]}:{frames[index][1]}",
+                "self_s": round(count * self.interval, 4),
+                "self_pct": round(100.0 * count / total, 1),
+            }
+            for index, count in self_samples.most_common(self.top_n)
+        ]
+        return {
+            "duration_s": round(self.duration, 4),
+            "interval_s": self.interval,
+            "samples": total,
+            "nodes": nodes,
+            "hotspots": hotspots,
+        }
+
+    def write(self, directory) -> Dict[str, str]:
+        """Write profile.speedscope.json, all.prof, one .prof per node and summary.json/.txt.
+
+        Returns:
+            Mapping of artifact name to file path
+        """
+        os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            stacks = {label: Counter(counts) for label, counts in self._stacks.items()}
+        frames = self._frame_list()
+        paths = {}
+
+        paths["speedscope"] = os.path.join(directory, "profile.speedscope.json")
+        with open(paths["speedscope"], "w", encoding="utf-8") as f:
+            json.dump(self._speedscope(stacks, frames), f)
+
+        paths["prof"] = os.path.join(directory, "all.prof")
+        combined = Counter()
+        for counts in stacks.values():
+            combined.update(counts)
+        _write_pstats(paths["prof"], combined, frames, self.interval)
+        for label, counts in stacks.items():
+            _write_pstats(os.path.join(directory, f"node_{_slug(label)}.prof"), counts, frames, self.interval)
+
+        summary = self.summary()
+        paths["summary"] = os.path.join(directory, "summary.json")
+        with open(paths["summary"], "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+        paths["summary_text"] = os.path.join(directory, "summary.txt")
+        with open(paths["summary_text"], "w", encoding="utf-8") as f:
+            f.write(format_profile_summary(summary) + "\n")
+        return paths
+
+    def _frame_list(self) -> List[Tuple[str, int, str]]:
+        with self._lock:
+            frames = [None] * len(self._frames)
+            for key, index in self._frames.items():
+                frames[index] = key
+        return frames
+
+    def _speedscope(self, stacks, frames):
+        profiles = []
+        for label, counts in sorted(stacks.items()):
+            samples, weights = [], []
+            for stack, count in counts.items():
+                samples.append(list(stack))
+                weights.append(count * self.interval)
+            profiles.append(
+                {
+                    "type": "sampled",
+                    "name": label,
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": sum(weights),
+                    "samples": samples,
+                    "weights": weights,
+                }
+            )
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {
+                "frames": [{"name": name, "file": filename, "line": line} for filename, line, name in frames]
+            },
+            "profiles": profiles,
+            "name": "tradingagents propagate",
+            "activeProfileIndex": 0,
+            "exporter": "tradingagents",
+        }
+
+
+def format_profile_summary(summary: Dict[str, Any]) -> str:
+    """Plain-text table of a RunProfiler summary."""
+    lines = [
+        f"Profile: {summary['duration_s']:.2f}s, {summary['samples']} samples every {summary['interval_s'] * 1000:.0f}ms",
+        f"{'node':<28}{'calls':>6}{'wall s':>9}{'cpu s':>9}{'wait s':>9}{'wait %':>8}",
+    ]
+    for row in summary["nodes"]:
+        lines.append(
+            f"{row['node'][:27]:<28}{row['calls']:>6}{row['wall_s']:>9.2f}{row['cpu_s']:>9.2f}"
+            f"{row['wait_s']:>9.2f}{row['sampled_wait_pct']:>8.1f}"
+        )
+    lines.append("")
+    lines.append(f"Top {len(summary['hotspots'])} hotspots (self time):")
+    for row in summary["hotspots"]:
+        lines.append(f"{row['self_s']:>9.3f}s {row['self_pct']:>5.1f}%  {row['function']}  {row['location']}")
+    return "\n".join(lines)
+
+
+def _is_waiting(frame) -> bool:
+    code = frame.f_code
+    return code.co_name in _WAIT_FUNCTIONS or code.co_filename.endswith(_WAIT_MODULES)
+
+
+def _slug(label):
+    return re.sub(r"[^A-Za-z0-9]+", "_", label).strip("_").lower() or "node"
+
+
+def _write_pstats(path, counts, frames, interval):
+    """Write sampled stacks in the marshalled format read by pstats.Stats / snakeviz.
+
+    Call counts are sample counts; self (tt) and cumulative (ct) times are sample
+    counts times the sampling interval.
+    """
+    stats: Dict[Tuple, list] = {}
+    callers: Dict[Tuple, Dict[Tuple, list]] = defaultdict(dict)
+
+    for stack, count in counts.items():
+        if not stack:
+            continue
+        weight = count * interval
+        keys = [frames[index] for index in stack]
+        for key in set(keys):
+            entry = stats.setdefault(key, [0, 0, 0.0, 0.0])
+            entry[0] += count
+            entry[1] += count
+            entry[3] += weight
+        stats[keys[-1]][2] += weight
+        for parent, child in set(zip(keys, keys[1:])):
+            edge = callers[child].setdefault(parent, [0, 0, 0.0, 0.0])
+            edge[0] += count
+            edge[1] += count
+            edge[2] += weight if child == keys[-1] else 0.0
+            edge[3] += weight
+
+    marshalled = {
+        key: (cc, nc, tt, ct, {parent: tuple(edge) for parent, edge in callers[key].items()})
+        for key, (cc, nc, tt, ct) in stats.items()
+    }
+    with open(path, "wb") as f:
+        marshal.dump(marshalled, f)
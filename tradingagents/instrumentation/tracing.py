@@ -0,0 +1,252 @@
+import json
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Trace of the propagation running in the current context, and the innermost open span
+_current_trace: ContextVar[Optional["Trace"]] = ContextVar("current_trace", default=None)
+_current_span: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+
+@dataclass
+class Span:
+    """One timed operation: a graph node, LLM call, tool call, vendor attempt or cache lookup."""
+
+    name: str
+    kind: str
+    trace_id: str
+    span_id: str = field(default_factory=lambda: uuid.uuid4().hex[:16])
+    parent_id: Optional[str] = None
+    start_time: float = field(default_factory=time.time)
+    end_time: Optional[float] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    status: str = "ok"
+
+    @property
+    def duration(self) -> float:
+        return (self.end_time or time.time()) - self.start_time
+
+    def set(self, **attributes):
+        """Add attributes (token counts, payload sizes, cache hits, ...) to the span."""
+        self.attributes.update(attributes)
+
+    def to_otel(self) -> Dict[str, Any]:
+        """The span as an OpenTelemetry-style JSON object."""
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": int(self.start_time * 1e9),
+            "endTimeUnixNano": int((self.end_time or time.time()) * 1e9),
+            "attributes": self.attributes,
+            "status": {"code": self.status.upper()},
+        }
+
+
+class _NullSpan:
+    """Stand-in returned when no trace is active, so callers never need to check."""
+
+    def set(self, **attributes):
+        pass
+
+
+NULL_SPAN = _NullSpan()
+
+
+class Trace:
+    """All spans recorded during one propagation."""
+
+    def __init__(self, name: str, **attributes):
+        self.trace_id = uuid.uuid4().hex
+        self.root = Span(name=name, kind="graph", trace_id=self.trace_id, attributes=attributes)
+        self.spans: List[Span] = [self.root]
+        self._lock = threading.Lock()
+
+    def add(self, span: Span):
+        with self._lock:
+            self.spans.append(span)
+
+    def finished_spans(self) -> List[Span]:
+        with self._lock:
+            return list(self.spans)
+
+
+class JsonlSpanExporter:
+    """Appends finished spans as OpenTelemetry-style JSON objects, one per line."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def export(self, spans: List[Span]):
+        lines = "".join(json.dumps(span.to_otel(), default=str) + "\n" for span in spans)
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(lines)
+
+
+class Tracer:
+    """Records spans for the propagation running in the current context.
+
+    Spans opened outside a trace are not recorded, so instrumented code (vendor routing,
+    caches) costs next to nothing when tracing is off.
+    """
+
+    def __init__(self, exporter: Optional[JsonlSpanExporter] = None):
+        self.exporter = exporter
+
+    @contextmanager
+    def trace(self, name: str, **attributes):
+        """Record every span started in this context (and its worker threads) as one trace."""
+        trace = Trace(name, **attributes)
+        trace_token = _current_trace.set(trace)
+        span_token = _current_span.set(trace.root)
+        try:
+            yield trace
+        except BaseException as e:
+            trace.root.status = "error"
+            trace.root.set(error=f"{type(e).__name__}: {e}")
+            raise
+        finally:
+            trace.root.end_time = time.time()
+            _current_span.reset(span_token)
+            _current_trace.reset(trace_token)
+            if self.exporter is not None:
+                self.exporter.export(trace.finished_spans())
+
+
+def current_trace() -> Optional[Trace]:
+    """Trace of the current context, or None when tracing is off."""
+    return _current_trace.get()
+
+
+def start_span(name: str, kind: str, parent: Optional[Span] = None, **attributes):
+    """Open a span in the current trace (None outside a trace). Close it with end_span."""
+    trace = _current_trace.get()
+    if trace is None:
+        return None
+    parent = parent or _current_span.get() or trace.root
+    span = Span(
+        name=name,
+        kind=kind,
+        trace_id=trace.trace_id,
+        parent_id=parent.span_id,
+        attributes=attributes,
+    )
+    trace.add(span)
+    return span
+
+
+def end_span(span: Optional[Span], error: Optional[BaseException] = None, **attributes):
+    """Close a span opened with start_span, optionally marking it as failed."""
+    if span is None:
+        return
+    span.end_time = time.time()
+    span.set(**attributes)
+    if error is not None:
+        span.status = "error"
+        span.set(error=f"{type(error).__name__}: {error}")
+
+
+@contextmanager
+def trace_span(name: str, kind: str, **attributes):
+    """Time the enclosed block as a child of the current span.
+
+    Yields the span (or a no-op stand-in outside a trace) so the block can add attributes.
+    """
+    span = start_span(name, kind, **attributes)
+    if span is None:
+        yield NULL_SPAN
+        return
+
+    token = _current_span.set(span)
+    try:
+        yield span
+    except BaseException as e:
+        end_span(span, error=e)
+        raise
+    else:
+        end_span(span)
+    finally:
+        _current_span.reset(token)
+
+
+def record_event(name: str, kind: str, **attributes):
+    """Record an instantaneous span, e.g. a cache lookup, in the current trace."""
+    span = start_span(name, kind, **attributes)
+    if span is not None:
+        span.end_time = span.start_time
+
+
+def set_current_span(span: Optional[Span]):
+    """Make span the parent of spans opened in this context; returns a reset token."""
+    return _current_span.set(span)
+
+
+def reset_current_span(token):
+    """Undo set_current_span (ignored if called from a different context)."""
+    try:
+        _current_span.reset(token)
+    except ValueError:
+        pass
+
+
+def summarize_spans(spans: List[Span]) -> List[Dict[str, Any]]:
+    """Aggregate spans by (kind, name): count, total/mean/max seconds, tokens, cache hits.
+
+    Returns:
+        Rows sorted by total time, longest first
+    """
+    rows: Dict[tuple, Dict[str, Any]] = {}
+    for span in spans:
+        if span.kind == "graph":
+            continue
+        row = rows.setdefault(
+            (span.kind, span.name),
+            {
+                "kind": span.kind,
+                "name": span.name,
+                "count": 0,
+                "total_s": 0.0,
+                "max_s": 0.0,
+                "errors": 0,
+                "input_tokens": 0,
+                "output_tokens": 0,
+                "cache_hits": 0,
+            },
+        )
+        row["count"] += 1
+        row["total_s"] += span.duration
+        row["max_s"] = max(row["max_s"], span.duration)
+        row["errors"] += span.status == "error"
+        row["input_tokens"] += span.attributes.get("input_tokens") or 0
+        row["output_tokens"] += span.attributes.get("output_tokens") or 0
+        row["cache_hits"] += bool(span.attributes.get("cache_hit"))
+
+    for row in rows.values():
+        row["mean_s"] = row["total_s"] / row["count"]
+    return sorted(rows.values(), key=lambda row: row["total_s"], reverse=True)
+
+
+def format_span_summary(rows: List[Dict[str, Any]], total_s: Optional[float] = None) -> str:
+    """Plain-text table of summarize_spans rows."""
+    header = f"{'kind':<8} {'name':<36} {'count':>5} {'total s':>9} {'mean s':>8} {'max s':>8} {'in tok':>8} {'out tok':>8} {'hits':>5} {'err':>4}"
+    lines = [header, "-" * len(header)]
+    for row in rows:
+        lines.append(
+            f"{row['kind']:<8} {row['name'][:36]:<36} {row['count']:>5} "
+            f"{row['total_s']:>9.2f} {row['mean_s']:>8.2f} {row['max_s']:>8.2f} "
+            f"{row['input_tokens']:>8} {row['output_tokens']:>8} "
+            f"{row['cache_hits']:>5} {row['errors']:>4}"
+        )
+    if total_s is not None:
+        lines.append(f"Total wall time: {total_s:.2f}s (span times overlap when nodes or tools run concurrently)")
+    return "\n".join(lines)
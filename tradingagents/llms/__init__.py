@@ -0,0 +1,29 @@
+from .cache import DiskLLMCache, LLM_CACHE_NODES, with_llm_cache
+from .factory import LLM_PROVIDERS, create_llm
+
+# The fake provider is only needed for offline runs; load it on first access
+_LAZY_ATTRIBUTES = {
+    "FakeChatModel": ".fake",
+    "FakeEmbeddings": ".fake",
+    "create_fake_llm": ".fake",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        import importlib
+
+        return getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = [
+    "DiskLLMCache",
+    "LLM_CACHE_NODES",
+    "LLM_PROVIDERS",
+    "create_llm",
+    "with_llm_cache",
+    "FakeChatModel",
+    "FakeEmbeddings",
+    "create_fake_llm",
+]
@@ -0,0 +1,168 @@
+# TradingAgents/llms/cache.py
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional
+
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.load import dumps, loads
+
+from tradingagents.instrumentation.metrics import observe_cache
+from tradingagents.instrumentation.tracing import record_event
+
+# Node types whose LLM calls can be cached ("llm_cache_nodes" config)
+LLM_CACHE_NODES = (
+    "analysts",
+    "report_compressor",
+    "researchers",
+    "research_manager",
+    "trader",
+    "risk_debators",
+    "risk_manager",
+    "signal_processor",
+    "reflector",
+)
+
+# Message fields that differ between otherwise identical runs
+_VOLATILE_MESSAGE_FIELDS = ("id", "response_metadata", "usage_metadata")
+
+
+class DiskLLMCache:
+    """SQLite-persisted LLM response cache shared by the agent nodes.
+
+    Entries are keyed by a hash of LangChain's llm_string (provider, model, temperature
+    and bound tools) and the normalized prompt messages, so a re-run with identical inputs
+    returns the stored responses instead of calling the provider. Hits and misses are
+    counted per node type.
+    """
+
+    def __init__(self, path: str):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._stats: Dict[str, Dict[str, int]] = {}
+        with self._lock:
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS llm_cache (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )"""
+            )
+            self._conn.commit()
+
+    def for_node(self, node_type: str) -> "NodeLLMCache":
+        """LangChain cache that records its hits and misses under node_type."""
+        return NodeLLMCache(self, node_type)
+
+    def get(self, prompt: str, llm_string: str, node_type: str) -> Optional[RETURN_VAL_TYPE]:
+        key = _cache_key(prompt, llm_string)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            counts = self._stats.setdefault(node_type, {"hits": 0, "misses": 0})
+            counts["hits" if row else "misses"] += 1
+        record_event("llm_cache", "cache", node_type=node_type, cache_hit=row is not None)
+        observe_cache("llm", row is not None)
+        if row is None:
+            return None
+        return [loads(generation) for generation in json.loads(row[0])]
+
+    def put(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE):
+        value = json.dumps([dumps(generation) for generation in return_val])
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache VALUES (?, ?, ?)",
+                (_cache_key(prompt, llm_string), value, time.time()),
+            )
+            self._conn.commit()
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_cache")
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Hits, misses and hit rate per node type, plus a "total" entry."""
+        with self._lock:
+            counts = {node: dict(c) for node, c in self._stats.items()}
+        counts["total"] = {
+            "hits": sum(c["hits"] for c in counts.values()),
+            "misses": sum(c["misses"] for c in counts.values()),
+        }
+        for c in counts.values():
+            lookups = c["hits"] + c["misses"]
+            c["hit_rate"] = c["hits"] / lookups if lookups else 0.0
+        return counts
+
+    def reset_stats(self):
+        with self._lock:
+            self._stats.clear()
+
+
+class NodeLLMCache(BaseCache):
+    """LangChain BaseCache view of a DiskLLMCache for one node type."""
+
+    def __init__(self, store: DiskLLMCache, node_type: str):
+        self.store = store
+        self.node_type = node_type
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        return self.store.get(prompt, llm_string, self.node_type)
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        self.store.put(prompt, llm_string, return_val)
+
+    def clear(self, **kwargs: Any) -> None:
+        self.store.clear()
+
+
+def with_llm_cache(
+    llm, cache: Optional[DiskLLMCache], node_type: str, nodes: Optional[Iterable[str]] = None
+):
+    """Return a copy of llm that caches its responses, or llm itself if caching is off.
+
+    Args:
+        llm: LangChain chat model
+        cache: Shared DiskLLMCache, or None to disable caching
+        node_type: One of LLM_CACHE_NODES
+        nodes: Node types to cache (None caches all of them)
+    """
+    if cache is None or (nodes is not None and node_type not in nodes):
+        return llm
+    return llm.model_copy(update={"cache": cache.for_node(node_type)})
+
+
+def _cache_key(prompt: str, llm_string: str) -> str:
+    payload = f"{llm_string}\x00{_normalize_prompt(prompt)}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _normalize_prompt(prompt: str) -> str:
+    """Serialized messages with run-specific fields (ids, usage, metadata) removed."""
+    try:
+        messages = json.loads(prompt)
+    except (TypeError, ValueError):
+        return prompt
+    return json.dumps(_strip_volatile(messages), sort_keys=True)
+
+
+def _strip_volatile(value):
+    if isinstance(value, list):
+        return [_strip_volatile(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if "lc" in value and isinstance(value.get("kwargs"), dict):
+        kwargs = {
+            key: _strip_volatile(item)
+            for key, item in value["kwargs"].items()
+            if key not in _VOLATILE_MESSAGE_FIELDS
+        }
+        return {**value, "kwargs": kwargs}
+    return {key: _strip_volatile(item) for key, item in value.items()}
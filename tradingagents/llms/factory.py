@@ -0,0 +1,44 @@
+# TradingAgents/llms/factory.py
+
+import importlib
+from typing import Any, Dict
+
+# Provider name -> (module, class) of its chat model. Modules are imported on first use,
+# so a run only pays for the provider SDK it actually configures.
+LLM_PROVIDERS = {
+    "openai": ("langchain_openai", "ChatOpenAI"),
+    "ollama": ("langchain_openai", "ChatOpenAI"),
+    "openrouter": ("langchain_openai", "ChatOpenAI"),
+    "anthropic": ("langchain_anthropic", "ChatAnthropic"),
+    "google": ("langchain_google_genai", "ChatGoogleGenerativeAI"),
+    "fake": ("tradingagents.llms.fake", "FakeChatModel"),
+}
+
+# Providers that take the configured backend_url
+_BASE_URL_PROVIDERS = ("openai", "ollama", "openrouter", "anthropic")
+
+
+def create_llm(config: Dict[str, Any], model_name: str):
+    """Chat model of the configured llm_provider, importing its package only now.
+
+    Args:
+        config: Configuration with llm_provider (and backend_url / fake_llm_* keys)
+        model_name: Model to instantiate, e.g. config["quick_think_llm"]
+
+    Returns:
+        The LangChain chat model
+    """
+    provider = config["llm_provider"].lower()
+    if provider not in LLM_PROVIDERS:
+        raise ValueError(f"Unsupported LLM provider: {config['llm_provider']}")
+
+    if provider == "fake":
+        from .fake import create_fake_llm
+
+        return create_fake_llm(config, model_name)
+
+    module_name, class_name = LLM_PROVIDERS[provider]
+    model_class = getattr(importlib.import_module(module_name), class_name)
+    if provider in _BASE_URL_PROVIDERS:
+        return model_class(model=model_name, base_url=config["backend_url"])
+    return model_class(model=model_name)
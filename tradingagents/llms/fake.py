@@ -0,0 +1,215 @@
+# TradingAgents/llms/fake.py
+
+import asyncio
+import hashlib
+import itertools
+import random
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.utils.function_calling import convert_to_openai_tool
+from pydantic import PrivateAttr
+
+from tradingagents.agents.utils.context_budget import estimate_tokens
+
+DEFAULT_TEMPLATE = (
+    "Fake analysis of {ticker} as of {date}.\n\n"
+    "{filler}\n\n"
+    "FINAL TRANSACTION PROPOSAL: **{signal}**"
+)
+
+_FILLER_WORDS = (
+    "price momentum volume trend support resistance earnings guidance margin outlook "
+    "valuation risk catalyst sentiment liquidity volatility sector macro rates demand"
+).split()
+
+_DATE_PATTERN = re.compile(r"\b(\d{4}-\d{2}-\d{2})\b")
+_TICKER_PATTERN = re.compile(
+    r"(?:company we want to look at is|company of interest is|ticker(?: symbol)?(?: is|:))\s*\**\s*([A-Za-z0-9.\-^]{1,10})",
+    re.IGNORECASE,
+)
+
+
+class FakeChatModel(BaseChatModel):
+    """Offline chat model returning scripted or templated replies, tool calls included.
+
+    With tools bound, a turn that does not follow a tool result calls every bound tool
+    once (arguments are filled from the prompt's ticker and date); the next turn answers
+    with text. Replies are deterministic for a given prompt, carry usage_metadata token
+    counts and can be delayed to emulate provider latency.
+    """
+
+    model: str = "fake"
+    responses: Optional[List[str]] = None
+    template: str = DEFAULT_TEMPLATE
+    signal: str = "HOLD"
+    latency: float = 0.0
+    latency_jitter: float = 0.0
+    output_tokens: int = 200
+    tool_calls: bool = True
+    default_ticker: str = "SPY"
+
+    _counter: Any = PrivateAttr(default_factory=itertools.count)
+    _counter_lock: Any = PrivateAttr(default_factory=threading.Lock)
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-chat-model"
+
+    @property
+    def _identifying_params(self) -> Dict[str, Any]:
+        return {
+            "model": self.model,
+            "signal": self.signal,
+            "output_tokens": self.output_tokens,
+            "tool_calls": self.tool_calls,
+        }
+
+    def bind_tools(self, tools, **kwargs):
+        return self.bind(tools=[convert_to_openai_tool(tool) for tool in tools], **kwargs)
+
+    def _generate(self, messages, stop=None, run_manager=None, tools=None, **kwargs):
+        prompt = _prompt_text(messages)
+        delay = self._delay(prompt)
+        if delay:
+            time.sleep(delay)
+        return self._result(messages, prompt, tools)
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, tools=None, **kwargs):
+        prompt = _prompt_text(messages)
+        delay = self._delay(prompt)
+        if delay:
+            await asyncio.sleep(delay)
+        return self._result(messages, prompt, tools)
+
+    def _delay(self, prompt):
+        if not self.latency_jitter:
+            return self.latency
+        return max(0.0, self.latency + _rng(prompt).uniform(-1, 1) * self.latency_jitter)
+
+    def _result(self, messages: List[BaseMessage], prompt: str, tools) -> ChatResult:
+        ticker, date = self._subject(prompt)
+        calls = []
+        if tools and self.tool_calls and not isinstance(messages[-1], ToolMessage):
+            digest = _digest(prompt)[:8]
+            calls = [
+                {
+                    "name": tool["function"]["name"],
+                    "args": _tool_args(tool["function"].get("parameters", {}), ticker, date),
+                    "id": f"call_{digest}_{index}",
+                }
+                for index, tool in enumerate(tools)
+            ]
+            content = ""
+        else:
+            content = self._content(prompt, ticker, date)
+
+        output_tokens = estimate_tokens(content) + 10 * len(calls)
+        message = AIMessage(
+            content=content,
+            tool_calls=calls,
+            usage_metadata={
+                "input_tokens": estimate_tokens(prompt),
+                "output_tokens": output_tokens,
+                "total_tokens": estimate_tokens(prompt) + output_tokens,
+            },
+            response_metadata={"model_name": self.model},
+        )
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _content(self, prompt, ticker, date):
+        if self.responses:
+            with self._counter_lock:
+                index = next(self._counter)
+            return self.responses[index % len(self.responses)]
+        rng = _rng(prompt)
+        words = max(0, self.output_tokens * 4 // 7)  # about seven characters per filler word
+        filler = " ".join(rng.choice(_FILLER_WORDS) for _ in range(words))
+        return self.template.format(ticker=ticker, date=date, signal=self.signal, filler=filler)
+
+    def _subject(self, prompt):
+        ticker = _TICKER_PATTERN.search(prompt)
+        date = _DATE_PATTERN.search(prompt)
+        return (
+            ticker.group(1).rstrip(".") if ticker else self.default_ticker,
+            date.group(1) if date else time.strftime("%Y-%m-%d"),
+        )
+
+
+class FakeEmbeddings(Embeddings):
+    """Deterministic feature-hashing embeddings: texts sharing words land close together."""
+
+    def __init__(self, dim: int = 256):
+        self.dim = dim
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [self.embed_query(text) for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        vector = np.zeros(self.dim, dtype=np.float32)
+        for token in re.findall(r"\w+", text.lower()):
+            digest = hashlib.blake2b(token.encode(), digest_size=8).digest()
+            vector[int.from_bytes(digest[:4], "little") % self.dim] += 1.0 if digest[4] & 1 else -1.0
+        norm = np.linalg.norm(vector)
+        return (vector / norm if norm else vector).tolist()
+
+
+def create_fake_llm(config: Dict[str, Any], model_name: str) -> FakeChatModel:
+    """Fake model configured by the "fake_llm_*" keys of a config."""
+    return FakeChatModel(
+        model=model_name or "fake",
+        responses=config.get("fake_llm_responses"),
+        template=config.get("fake_llm_template") or DEFAULT_TEMPLATE,
+        signal=config.get("fake_llm_signal", "HOLD"),
+        latency=config.get("fake_llm_latency", 0.0),
+        latency_jitter=config.get("fake_llm_latency_jitter", 0.0),
+        output_tokens=config.get("fake_llm_output_tokens", 200),
+        tool_calls=config.get("fake_llm_tool_calls", True),
+    )
+
+
+def _prompt_text(messages):
+    return "\n".join(
+        message.content if isinstance(message.content, str) else str(message.content)
+        for message in messages
+    )
+
+
+def _digest(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _rng(text):
+    return random.Random(int(_digest(text)[:16], 16))
+
+
+def _tool_args(parameters, ticker, date):
+    """Plausible arguments for a tool's JSON schema, by parameter name and type."""
+    args = {}
+    for name, schema in parameters.get("properties", {}).items():
+        lowered = name.lower()
+        kind = schema.get("type")
+        if "date" in lowered:
+            args[name] = date
+        elif lowered in ("ticker", "symbol", "query", "company", "company_name"):
+            args[name] = ticker
+        elif lowered == "indicator":
+            args[name] = "rsi"
+        elif lowered == "freq":
+            args[name] = "quarterly"
+        elif kind == "integer":
+            args[name] = 7 if "day" in lowered else 5
+        elif kind == "number":
+            args[name] = 1.0
+        elif kind == "boolean":
+            args[name] = False
+        else:
+            args[name] = schema.get("default", "")
+    return args